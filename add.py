@@ -1,77 +1,131 @@
-import requests
+import argparse
 import time
 from datetime import datetime
 import db_manager  # Senin mevcut db_manager dosyanı import ediyoruz
+from src.backfill import KlineClient, TokenBucket, WEIGHT_LIMIT_PER_MINUTE, backfill, interval_ms
 
 # Ayarlar
 SYMBOL_LIST = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "SOLUSDT", "XRPUSDT"] # Top 5 Coin (Stable hariç)
 INTERVAL = "1h"  # 1 Saatlik veriler
-LIMIT = 1000     # Her istekte kaç mum verisi çekilecek (Binance max 1000 verir)
 TOTAL_DAYS = 30  # Geriye dönük kaç günlük veri istiyoruz?
+BASE_URL = "https://api.binance.com"
+WORKERS = 8              # Aynı anda kaç sayfa isteği açık olabilir
+WEIGHT_BUDGET = 0.8      # Dakikalık ağırlık limitinin en fazla ne kadarı kullanılsın
 
-def get_binance_data(symbol, interval, limit=1000, start_time=None):
-    """Binance API'den mum verilerini çeker"""
-    url = "https://api.binance.com/api/v3/klines"
-    params = {
-        "symbol": symbol,
-        "interval": interval,
-        "limit": limit
-    }
-    if start_time:
-        params["startTime"] = start_time
-    
-    try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"Hata ({symbol}): {e}")
-        return []
+def store_page(conn, symbol, klines):
+    """
+    Bir sayfa mumu tek transaction'da yazar; yeni eklenen satır sayısını döndürür.
+    Yazma hatası yutulmaz: yazılamayan sayfa veritabanında boşluk bırakıp devam etmeyi bozar.
+    """
+    # Binance formatı: [OpenTime, Open, High, Low, Close, Volume, ...]
+    inserted, skipped = db_manager.add_candles(klines, symbol=symbol, conn=conn)
+    return inserted
+
+def stored_ranges(conn, symbols):
+    """
+    Her coin için veritabanındaki ilk ve son mumun timestamp'i (kaldığı yerden devam için).
+    backfill kayıtlı aralığı iki yana boşluksuz genişlettiğinden bu iki uç arasında eksik kalmaz.
+    """
+    rows = conn.execute("SELECT symbol, MIN(timestamp), MAX(timestamp) FROM candles GROUP BY symbol").fetchall()
+    return {symbol: (first_ts, last_ts) for symbol, first_ts, last_ts in rows if symbol in symbols}
+
+def check_interval(conn, symbols, interval):
+    """
+    Kayıtlı mumlar başka bir aralıkla çekildiyse ValueError fırlatır (aynı tabloda karışmasınlar);
+    aksi halde coinlerin aralığını kaydeder. Aralığı kaydedilmemiş eski verilerde aralık
+    mumların medyan adımından çıkarılır.
+    """
+    recorded = dict(conn.execute("SELECT symbol, interval FROM candle_intervals").fetchall())
+    step = interval_ms(interval)
+    conflicts = []
+    for symbol in symbols:
+        if symbol in recorded:
+            if recorded[symbol] != interval:
+                conflicts.append(f"{symbol}: {recorded[symbol]}")
+            continue
+        ts = [row[0] for row in conn.execute(
+            "SELECT timestamp FROM candles WHERE symbol=? ORDER BY timestamp LIMIT 1000", (symbol,))]
+        if len(ts) > 1:
+            steps = sorted(b - a for a, b in zip(ts, ts[1:]))
+            if steps[len(steps) // 2] != step:
+                conflicts.append(f"{symbol}: {steps[len(steps) // 2] / 60_000:g}m")
+    if conflicts:
+        raise ValueError(f"Veritabanındaki mumlar farklı aralıkla çekilmiş ({', '.join(conflicts)}); "
+                         f"--interval {interval} ile devam edilemez. Başka bir --db kullanın.")
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO candle_intervals(symbol, interval) VALUES(?, ?)",
+                         [(symbol, interval) for symbol in symbols])
 
-def fetch_and_store():
+def fetch_and_store(symbols=SYMBOL_LIST, interval=INTERVAL, days=TOTAL_DAYS, base_url=BASE_URL,
+                    workers=WORKERS, weight_limit=WEIGHT_LIMIT_PER_MINUTE, resume=True):
+    """
+    Son `days` günün mumlarını tüm coinler için sayfa sayfa ve eşzamanlı çeker.
+    İstekler dakikalık ağırlık bütçesini paylaşır; sayfalar her coin için sırayla yazılır.
+    """
     # Veritabanı tablosunu oluştur (Eğer db_manager'da bu kontrol yoksa diye garanti olsun)
     if hasattr(db_manager, 'create_table'):
         db_manager.create_table()
         print("Tablo kontrolü yapıldı.")
 
-    for symbol in SYMBOL_LIST:
-        print(f"--- {symbol} verileri çekiliyor ---")
-        
-        # Şu andan geriye doğru hesaplama (basit mantıkla son 1000 mumu çekelim şimdilik)
-        # Daha profesyonel geçmiş veri için döngü kurulabilir ama başlangıç için bu yeterli.
-        data = get_binance_data(symbol, INTERVAL, LIMIT)
-        
-        if not data:
-            print(f"{symbol} için veri alınamadı.")
-            continue
+    end_ms = int(time.time() * 1000)
+    start_ms = end_ms - days * 86_400_000
+    bucket = TokenBucket.per_minute(int(weight_limit * WEIGHT_BUDGET))
+    client = KlineClient(base_url, bucket)
 
-        count = 0
-        for candle in data:
-            # Binance formatı: [OpenTime, Open, High, Low, Close, Volume, ...]
-            timestamp = int(candle[0])
-            open_price = float(candle[1])
-            high_price = float(candle[2])
-            low_price = float(candle[3])
-            close_price = float(candle[4])
-            volume = float(candle[5])
-            
-            # Tarihi okunabilir formata çevir (opsiyonel, log için)
-            readable_date = datetime.fromtimestamp(timestamp / 1000).strftime('%Y-%m-%d %H:%M:%S')
+    def report(symbol, page, written, done, total):
+        readable_date = datetime.fromtimestamp(page[0] / 1000).strftime('%Y-%m-%d %H:%M')
+        print(f"[{done}/{total}] {symbol} {readable_date}: {written} mum")
 
-            # db_manager içindeki ekleme fonksiyonunu çağırıyoruz
-            # Not: Senin db_manager.py dosandaki fonksiyon isminin 'add_candle' 
-            # veya benzeri bir şey olduğunu varsayıyorum. Lütfen kontrol et.
-            try:
-                # ÖRNEK FONKSİYON ÇAĞRISI - Kendi db_manager'ına göre burayı düzeltebilirsin
-                db_manager.add_candle(symbol, timestamp, open_price, high_price, low_price, close_price, volume)
-                count += 1
-            except Exception as e:
-                print(f"DB Hatası ({symbol}): {e}")
-        
-        print(f"{symbol} için {count} adet mum verisi eklendi.")
-        time.sleep(1) # API limitine takılmamak için kısa bekleme
+    # Sayfalar tek bağlantı üzerinden (WAL) yazılır; her istek için bağlantı açılmaz
+    conn = db_manager.configure_connection(db_manager.create_connection())
+    try:
+        check_interval(conn, symbols, interval)
+        resume_from = stored_ranges(conn, symbols) if resume else None
+        print(f"--- {len(symbols)} coin, {days} gün ({interval}) çekiliyor | {base_url} | {workers} işçi ---")
+        result = backfill(client, symbols, interval, start_ms, end_ms,
+                          lambda symbol, klines: store_page(conn, symbol, klines), workers=workers,
+                          resume_from=resume_from, callback=report)
+    finally:
+        conn.close()
+    print(f"{result['stored']}/{result['pages']} sayfa, {result['candles']} mum | {result['seconds']:.1f} sn | "
+          f"Tekrar deneme: {result['retries']} | Başarısız sayfa: {len(result['failed'])}")
+    if result['failed']:
+        print(f"⚠️  {len(result['failed'])} sayfa alınamadı, arkasındaki {result['skipped']} sayfa yazılmadı. "
+              f"Tekrar çalıştırınca eksik sayfalardan devam edilir.")
+    return result
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Binance geçmiş mum verisini eşzamanlı sayfalarla çeker")
+    parser.add_argument("--symbols", nargs="+", default=SYMBOL_LIST, help="Coin listesi")
+    parser.add_argument("--interval", default=INTERVAL, help="Mum aralığı (1m, 15m, 1h, 1d...)")
+    parser.add_argument("--days", type=int, default=TOTAL_DAYS, help="Geriye dönük gün sayısı")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="Eşzamanlı istek sayısı")
+    parser.add_argument("--weight-limit", type=int, default=WEIGHT_LIMIT_PER_MINUTE,
+                        help="Borsanın dakikalık istek ağırlığı limiti")
+    parser.add_argument("--base-url", default=BASE_URL, help="API adresi (yerel taklit sunucu için)")
+    parser.add_argument("--db", default=db_manager.DB_NAME, help="Mum veritabanı")
+    parser.add_argument("--no-resume", action="store_true",
+                        help="Kayıtlı aralığı atlama; tüm aralığı yeniden çek")
+    parser.add_argument("--stand-in", action="store_true",
+                        help="Gerçek borsa yerine yerel sentetik klines sunucusunu kullan")
+    parser.add_argument("--stand-in-latency", type=float, default=0.05, help="Taklit sunucunun gecikmesi (sn)")
+    args = parser.parse_args()
+    db_manager.DB_NAME = args.db
+
     print("Veri çekme işlemi başlıyor...")
-    fetch_and_store()
-    print("İşlem tamamlandı.")
\ No newline at end of file
+    options = dict(symbols=args.symbols, interval=args.interval, days=args.days, workers=args.workers,
+                   weight_limit=args.weight_limit, resume=not args.no_resume)
+    try:
+        if args.stand_in:
+            from src.kline_stand_in import KlineStandIn
+            with KlineStandIn(weight_limit=args.weight_limit, latency=args.stand_in_latency) as stand_in:
+                result = fetch_and_store(base_url=stand_in.base_url, **options)
+        else:
+            result = fetch_and_store(base_url=args.base_url, **options)
+    except ValueError as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
+    if result['failed']:
+        print("❌ İşlem eksik tamamlandı.")
+        raise SystemExit(1)
+    print("İşlem tamamlandı.")
@@ -1,94 +1,102 @@
 import numpy as np
-import matplotlib.pyplot as plt
+import argparse
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
+from src.benchmark_functions import FUNCTIONS, michalewicz
+from src.optim import RULES, GWORule, Optimizer, make_optimizer
+from src.plotting import pyplot, show
 
 # --- MICHALEWICZ FONKSİYONU (Benchmark Testi) ---
 # Global minimum değeri (d=10 için) yaklaşık -9.66 olmalıdır.
 
 def michalewicz_function(position, m=10):
-    d = len(position)
-    sum_val = 0
-    for i in range(d):
-        xi = position[i]
-        new_val = np.sin(xi) * (np.sin((i + 1) * (xi ** 2) / np.pi)) ** (2 * m)
-        sum_val += new_val
-    return -sum_val
+    """Tek kurt için Michalewicz değeri (toplu sürüm: src.benchmark_functions.michalewicz)."""
+    return float(michalewicz(position, m)[0])
 
-def GWO_Benchmark(search_agents_no, max_iter, dim):
+def GWO_Benchmark(search_agents_no, max_iter, dim, seed=None):
     # Michalewicz için arama uzayı genelde [0, PI] arasındadır
-    lb = 0
-    ub = np.pi
-    
-    # Kurtları Başlat
-    Alpha_pos = np.zeros(dim)
-    Alpha_score = float("inf") # Minimizasyon problemi olduğu için +sonsuz
-    
-    Beta_pos = np.zeros(dim)
-    Beta_score = float("inf")
-    
-    Delta_pos = np.zeros(dim)
-    Delta_score = float("inf")
-    
-    Positions = np.zeros((search_agents_no, dim))
-    # Rastgele dağıt
-    Positions = np.random.uniform(0, 1, (search_agents_no, dim)) * (ub - lb) + lb
-        
-    Convergence_curve = np.zeros(max_iter)
+    # Minimizasyon problemi: En KÜÇÜK değer en iyisidir (Alpha, Beta, Delta)
+    optimizer = Optimizer(dim, search_agents_no, lb=0, ub=np.pi, rule=GWORule(leaders=3), maximize=False,
+                          max_iter=max_iter, seed=seed)
     
     print(f"🧪 BENCHMARK TESTİ BAŞLIYOR: Michalewicz Fonksiyonu (D={dim})")
     print("-" * 50)
     
-    # İterasyonlar
-    for l in range(0, max_iter):
-        for i in range(0, search_agents_no):
-            # Sınır Kontrolü
-            Positions[i, :] = np.clip(Positions[i, :], lb, ub)
-            
-            # Fitness Hesapla (Minimize ediyoruz)
-            fitness = michalewicz_function(Positions[i, :])
-            
-            # Alpha, Beta, Delta Güncelle (En KÜÇÜK değer en iyisidir)
-            if fitness < Alpha_score:
-                Alpha_score = fitness
-                Alpha_pos = Positions[i, :].copy()
-            elif fitness < Beta_score:
-                Beta_score = fitness
-                Beta_pos = Positions[i, :].copy()
-            elif fitness < Delta_score:
-                Delta_score = fitness
-                Delta_pos = Positions[i, :].copy()
-        
-        # a parametresi azalır
-        a = 2 - l * ((2) / max_iter)
-        
-        # Konum Güncelleme
-        for i in range(0, search_agents_no):
-            for j in range(0, dim):
-                r1, r2 = np.random.random(), np.random.random()
-                A1 = 2 * a * r1 - a
-                C1 = 2 * r2
-                D_alpha = abs(C1 * Alpha_pos[j] - Positions[i, j])
-                X1 = Alpha_pos[j] - A1 * D_alpha
-                
-                r1, r2 = np.random.random(), np.random.random()
-                A2 = 2 * a * r1 - a
-                C2 = 2 * r2
-                D_beta = abs(C2 * Beta_pos[j] - Positions[i, j])
-                X2 = Beta_pos[j] - A2 * D_beta
-                
-                r1, r2 = np.random.random(), np.random.random()
-                A3 = 2 * a * r1 - a
-                C3 = 2 * r2
-                D_delta = abs(C3 * Delta_pos[j] - Positions[i, j])
-                X3 = Delta_pos[j] - A3 * D_delta
-                
-                Positions[i, j] = (X1 + X2 + X3) / 3
-        
-        Convergence_curve[l] = Alpha_score
+    # Tüm popülasyon tek çağrıda değerlendirilir
+    Alpha_pos, Alpha_score, Convergence_curve = optimizer.optimize(michalewicz)
         
     return Alpha_score, Convergence_curve
 
+# --- KARŞILAŞTIRMA SÜİTİ ---
+# Kayıtlı her optimizer (src.optim.RULES) x fonksiyon x boyut x tohum hücresi
+# ayrı bir görevdir; görevler süreç havuzunda paralel çalışır.
+
+def run_cell(optimizer_name, function_name, dim, seed, pop_size, iterations, tolerance):
+    """Tek hücre: en iyi skor, hedefe (optimum + tolerans) ulaşana kadarki değerlendirme ve süre."""
+    test = FUNCTIONS[function_name]
+    optimizer = make_optimizer(optimizer_name, dim, pop_size, iterations, lb=test.lb, ub=test.ub,
+                               maximize=False, seed=seed)
+    start = time.perf_counter()
+    best_pos, best_score, curve = optimizer.optimize(test.func)
+    wall_time = time.perf_counter() - start
+
+    optimum = test.optimum(dim)
+    evals_to_target = None
+    if optimum is not None:
+        hits = np.flatnonzero(curve <= optimum + tolerance)
+        if len(hits):
+            evals_to_target = int((hits[0] + 1) * pop_size)
+    return {"optimizer": optimizer_name, "function": function_name, "dim": dim, "seed": seed,
+            "best": float(best_score), "optimum": optimum, "evals_to_target": evals_to_target,
+            "wall_time": wall_time}
+
+def run_suite(optimizers, functions, dims, seeds, pop_size, iterations, tolerance, workers):
+    cells = [(o, f, d, s) for o in optimizers for f in functions for d in dims for s in seeds]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_cell, o, f, d, s, pop_size, iterations, tolerance) for o, f, d, s in cells]
+        return [future.result() for future in futures]
+
+def print_table(results, n_seeds):
+    """Tohumlar üzerinden özet: ortalama/en iyi skor, hedefe ulaşma, medyan değerlendirme, ortalama süre."""
+    print(f"{'Fonksiyon':<12} {'D':>3} {'Optimizer':<9} {'Optimum':>10} {'Ort. Skor':>12} {'En İyi':>12} "
+          f"{'Hedef':>7} {'Değ. (medyan)':>14} {'Süre (sn)':>10}")
+    print("-" * 99)
+    groups = {}
+    for r in results:
+        groups.setdefault((r["function"], r["dim"], r["optimizer"]), []).append(r)
+    for (function_name, dim, optimizer_name), runs in groups.items():
+        bests = np.array([r["best"] for r in runs])
+        hits = [r["evals_to_target"] for r in runs if r["evals_to_target"] is not None]
+        optimum = runs[0]["optimum"]
+        print(f"{function_name:<12} {dim:>3} {optimizer_name:<9} "
+              f"{(f'{optimum:.4f}' if optimum is not None else '-'):>10} {bests.mean():>12.4f} {bests.min():>12.4f} "
+              f"{f'{len(hits)}/{n_seeds}':>7} {(f'{int(np.median(hits))}' if hits else '-'):>14} "
+              f"{np.mean([r['wall_time'] for r in runs]):>10.3f}")
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Optimizer benchmark testleri")
+    parser.add_argument("--suite", action="store_true",
+                        help="Tüm optimizer x fonksiyon x boyut x tohum karşılaştırmasını çalıştır")
+    parser.add_argument("--optimizers", nargs="+", default=list(RULES), choices=list(RULES))
+    parser.add_argument("--functions", nargs="+", default=list(FUNCTIONS), choices=list(FUNCTIONS))
+    parser.add_argument("--dims", type=int, nargs="+", default=[10, 30])
+    parser.add_argument("--seeds", type=int, default=5, help="Hücre başına tohum sayısı")
+    parser.add_argument("--pop", type=int, default=30, help="Popülasyon")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--tolerance", type=float, default=1e-2, help="Hedef: optimum + tolerans")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--no-plot", action="store_true", help="Yakınsama grafiğini çizme")
+    args = parser.parse_args()
+
+    if args.suite:
+        start = time.perf_counter()
+        results = run_suite(args.optimizers, args.functions, args.dims, list(range(args.seeds)), args.pop,
+                            args.iterations, args.tolerance, args.workers)
+        print_table(results, args.seeds)
+        print(f"\n{len(results)} çalıştırma, toplam {time.perf_counter() - start:.1f} sn ({args.workers} süreç)")
+        raise SystemExit(0)
+
     # Parametreler
     dim = 10         # M=10
     pop_size = 60    # Popülasyon
@@ -102,10 +110,12 @@ if __name__ == "__main__":
     print("-" * 50)
     
     # Grafik Çiz
-    plt.figure(figsize=(10, 6))
-    plt.plot(curve, color='green', linewidth=2)
-    plt.title(f'Michalewicz Fonksiyonu Yakınsama (D={dim})')
-    plt.xlabel('İterasyon')
-    plt.ylabel('Fitness Değeri (Hata)')
-    plt.grid(True)
-    plt.show()
\ No newline at end of file
+    if not args.no_plot:
+        plt = pyplot()
+        plt.figure(figsize=(10, 6))
+        plt.plot(curve, color='green', linewidth=2)
+        plt.title(f'Michalewicz Fonksiyonu Yakınsama (D={dim})')
+        plt.xlabel('İterasyon')
+        plt.ylabel('Fitness Değeri (Hata)')
+        plt.grid(True)
+        show(plt, "michalewicz_convergence.png")
\ No newline at end of file
@@ -1,7 +1,13 @@
 import sqlite3
+from itertools import islice
 
 # Veritabanı dosyasının adı
 DB_NAME = "crypto_data.db"
+BATCH_SIZE = 50_000  # Toplu eklemede bir transaction'a giren satır sayısı
+# WAL: okuyucular yazarı beklemez; synchronous=NORMAL: her commit'te fsync yok (WAL'da güvenli);
+# cache_size negatifse KiB cinsindendir (64 MB)
+PRAGMAS = ("PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL", "PRAGMA cache_size=-65536",
+           "PRAGMA temp_store=MEMORY")
 
 def create_connection():
     """Veritabanına bağlanır veya yoksa oluşturur."""
@@ -13,6 +19,12 @@ def create_connection():
         print(f"Bağlantı hatası: {e}")
     return conn
 
+def configure_connection(conn):
+    """Toplu yazma için bağlantıya WAL ve önbellek ayarlarını uygular."""
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
 def create_table():
     """Tabloyu oluşturur (Eğer yoksa)"""
     conn = create_connection()
@@ -34,6 +46,13 @@ def create_table():
                 );
             """
             cursor.execute(sql_create_candles_table)
+            # candles tablosunda aralık sütunu yok; her coinin hangi aralıkla çekildiği burada tutulur
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS candle_intervals (
+                    symbol TEXT PRIMARY KEY,
+                    interval TEXT NOT NULL
+                );
+            """)
             conn.commit()
             print("Tablo başarıyla oluşturuldu/kontrol edildi.")
         except sqlite3.Error as e:
@@ -58,6 +77,50 @@ def add_candle(symbol, timestamp, open_p, high_p, low_p, close_p, volume_p):
         finally:
             conn.close()
 
+def add_candles(candles, symbol=None, conn=None, batch_size=BATCH_SIZE):
+    """
+    Çok sayıda mumu tek bağlantı ve büyük transaction'larla (executemany) ekler.
+
+    Args:
+        candles: symbol verilmezse (symbol, timestamp, open, high, low, close, volume) satırları;
+            verilirse (timestamp, open, high, low, close, volume, ...) satırları. Binance kline
+            listeleri (metin fiyatlar) ve (n, 6) numpy dizileri de kabul edilir.
+        conn: Verilirse bu bağlantı kullanılır (açık bırakılır); verilmezse bir bağlantı açılıp kapatılır.
+
+    Returns:
+        tuple: (eklenen, atlanan) satır sayısı; atlananlar zaten kayıtlı (symbol, timestamp) çiftleridir.
+    """
+    if hasattr(candles, "tolist"):  # numpy dizisi
+        candles = candles.tolist()
+    if symbol is None:
+        rows = ((s, int(ts), float(o), float(h), float(l), float(c), float(v))
+                for s, ts, o, h, l, c, v in candles)
+    else:
+        rows = ((symbol, int(c[0]), float(c[1]), float(c[2]), float(c[3]), float(c[4]), float(c[5]))
+                for c in candles)
+
+    own_conn = conn is None
+    if own_conn:
+        conn = configure_connection(create_connection())
+    inserted = skipped = 0
+    sql = ''' INSERT OR IGNORE INTO candles(symbol, timestamp, open, high, low, close, volume)
+              VALUES(?,?,?,?,?,?,?) '''
+    try:
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            before = conn.total_changes
+            with conn:  # Her parti tek transaction (hata olursa geri alınır)
+                conn.executemany(sql, batch)
+            added = conn.total_changes - before
+            inserted += added
+            skipped += len(batch) - added
+    finally:
+        if own_conn:
+            conn.close()
+    return inserted, skipped
+
 # Bu dosya doğrudan çalıştırılırsa tabloyu oluştursun
 if __name__ == "__main__":
     create_table()
\ No newline at end of file
@@ -1,8 +1,12 @@
 import numpy as np
-import sqlite3
 import os
-import matplotlib.pyplot as plt
 import time
+import argparse
+import json
+from src.optim import Checkpoint, GWORule, Optimizer, StoppingCriteria
+from src.plotting import pyplot, show
+from src.trade_paths import CandleStore, replay_paths_batch
+from src.trade_replay import TradeLoader, load_trades, replay_batch
 
 # ---  PARAMETRELER (M=10) ---
 # 0. Buy Threshold (0.5 - 0.9)
@@ -21,184 +25,120 @@ UB = [0.9, 0.5, 5.0, 15.0, 3.0, 5.0, 120, 3.0, 40, 80]
 DIM = 10 
 SEARCH_AGENTS_NO = 60
 MAX_ITER = 1000
+CHECKPOINT_EVERY = 50  # Kaç iterasyonda bir durum kaydedilir
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(BASE_DIR, "data", "crypto_logs.db")
+CHECKPOINT_PATH = os.path.join(BASE_DIR, "data", "checkpoints", "gwo_optimization.npz")
+RESULTS_PATH = "gwo_results.json"
+# İşlemlerin giriş sonrası fiyat yolları main.py ile aynı yerel mum deposundan okunur
+CANDLE_DB_PATH = os.path.join(BASE_DIR, "crypto_data.db")
+CANDLE_CACHE_DIR = os.path.join(BASE_DIR, "data", "cache", "candles")
 
 def get_data_from_db():
     """Veritabanındaki işlemleri çeker."""
-    if not os.path.exists(DB_PATH):
-        print("❌ Veritabanı bulunamadı! Önce main.py çalıştır.")
-        return []
-    
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    try:
-        cursor.execute("SELECT sentiment, entry_price, pnl_percent, news_text FROM trades")
-        data = cursor.fetchall()
-    except sqlite3.OperationalError:
-       
-        try:
-            cursor.execute("SELECT sentiment, entry_price, pnl, news_text FROM trades")
-            data = cursor.fetchall()
-        except:
-            print("❌ Kritik Hata: Veritabanı sütun isimleri uyuşmuyor.")
-            data = []
+    return load_trades(DB_PATH)
 
-    conn.close()
-    return data
-
-# Veriyi yükle
-TRADE_DATA = get_data_from_db()
-print(f"✅ {len(TRADE_DATA)} adet geçmiş işlem verisi yüklendi.")
+# Veri ilk fitness çağrısında yüklenir (içe aktarma veritabanını okumaz)
+TRADES = TradeLoader(DB_PATH, candle_source=CandleStore(CANDLE_DB_PATH, CANDLE_CACHE_DIR))
+PATH_EXITS = True  # False: sadece tek PnL'in TP/SL ile kırpılması (eski davranış)
 
 def fitness_function(position):
     """
     AMAÇ FONKSİYONU:
-    Parametre setini test eder ve Toplam Kârı döndürür.
+    Parametre setini test eder ve Toplam Kârı döndürür (tek kurtluk fitness_function_batch).
     """
-    if not TRADE_DATA:
-        return -1000
-    
-    stop_loss_pct = position[2]
-    take_profit_pct = position[3]
-    risk_per_trade = position[5]
-    
-    total_profit = 0
-    initial_capital = 10000 
-    current_capital = initial_capital
-    
-    for trade in TRADE_DATA:
-        sentiment, entry, market_pnl, text = trade
-        
-        # PnL verisini sayıya çevir
-        try:
-            if isinstance(market_pnl, str):
-                market_pnl_val = float(market_pnl.replace('%', ''))
-            else:
-                market_pnl_val = float(market_pnl)
-        except:
-            continue
-
-        actual_trade_pnl = 0
+    return float(fitness_function_batch(position)[0])
 
-        if sentiment == "POSITIVE":
-            # Long Senaryosu
-            if market_pnl_val > take_profit_pct:
-                actual_trade_pnl = take_profit_pct 
-            elif market_pnl_val < -stop_loss_pct:
-                actual_trade_pnl = -stop_loss_pct 
-            else:
-                actual_trade_pnl = market_pnl_val 
-                
-        elif sentiment == "NEGATIVE":
-            
-            # Short Senaryosu
-            # Short işlemde, piyasa düşerse (market_pnl negatifse) biz kazanırız.
-            # Ancak veritabanındaki pnl, "Long açsaydık ne olurdu"yu gösteriyor.
-            # O yüzden Short açınca, market_pnl'in tersini (-) kazanırız.
-            
-            # Örneğin: Piyasa %-5 düştü. Short açan %5 kazanır.
-            short_pnl = -1 * market_pnl_val
-            
-            if short_pnl > take_profit_pct:
-                actual_trade_pnl = take_profit_pct
-            elif short_pnl < -stop_loss_pct:
-                actual_trade_pnl = -stop_loss_pct
-            else:
-                actual_trade_pnl = short_pnl
-        
-        else:
-            continue 
-
-        # Kasa Hesaplama
-        trade_amount = current_capital * (risk_per_trade / 100)
-        profit_amount = trade_amount * (actual_trade_pnl / 100)
-        current_capital += profit_amount
+def fitness_function_batch(positions):
+    """
+    TOPLU AMAÇ FONKSİYONU:
+    (kurt sayısı, dim) boyutlu pozisyon matrisini alır, her kurdun Toplam Kârını döndürür.
+    İşlemler yüklemede bir kez tipli dizilere (yön, PnL, geçerlilik) ayrıştırılır; bileşik kasa
+    hesabı tüm kurtlar için aynı anda yapılır. Mum yolu olan işlemlerde Trailing Stop, Max Holding
+    Time, Hacim ve RSI genleri de simüle edilir (src.trade_paths); diğerlerinde tek PnL TP/SL ile
+    kırpılır (src.trade_replay).
+    """
+    positions = np.atleast_2d(np.asarray(positions, dtype=np.float64))
+    paths = TRADES.paths if PATH_EXITS else None
+    if paths is None or paths.covered == 0:
+        return replay_batch(TRADES.table, positions[:, 2], positions[:, 3], positions[:, 5])
+    return replay_paths_batch(TRADES.table, paths, positions[:, 2], positions[:, 3], positions[:, 5],
+                              trailing_pct=positions[:, 4], max_hold=positions[:, 6], volume_filter=positions[:, 7],
+                              rsi_lower=positions[:, 8], rsi_upper=positions[:, 9])
 
-    return current_capital - initial_capital
+def GWO(search_agents_no, max_iter, lb, ub, dim, fitness=fitness_function, batch_fitness=fitness_function_batch,
+        seed=None, checkpoint=None, resume=False, stopping=None):
+    """
+    Alpha, Beta ve Delta liderli klasik GWO (src/optim motoru üzerinde).
+    checkpoint verilirse durum periyodik olarak kaydedilir; resume=True ise
+    kayıtlı durumdan kaldığı iterasyondan devam edilir. stopping verilirse
+    bütçe bitmeden durulabilir.
 
-def GWO(search_agents_no, max_iter, lb, ub, dim):
+    Returns:
+        tuple: (Alpha_pos, Alpha_score, Convergence_curve, durma özeti)
+    """
     print(f"🐺 GWO Başlatılıyor... | Kurt: {search_agents_no} | İter: {max_iter}")
     
-    Alpha_pos = np.zeros(dim)
-    Alpha_score = float("-inf")
-    
-    Beta_pos = np.zeros(dim)
-    Beta_score = float("-inf")
+    optimizer = Optimizer(dim, search_agents_no, lb=lb, ub=ub, rule=GWORule(leaders=3), maximize=True,
+                          max_iter=max_iter, seed=seed, stopping=stopping)
+    if resume and checkpoint is not None:
+        if checkpoint.load(optimizer):
+            print(f"♻️  Checkpoint yüklendi: {checkpoint.path} (İterasyon {optimizer.iteration}/{max_iter})")
+        else:
+            print(f"⚠️  Checkpoint bulunamadı ({checkpoint.path}), baştan başlanıyor.")
     
-    Delta_pos = np.zeros(dim)
-    Delta_score = float("-inf")
+    # Fitness (toplu fonksiyon varsa tüm kurtlar tek çağrıda)
+    if batch_fitness is None:
+        batch_fitness = lambda positions: [fitness(position) for position in positions]
     
-    Positions = np.zeros((search_agents_no, dim))
-    for i in range(dim):
-        Positions[:, i] = np.random.uniform(0, 1, search_agents_no) * (ub[i] - lb[i]) + lb[i]
-        
-    Convergence_curve = np.zeros(max_iter)
+    def report(opt):
+        l = opt.iteration - 1
+        if l % 100 == 0:
+            print(f"📍 İterasyon {l}: En İyi Kâr = ${opt.best_score:.2f}")
     
     print("⏳ Optimizasyon başladı (RAM üzerinden çalıştığı için hızlıdır)...")
     start_time = time.time()
     
-    for l in range(0, max_iter):
-        for i in range(0, search_agents_no):
-            # Sınır Kontrolü
-            for j in range(dim):
-                Positions[i, j] = np.clip(Positions[i, j], lb[j], ub[j])
-            
-            # Fitness
-            fitness = fitness_function(Positions[i, :])
-            
-            # Liderleri Güncelle
-            if fitness > Alpha_score:
-                Alpha_score = fitness
-                Alpha_pos = Positions[i, :].copy()
-            elif fitness > Beta_score:
-                Beta_score = fitness
-                Beta_pos = Positions[i, :].copy()
-            elif fitness > Delta_score:
-                Delta_score = fitness
-                Delta_pos = Positions[i, :].copy()
-        
-        a = 2 - l * ((2) / max_iter)
-        
-        # Konum Güncelleme
-        for i in range(0, search_agents_no):
-            for j in range(0, dim):
-                r1, r2 = np.random.random(), np.random.random()
-                A1 = 2 * a * r1 - a
-                C1 = 2 * r2
-                D_alpha = abs(C1 * Alpha_pos[j] - Positions[i, j])
-                X1 = Alpha_pos[j] - A1 * D_alpha
-                
-                r1, r2 = np.random.random(), np.random.random()
-                A2 = 2 * a * r1 - a
-                C2 = 2 * r2
-                D_beta = abs(C2 * Beta_pos[j] - Positions[i, j])
-                X2 = Beta_pos[j] - A2 * D_beta
-                
-                r1, r2 = np.random.random(), np.random.random()
-                A3 = 2 * a * r1 - a
-                C3 = 2 * r2
-                D_delta = abs(C3 * Delta_pos[j] - Positions[i, j])
-                X3 = Delta_pos[j] - A3 * D_delta
-                
-                Positions[i, j] = (X1 + X2 + X3) / 3
-        
-        Convergence_curve[l] = Alpha_score
-        
-        if l % 100 == 0:
-            print(f"📍 İterasyon {l}: En İyi Kâr = ${Alpha_score:.2f}")
+    Alpha_pos, Alpha_score, Convergence_curve = optimizer.optimize(batch_fitness, callback=report,
+                                                                   checkpoint=checkpoint)
 
     end_time = time.time()
+    summary = optimizer.summary()
     print(f"\n✅ Bitti! Süre: {end_time - start_time:.2f} sn")
-    return Alpha_pos, Alpha_score, Convergence_curve
+    print(f"🛑 Durma nedeni: {summary['stop_reason']} | İterasyon: {summary['iterations']} | "
+          f"Tasarruf edilen değerlendirme: {summary['evaluations_saved']}")
+    return Alpha_pos, Alpha_score, Convergence_curve, summary
 
 if __name__ == "__main__":
-    if len(TRADE_DATA) == 0:
+    parser = argparse.ArgumentParser(description="İşlem geçmişi üzerinde 10 parametreli GWO")
+    parser.add_argument("--seed", type=int, default=None, help="Tekrarlanabilir sonuçlar için tohum")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_PATH, help="Checkpoint dosyası")
+    parser.add_argument("--checkpoint-every", type=int, default=CHECKPOINT_EVERY,
+                        help="Kaç iterasyonda bir checkpoint yazılacağı (0 = kapalı)")
+    parser.add_argument("--resume", action="store_true", help="Checkpoint'ten kaldığı yerden devam et")
+    parser.add_argument("--stagnation", type=int, default=None,
+                        help="En iyi kâr bu kadar iterasyon iyileşmezse dur")
+    parser.add_argument("--min-delta", type=float, default=0.0, help="Stagnasyonda anlamlı sayılan en küçük iyileşme")
+    parser.add_argument("--min-diversity", type=float, default=None,
+                        help="Kurtların yayılımı (normalize std) bu değerin altına düşerse dur")
+    parser.add_argument("--time-budget", type=float, default=None, help="Saniye cinsinden süre bütçesi")
+    parser.add_argument("--max-evals", type=int, default=None, help="Fitness değerlendirme bütçesi")
+    parser.add_argument("--no-plot", action="store_true", help="Yakınsama grafiğini çizme")
+    parser.add_argument("--simple-exits", action="store_true",
+                        help="Mum yollarını kullanma; sadece tek PnL'i TP/SL ile kırp")
+    args = parser.parse_args()
+    PATH_EXITS = not args.simple_exits
+
+    if len(TRADES) == 0:
         print("❌ Veri yok! Önce main.py çalıştır.")
     else:
-        best_pos, best_score, curve = GWO(SEARCH_AGENTS_NO, MAX_ITER, LB, UB, DIM)
+        checkpoint = Checkpoint(args.checkpoint, args.checkpoint_every)
+        stopping = StoppingCriteria(stagnation=args.stagnation, min_delta=args.min_delta,
+                                    min_diversity=args.min_diversity, time_budget=args.time_budget,
+                                    max_evaluations=args.max_evals)
+        best_pos, best_score, curve, summary = GWO(SEARCH_AGENTS_NO, MAX_ITER, LB, UB, DIM, seed=args.seed,
+                                                   checkpoint=checkpoint, resume=args.resume, stopping=stopping)
         
         print("-" * 50)
         print(f"🏆 EN İYİ ÇÖZÜM (ALPHA KURDU)")
@@ -210,11 +150,19 @@ if __name__ == "__main__":
         
         for i in range(DIM):
             print(f"{i+1}. {param_names[i]}: {best_pos[i]:.4f}")
+        
+        # Sonuçları ve durma özetini yakınsama eğrisiyle birlikte kaydet
+        with open(RESULTS_PATH, "w") as f:
+            json.dump({"best_score": best_score, "best_params": best_pos.tolist(),
+                       "convergence_curve": [float(x) for x in curve], "stopping": summary}, f, indent=2)
+        print(f"💾 Sonuçlar '{RESULTS_PATH}' dosyasına kaydedildi.")
             
-        plt.figure(figsize=(10, 6))
-        plt.plot(curve, color='blue', linewidth=2)
-        plt.title('GWO Optimizasyon Eğrisi')
-        plt.xlabel('İterasyon')
-        plt.ylabel('Kasa Büyüklüğü ($)')
-        plt.grid(True)
-        plt.show()
\ No newline at end of file
+        if not args.no_plot:
+            plt = pyplot()
+            plt.figure(figsize=(10, 6))
+            plt.plot(curve, color='blue', linewidth=2)
+            plt.title('GWO Optimizasyon Eğrisi')
+            plt.xlabel('İterasyon')
+            plt.ylabel('Kasa Büyüklüğü ($)')
+            plt.grid(True)
+            show(plt, "gwo_convergence.png")
\ No newline at end of file
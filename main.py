@@ -1,20 +1,62 @@
 import numpy as np
-import pandas as pd
 import random
+import argparse
+import copy
 import db_manager
-import matplotlib.pyplot as plt
 import json
+import os
+from functools import partial
+from src.backtest import decode_coin_params, quantize_coin_params, simulate_group
+from src.candle_cache import CANDLE_COLUMNS, CandleCache
+from src.indicators import IndicatorBank
+from src.memo import LRUCache
+from src.optim import RULES, Checkpoint, SteadyStateGWO, StoppingCriteria, combine_curves, make_optimizer
+from src.parallel import ParallelEvaluator, evaluate_position, run_block_searches, run_islands, system_pool
+from src.plotting import pyplot, show
+from src.surrogate import CoinSurrogate, optimize_screened, summarize_log
+from src.walkforward import make_folds, run_walk_forward
 
 # --- AYARLAR ---
 COINS = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "SOLUSDT", "XRPUSDT"]
 DIMENSIONS = 50   # 5 Coin x 10 Parametre
 WOLVES_COUNT = 5  # Popülasyon sayısı (Hız için düşük tuttuk, artırılabilir)
 ITERATIONS = 10   # Döngü sayısı
+INDICATOR_CACHE_DIR = os.path.join("data", "cache", "indicators")  # Hesaplanan indikatörler burada saklanır
+CANDLE_CACHE_DIR = os.path.join("data", "cache", "candles")        # Mumların sütunlu (.npy) kopyası
+MEMO_SIZE = 200_000  # Coin skor önbelleği (LRU) kapasitesi
+CHECKPOINT_PATH = os.path.join("data", "checkpoints", "main_joint.npz")  # joint modun ara durumu
+
+# data_store[symbol] -> (mum sayısı, 6) float64, sütunlar CANDLE_COLUMNS sırasıyla
+CLOSE = CANDLE_COLUMNS.index('close')
 
 class TradingSystem:
-    def __init__(self):
+    def __init__(self, indicator_cache_dir=None, precompute_indicators=False, data_store=None,
+                 candle_cache_dir=None, memo_size=MEMO_SIZE, memo_decimals=None):
+        """
+        Args:
+            data_store (dict): Önceden yüklenmiş mum dizileri (symbol -> dizi).
+                Verilirse veritabanı okunmaz (paralel işçiler bu yolu kullanır).
+            candle_cache_dir (str): Verilirse mumlar sütunlu .npy önbelleğinden
+                bellek eşlemeli okunur; önbellek 'candles' tablosuna göre güncellenir.
+            memo_size (int): Coin skor önbelleğinin (LRU) en fazla kayıt sayısı; 0 ise kapalı.
+            memo_decimals (int): Verilirse Stop Loss / Take Profit / Kasa oranları bu
+                basamağa yuvarlanır (daha çok isabet, biraz daha kaba arama uzayı).
+        """
         self.data_store = {}
-        self.load_all_data()
+        self.banks = {}  # symbol -> IndicatorBank
+        self.candle_cache = CandleCache(candle_cache_dir) if candle_cache_dir else None
+        self.indicator_cache_dir = indicator_cache_dir
+        self.precompute_indicators = precompute_indicators
+        # (symbol, CoinParams) -> Net Kâr; fitness coin skorlarının toplamı olduğu için
+        # sadece bir coin'in genleri değiştiğinde diğer coinler önbellekten gelir
+        self.score_cache = LRUCache(memo_size) if memo_size else None
+        self.memo_decimals = memo_decimals
+        # symbol -> (başlangıç, bitiş) mum indeksleri; None ise tüm geçmiş kullanılır
+        self.windows = None
+        if data_store is None:
+            self.load_all_data()
+        else:
+            self.data_store = dict(data_store)
 
     def load_all_data(self):
         """Veritabanından tüm coin verilerini çeker"""
@@ -23,125 +65,82 @@ class TradingSystem:
         cursor = conn.cursor()
         
         for symbol in COINS:
+            if self.candle_cache is not None:
+                candles = self.candle_cache.load(conn, symbol)
+                self.data_store[symbol] = candles
+                if len(candles) == 0:
+                    print(f"UYARI: {symbol} için veri bulunamadı!")
+                else:
+                    print(f"{symbol}: {len(candles)} mum yüklendi (önbellek).")
+                continue
+
             # Timestamp, Open, High, Low, Close, Volume
             cursor.execute("SELECT timestamp, open, high, low, close, volume FROM candles WHERE symbol=? ORDER BY timestamp ASC", (symbol,))
             rows = cursor.fetchall()
             
             if not rows:
                 print(f"UYARI: {symbol} için veri bulunamadı!")
-                self.data_store[symbol] = pd.DataFrame()
+                self.data_store[symbol] = np.empty((0, len(CANDLE_COLUMNS)))
                 continue
             
-            # Pandas DataFrame'e çeviriyoruz (Hesaplamalar kolay olsun diye)
-            df = pd.DataFrame(rows, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            self.data_store[symbol] = df
-            print(f"{symbol}: {len(df)} mum yüklendi.")
+            # Bitişik float64 diziye çeviriyoruz (Simülasyon ve paylaşımlı bellek için)
+            candles = np.array(rows, dtype=np.float64)
+            self.data_store[symbol] = candles
+            print(f"{symbol}: {len(candles)} mum yüklendi.")
         
         conn.close()
 
-    def calculate_indicators(self, df, rsi_period, macd_fast, macd_slow, macd_signal, sma_period):
-        """Dinamik olarak indikatörleri hesaplar"""
-        # RSI Hesaplama
-        delta = df['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=rsi_period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=rsi_period).mean()
-        rs = gain / loss
-        df['rsi'] = 100 - (100 / (1 + rs))
-
-        # MACD Hesaplama
-        ema_fast = df['close'].ewm(span=macd_fast, adjust=False).mean()
-        ema_slow = df['close'].ewm(span=macd_slow, adjust=False).mean()
-        df['macd'] = ema_fast - ema_slow
-        df['macd_signal'] = df['macd'].ewm(span=macd_signal, adjust=False).mean()
-
-        # SMA (Trend Filtresi)
-        df['sma_trend'] = df['close'].rolling(window=sma_period).mean()
-        
-        return df
+    def get_bank(self, symbol):
+        """Coin'in indikatör bankasını döner (ilk istendiğinde oluşturulur, diskte varsa yüklenir)."""
+        bank = self.banks.get(symbol)
+        if bank is None:
+            candles = self.data_store.get(symbol)
+            if candles is None or len(candles) == 0:
+                return None
+            bank = IndicatorBank(candles[:, CLOSE])
+            if self.indicator_cache_dir:
+                bank.load(self._bank_path(symbol))
+            if self.precompute_indicators:
+                bank.build()
+            self.banks[symbol] = bank
+        return bank
+
+    def _bank_path(self, symbol):
+        return os.path.join(self.indicator_cache_dir, f"{symbol}.npz")
+
+    def save_indicator_banks(self):
+        """Hesaplanmış indikatörleri bir sonraki çalıştırma için diske yazar."""
+        if not self.indicator_cache_dir:
+            return
+        for symbol, bank in self.banks.items():
+            bank.save(self._bank_path(symbol))
+
+    def decode_params(self, params):
+        """10 geni strateji ayarlarına çevirir (önbellek yuvarlaması açıksa sürekli ayarlar yuvarlanır)."""
+        p = decode_coin_params(params)
+        if self.memo_decimals is not None:
+            p = quantize_coin_params(p, self.memo_decimals)
+        return p
+
+    def memo_key(self, symbol, p):
+        window = self.windows.get(symbol) if self.windows is not None else None
+        return (symbol, window, p)
+
+    def with_windows(self, windows):
+        """
+        Sadece verilen mum aralıklarında işlem yapan bir kopya döner (walk-forward için).
+        Mum verisi, indikatör bankaları ve skor önbelleği paylaşılır; indikatörler
+        tüm geçmişten bir kez hesaplanır, pencere başına yeniden hesaplanmaz.
+        """
+        clone = copy.copy(self)
+        clone.windows = windows
+        return clone
 
     def backtest_coin(self, symbol, params):
         """
         Tek bir coin için 10 parametre ile gelişmiş test yapar.
         """
-        original_df = self.data_store.get(symbol)
-        if original_df is None or original_df.empty:
-            return 0 
-
-        # DataFrame'in kopyasını al (Orijinal veriyi bozmamak için)
-        df = original_df.copy()
-
-        # --- 1. PARAMETRELERİ ÇÖZÜMLEME (0-1 arasından gerçeğe dönüştürme) ---
-        rsi_period  = int(params[0] * 16) + 4       # 4 - 20 arası
-        rsi_buy     = int(params[1] * 30) + 20      # 20 - 50 arası (RSI < bu ise AL)
-        rsi_sell    = int(params[2] * 30) + 60      # 60 - 90 arası (RSI > bu ise SAT)
-        
-        macd_fast   = int(params[3] * 10) + 8       # 8 - 18 arası
-        macd_slow   = int(params[4] * 15) + 19      # 19 - 34 arası
-        macd_sig    = int(params[5] * 8) + 5        # 5 - 13 arası
-        
-        stop_loss_pct = params[6] * 0.15 + 0.01     # %1 - %16 Stop Loss
-        take_profit_pct = params[7] * 0.30 + 0.02   # %2 - %32 Take Profit
-        
-        sma_trend   = int(params[8] * 150) + 20     # 20 - 170 mumluk Trend Filtresi
-        wallet_pct  = params[9] * 0.9 + 0.1         # Kasadan %10 - %100 arası kullanım
-        
-        # --- 2. İNDİKATÖRLERİ HESAPLA ---
-        df = self.calculate_indicators(df, rsi_period, macd_fast, macd_slow, macd_sig, sma_trend)
-        
-        # --- 3. AL-SAT SİMÜLASYONU ---
-        balance = 1000 # Başlangıç Dolar
-        position_size = 0 # Elimdeki Coin Adedi
-        in_position = False
-        entry_price = 0
-
-        # İndikatörler oluşana kadar baştaki verileri atla
-        start_index = max(sma_trend, macd_slow) + 5
-        
-        # Pandas iterrows yavaştır ama anlaşılırdır, tez için yeterli.
-        # Hızlandırmak için numpy array kullanılabilir ama şimdilik logic önemli.
-        for i in range(start_index, len(df)):
-            current_price = df['close'].iloc[i]
-            current_rsi = df['rsi'].iloc[i]
-            current_macd = df['macd'].iloc[i]
-            current_signal = df['macd_signal'].iloc[i]
-            trend_filter = df['sma_trend'].iloc[i]
-            
-            # --- ALIM KOŞULLARI ---
-            # 1. Pozisyonda değilsek
-            # 2. RSI AL seviyesinin altındaysa (Aşırı satım)
-            # 3. MACD sinyali yukarı kestiyse
-            # 4. Fiyat Trendin (SMA) üstündeyse (Yükseliş trendindeyiz demek)
-            if not in_position:
-                if (current_rsi < rsi_buy) and (current_macd > current_signal) and (current_price > trend_filter):
-                    # Alım Yap
-                    trade_amount = balance * wallet_pct
-                    position_size = trade_amount / current_price
-                    balance -= trade_amount
-                    entry_price = current_price
-                    in_position = True
-            
-            # --- SATIŞ KOŞULLARI ---
-            elif in_position:
-                # 1. Stop Loss Oldu mu?
-                if current_price <= entry_price * (1 - stop_loss_pct):
-                    balance += position_size * current_price
-                    in_position = False
-                
-                # 2. Take Profit Oldu mu?
-                elif current_price >= entry_price * (1 + take_profit_pct):
-                    balance += position_size * current_price
-                    in_position = False
-                    
-                # 3. İndikatör Sat Verdi mi? (RSI Tepe yaptıysa)
-                elif current_rsi > rsi_sell:
-                    balance += position_size * current_price
-                    in_position = False
-
-        # Son durumda elimde coin kaldıysa nakite dön
-        if in_position:
-            balance += position_size * df['close'].iloc[-1]
-            
-        return balance - 1000  # Net Kâr
+        return float(self.score_coin_batch(symbol, [params])[0])  # Net Kâr
     
     def evaluate_fitness(self, total_params):
         """
@@ -161,89 +160,364 @@ class TradingSystem:
             
         return total_score
 
-# --- GREY WOLF OPTIMIZER (Basitleştirilmiş) ---
-class GWO:
-    def __init__(self, obj_func, dim, pop_size, max_iter):
-        self.obj_func = obj_func
-        self.dim = dim
-        self.pop_size = pop_size
-        self.max_iter = max_iter
-        
-        # Kurtları (Çözümleri) Rastgele Başlat [0, 1] arasında
-        self.positions = np.random.uniform(0, 1, (pop_size, dim))
-        self.alpha_pos = np.zeros(dim)
-        self.alpha_score = -float("inf") 
-        
-        # Grafik için skor geçmişini tutacak liste
-        self.convergence_curve = [] 
+    def score_coin_batch(self, symbol, coin_positions):
+        """
+        Tek bir coin için (kurt sayısı, 10) boyutlu gen matrisini değerlendirir ve Net Kâr vektörü döner.
 
-    def optimize(self):
-        print(f"\nOptimizasyon Başlıyor: {self.dim} Boyut, {self.pop_size} Kurt...")
-        
-        for it in range(self.max_iter):
-            # Her kurdun skorunu hesapla
-            for i in range(self.pop_size):
-                # Sınır kontrolü (Parametreler 0-1 dışına çıkmasın)
-                self.positions[i] = np.clip(self.positions[i], 0, 1)
-                
-                fitness = self.obj_func(self.positions[i])
-                
-                # Alpha (En iyi) güncellemesi
-                if fitness > self.alpha_score:
-                    self.alpha_score = fitness
-                    self.alpha_pos = self.positions[i].copy()
-            
-            # Bu turdaki en iyi skoru kaydet
-            self.convergence_curve.append(self.alpha_score)
-            print(f"Iterasyon {it+1}: En İyi Skor: ${self.alpha_score:.2f}")
+        Önce önbelleğe bakılır (anahtar: coin + çözümlenmiş ayarlar). Kalan kurtlar
+        aynı indikatör ayarlarına (RSI periyodu, MACD üçlüsü, SMA) göre gruplanır;
+        her grup indikatörleri bankadan bir kez alır ve birlikte simüle edilir.
+        """
+        scores = np.zeros(len(coin_positions))
+        bank = self.get_bank(symbol)
+        if bank is None:
+            return scores
 
-            # GWO Matematiksel Güncelleme
-            a = 2 - it * (2 / self.max_iter) 
-            
-            for i in range(self.pop_size):
-                r1 = np.random.random()
-                r2 = np.random.random()
-                A1 = 2 * a * r1 - a
-                C1 = 2 * r2
-                
-                D_alpha = abs(C1 * self.alpha_pos - self.positions[i])
-                X1 = self.alpha_pos - A1 * D_alpha
-                
-                # Pozisyonu güncelle (Basit GWO mantığı)
-                self.positions[i] = X1 
-                
-        return self.alpha_pos, self.alpha_score, self.convergence_curve
+        # --- 1. PARAMETRELERİ ÇÖZÜMLEME (0-1 arasından gerçeğe dönüştürme) ---
+        # Aynı ayarlara düşen kurtlar tek simülasyonu paylaşır
+        window = self.windows.get(symbol) if self.windows is not None else None
+        pending = {}
+        for i, row in enumerate(coin_positions):
+            p = self.decode_params(row)
+            cached = self.score_cache.get(self.memo_key(symbol, p)) if self.score_cache is not None else None
+            if cached is None:
+                pending.setdefault(p, []).append(i)
+            else:
+                scores[i] = cached
+
+        groups = {}
+        for p in pending:
+            key = (p.rsi_period, p.macd_fast, p.macd_slow, p.macd_sig, p.sma_trend)
+            groups.setdefault(key, []).append(p)
+
+        for (rsi_period, macd_fast, macd_slow, macd_sig, sma_trend), params_list in groups.items():
+            # --- 2. İNDİKATÖRLER (Bankadan hazır diziler, kopya yok) ---
+            macd, macd_signal = bank.macd(macd_fast, macd_slow, macd_sig)
+            # --- 3. AL-SAT SİMÜLASYONU (src/backtest.py) ---
+            results = simulate_group(bank.close, bank.rsi(rsi_period), macd, macd_signal,
+                                     bank.sma(sma_trend), params_list, window)
+            for p, score in zip(params_list, results):
+                scores[pending[p]] = score
+                if self.score_cache is not None:
+                    self.score_cache.put(self.memo_key(symbol, p), score)
+
+        return scores
+
+    def separable_blocks(self):
+        """
+        Amaç fonksiyonunun ayrıştırılabilir yapısını bildirir: toplam skor, her coin'in
+        sadece kendi 10 genlik diliminden hesaplanan skorlarının toplamıdır.
+
+        Returns:
+            list: (symbol, gen dilimi) çiftleri, coin sırasıyla.
+        """
+        return [(symbol, slice(i * 10, (i + 1) * 10)) for i, symbol in enumerate(COINS)]
+
+    def coin_scores_batch(self, positions):
+        """
+        (pop_size, 50) boyutlu pozisyon matrisini alır, (pop_size, coin sayısı)
+        boyutlu Net Kâr matrisini döner.
+        """
+        positions = np.asarray(positions, dtype=np.float64)
+        scores = np.zeros((len(positions), len(COINS)))
+        for c, symbol in enumerate(COINS):
+            scores[:, c] = self.score_coin_batch(symbol, positions[:, c * 10:(c + 1) * 10])
+        return scores
+
+    def evaluate_fitness_batch(self, positions):
+        """
+        Tüm popülasyonu tek seferde değerlendirir: (pop_size, 50) -> (pop_size,) skor vektörü.
+        Sonuçlar evaluate_fitness ile aynıdır (coin skorları aynı sırayla toplanır).
+        """
+        scores = self.coin_scores_batch(positions)
+        total_scores = np.zeros(len(scores))
+        for c in range(len(COINS)):
+            total_scores += scores[:, c]
+        return total_scores
+
+# --- OPTİMİZASYON (src/optim: ortak ask/tell motoru, varsayılan tek liderli GWO) ---
+def print_progress(optimizer):
+    print(f"Iterasyon {optimizer.iteration}: En İyi Skor: ${optimizer.best_score:.2f}")
+
+def merge_summaries(summaries):
+    """Birden çok aramanın (coin, ada) durma özetlerini birleştirir; nedenler isim bazında tutulur."""
+    merged = {"stop_reason": {}, "iterations": 0, "evaluations": 0, "evaluation_budget": 0, "evaluations_saved": 0}
+    for name, summary in summaries.items():
+        merged["stop_reason"][name] = summary["stop_reason"]
+        merged["iterations"] = max(merged["iterations"], summary["iterations"])
+        for key in ("evaluations", "evaluation_budget", "evaluations_saved"):
+            merged[key] += summary[key]
+    return merged
+
+def optimize_separable(system, pop_size, max_iter, workers, seed=None, system_kwargs=None, optimizer_name="gwo",
+                       stopping=None):
+    """
+    50 boyutlu aramayı coin başına 5 bağımsız 10 boyutlu GWO aramasına böler.
+
+    Her coin kendi popülasyonu ve iterasyon bütçesiyle ayrı süreçte optimize edilir;
+    sonuçlar report.py'nin beklediği 50 elemanlı best_params düzenine geri birleştirilir.
+    Toplam skor ve yakınsama eğrisi coin skorlarının (coin sırasıyla) toplamıdır;
+    erken duran coin aramalarının eğrisi son değeriyle uzatılır.
+    """
+    blocks = system.separable_blocks()
+    if seed is None:
+        seeds = [int(s) for s in np.random.randint(0, 2**31 - 1, size=len(blocks))]
+    else:
+        seeds = [seed + i for i in range(len(blocks))]
+
+    factory = partial(make_optimizer, optimizer_name, stopping=stopping)
+    results = run_block_searches(system, factory, blocks, pop_size, max_iter, seeds, workers, system_kwargs)
+
+    best_params = np.zeros(DIMENSIONS)
+    best_score = 0
+    curve = np.zeros(max_iter)
+    summaries = {}
+    for (symbol, genes), (block_pos, block_score, block_curve, block_summary) in zip(blocks, results):
+        best_params[genes] = block_pos
+        best_score += block_score
+        block_curve = np.asarray(block_curve)
+        curve += np.pad(block_curve, (0, max_iter - len(block_curve)), mode="edge")
+        summaries[symbol] = block_summary
+        print(f"{symbol}: En İyi Kâr ${block_score:.2f} ({block_summary['stop_reason']}, "
+              f"{block_summary['iterations']} iterasyon)")
+    return best_params, best_score, curve.tolist(), merge_summaries(summaries)
+
+def optimize_async(system, pop_size, max_iter, workers, leaders, seed=None, system_kwargs=None, stopping=None):
+    """
+    Nesil bariyeri olmadan (steady-state) GWO: biten her backtest liderleri hemen
+    günceller ve o kurdun yeni konumu boşalan işçiye gönderilir. Backtest süreleri
+    SMA/MACD pencerelerine ve işlem sayısına göre çok değiştiği için işçiler boş beklemez.
+    """
+    # Tek liderde (--optimizer gwo) r1/r2 kurt başına tek sayı, RULES["gwo"] ile aynı
+    optimizer = SteadyStateGWO(DIMENSIONS, pop_size, leaders=leaders, max_iter=max_iter, seed=seed,
+                               stopping=stopping, scalar_coefficients=leaders == 1)
+    with system_pool(system, workers, system_kwargs) as pool:
+        best_params, best_score, curve = optimizer.optimize_async(pool, evaluate_position, callback=print_progress)
+    return best_params, best_score, curve, optimizer.summary()
+
+def optimize_islands(system, n_islands, pop_size, max_iter, migration_every, migrants, seed=None,
+                     system_kwargs=None, optimizer_name="gwo", stopping=None):
+    """
+    Ada modeli: n_islands bağımsız sürü ayrı süreçlerde kendi tohumlarıyla çalışır ve
+    her migration_every iterasyonda en iyi kurtlarını halkadaki komşuya gönderir.
+    Küresel eğri her iterasyonda adaların en iyisidir.
+    """
+    if seed is None:
+        seeds = [int(s) for s in np.random.randint(0, 2**31 - 1, size=n_islands)]
+    else:
+        seeds = [seed + k for k in range(n_islands)]
+
+    factory = partial(make_optimizer, optimizer_name, stopping=stopping)
+    islands = run_islands(system, factory, DIMENSIONS, pop_size, max_iter, seeds, migration_every, migrants,
+                          system_kwargs)
+
+    best = max(islands, key=lambda island: island["best_score"])
+    curve = combine_curves([island["convergence_curve"] for island in islands])
+    for island in islands:
+        print(f"Ada {island['island']}: En İyi Kâr ${island['best_score']:.2f} "
+              f"({island['stopping']['stop_reason']}, {island['stopping']['iterations']} iterasyon)")
+    summary = merge_summaries({f"island_{island['island']}": island["stopping"] for island in islands})
+    return np.array(best["best_params"]), best["best_score"], curve.tolist(), summary, islands
+
+def report_walk_forward(result):
+    print("\n--- WALK-FORWARD SONUÇLARI ---")
+    for fold in result["folds"]:
+        print(f"Katlama {fold['fold']}: Eğitim {fold['train_from']} -> Test {fold['test_from']} - {fold['test_to']} | "
+              f"Eğitim Kârı: ${fold['train_score']:.2f} | Test Kârı: ${fold['test_score']:.2f}")
+    agg = result["aggregate"]
+    print(f"Toplam Test Kârı: ${agg['total_test_score']:.2f} | Ortalama Test Kârı: ${agg['mean_test_score']:.2f} "
+          f"| Kârlı katlama: {agg['positive_test_folds']}/{agg['folds']}")
 
 # --- ÇALIŞTIRMA ---
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="50 boyutlu GWO ile strateji optimizasyonu")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Fitness hesabı için süreç sayısı (1 = seri mod)")
+    parser.add_argument("--memo-size", type=int, default=MEMO_SIZE,
+                        help="Coin skor önbelleği kapasitesi (0 = kapalı)")
+    parser.add_argument("--memo-decimals", type=int, default=None,
+                        help="Önbellek anahtarında SL/TP/Kasa oranlarının yuvarlanacağı basamak")
+    parser.add_argument("--mode", choices=["joint", "separable", "walkforward", "async", "islands"], default="joint",
+                        help="joint: tek 50 boyutlu arama | separable: coin başına bağımsız 10 boyutlu aramalar "
+                             "| walkforward: kayan eğitim/test pencereleriyle örneklem dışı doğrulama "
+                             "| async: nesil beklemeden, her biten değerlendirmeyle ilerleyen GWO "
+                             "| islands: ayrı süreçlerde göç eden bağımsız sürüler")
+    parser.add_argument("--folds", type=int, default=4, help="walkforward modunda katlama sayısı")
+    parser.add_argument("--train-ratio", type=float, default=3.0,
+                        help="walkforward modunda eğitim penceresinin test penceresine oranı")
+    parser.add_argument("--coin-wolves", type=int, default=WOLVES_COUNT,
+                        help="separable modda her coin aramasının kurt sayısı")
+    parser.add_argument("--surrogate", action="store_true",
+                        help="joint modda adayları önce k-NN vekil modelle ele, sadece en iyileri backtest et")
+    parser.add_argument("--oversample", type=int, default=4, help="Vekil modda kurt başına üretilen aday sayısı")
+    parser.add_argument("--eval-fraction", type=float, default=0.4,
+                        help="Vekil modda her iterasyon gerçek backtest'e giden kurt oranı")
+    parser.add_argument("--knn", type=int, default=5, help="Vekil k-NN modelinin komşu sayısı")
+    parser.add_argument("--islands", type=int, default=4, help="islands modunda ada (sürü) sayısı")
+    parser.add_argument("--migration-every", type=int, default=2,
+                        help="islands modunda kaç iterasyonda bir göç yapılacağı")
+    parser.add_argument("--migrants", type=int, default=1, help="islands modunda her göçte gönderilen kurt sayısı")
+    parser.add_argument("--optimizer", choices=list(RULES), default="gwo",
+                        help="gwo: sadece Alpha | gwo3: Alpha/Beta/Delta | ga: Genetik Algoritma")
+    parser.add_argument("--seed", type=int, default=None, help="Tekrarlanabilir sonuçlar için tohum")
+    parser.add_argument("--stagnation", type=int, default=None,
+                        help="En iyi skor bu kadar iterasyon iyileşmezse dur")
+    parser.add_argument("--min-delta", type=float, default=0.0, help="Stagnasyonda anlamlı sayılan en küçük iyileşme")
+    parser.add_argument("--min-diversity", type=float, default=None,
+                        help="Popülasyon yayılımı (normalize std) bu değerin altına düşerse dur")
+    parser.add_argument("--time-budget", type=float, default=None, help="Saniye cinsinden süre bütçesi")
+    parser.add_argument("--max-evals", type=int, default=None, help="Fitness değerlendirme bütçesi")
+    parser.add_argument("--checkpoint-every", type=int, default=1,
+                        help="joint modda kaç iterasyonda bir checkpoint yazılacağı (0 = kapalı)")
+    parser.add_argument("--resume", action="store_true",
+                        help="joint modda checkpoint'ten kaldığı yerden devam et")
+    parser.add_argument("--no-plot", action="store_true", help="Yakınsama grafiğini çizme")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        np.random.seed(args.seed)
+    stopping = StoppingCriteria(stagnation=args.stagnation, min_delta=args.min_delta,
+                                min_diversity=args.min_diversity, time_budget=args.time_budget,
+                                max_evaluations=args.max_evals)
+
     # 1. Sistemi Kur
-    system = TradingSystem()
+    system = TradingSystem(indicator_cache_dir=INDICATOR_CACHE_DIR, candle_cache_dir=CANDLE_CACHE_DIR,
+                           memo_size=args.memo_size, memo_decimals=args.memo_decimals)
     
+    if args.mode == "walkforward":
+        # Katlamalar bağımsız; her biri ayrı süreçte optimize edilir ve örneklem dışında puanlanır
+        folds = make_folds(system.data_store, args.folds, args.train_ratio)
+        if not folds:
+            print("❌ Veri yok! Önce add.py çalıştır.")
+            raise SystemExit(1)
+        processes = args.workers if args.workers > 1 else max(1, min(len(folds), os.cpu_count() or 1))
+        seeds = [args.seed + k for k in range(len(folds))] if args.seed is not None \
+            else [int(s) for s in np.random.randint(0, 2**31 - 1, size=len(folds))]
+        print(f"Walk-forward modu: {len(folds)} katlama, {processes} süreç")
+        factory = partial(make_optimizer, args.optimizer, stopping=stopping)
+        result = run_walk_forward(system, factory, folds, DIMENSIONS, WOLVES_COUNT, ITERATIONS, seeds, processes,
+                                  system_kwargs={"indicator_cache_dir": INDICATOR_CACHE_DIR})
+        report_walk_forward(result)
+        with open("walk_forward_results.json", "w") as f:
+            json.dump(result, f, indent=2)
+        print("Katlama sonuçları 'walk_forward_results.json' dosyasına kaydedildi.")
+        raise SystemExit(0)
+
     # 2. Optimizasyonu Başlat
     # Daha iyi sonuç görmek istersen iterasyonu 20 veya 30 yapabilirsin
-    optimizer = GWO(system.evaluate_fitness, dim=DIMENSIONS, pop_size=WOLVES_COUNT, max_iter=ITERATIONS)
+    evaluator = None
+    if args.mode == "separable":
+        # Coin aramaları birbirinden bağımsız; varsayılan olarak her biri ayrı çekirdekte
+        processes = args.workers if args.workers > 1 else min(len(COINS), os.cpu_count() or 1)
+        print(f"Ayrıştırılmış mod: {len(COINS)} x 10 boyut, coin başına {args.coin_wolves} kurt, {processes} süreç")
+        optimizer = None
+    elif args.mode == "async":
+        # Her işçi tek kurdun tüm backtest'ini yapar; biten işçiye hemen yeni kurt verilir
+        if args.optimizer == "ga":
+            parser.error("async modu sadece GWO kurallarını (gwo, gwo3) destekler")
+        processes = args.workers if args.workers > 1 else os.cpu_count() or 1
+        print(f"Asenkron mod: {WOLVES_COUNT} kurt, {processes} süreç")
+        optimizer = None
+    elif args.mode == "islands":
+        print(f"Ada modu: {args.islands} ada x {WOLVES_COUNT} kurt, {args.migration_every} iterasyonda bir göç")
+        optimizer = None
+    elif args.workers > 1:
+        # Mum verisi bir kez paylaşılır, (kurt, coin) görevleri süreç havuzuna dağıtılır
+        evaluator = ParallelEvaluator(system, args.workers, COINS,
+                                      system_kwargs={"indicator_cache_dir": INDICATOR_CACHE_DIR})
+        batch_obj_func = evaluator.evaluate_fitness_batch
+        print(f"Paralel mod: {args.workers} süreç")
+    else:
+        batch_obj_func = system.evaluate_fitness_batch
+    
+    if args.mode == "joint":
+        optimizer = make_optimizer(args.optimizer, DIMENSIONS, WOLVES_COUNT, ITERATIONS, seed=args.seed,
+                                   stopping=stopping, oversample=args.oversample if args.surrogate else 1)
+        checkpoint = Checkpoint(CHECKPOINT_PATH, args.checkpoint_every)
+        if args.resume:
+            if checkpoint.load(optimizer):
+                print(f"Checkpoint yüklendi: {CHECKPOINT_PATH} (Iterasyon {optimizer.iteration}/{ITERATIONS})")
+            else:
+                print(f"UYARI: Checkpoint bulunamadı ({CHECKPOINT_PATH}), baştan başlanıyor.")
     
-    # optimize() artık 3 değer döndürüyor: pozisyon, skor ve grafik verisi
-    best_params, best_score, curve = optimizer.optimize()
+    # optimize() 3 değer döndürüyor: pozisyon, skor ve grafik verisi
+    islands = None
+    surrogate_log = None
+    try:
+        if args.mode == "islands":
+            best_params, best_score, curve, stop_summary, islands = optimize_islands(
+                system, args.islands, WOLVES_COUNT, ITERATIONS, args.migration_every, args.migrants, seed=args.seed,
+                system_kwargs={"indicator_cache_dir": INDICATOR_CACHE_DIR}, optimizer_name=args.optimizer,
+                stopping=stopping)
+        elif args.mode == "async":
+            best_params, best_score, curve, stop_summary = optimize_async(
+                system, WOLVES_COUNT, ITERATIONS, processes, leaders=3 if args.optimizer == "gwo3" else 1,
+                seed=args.seed, system_kwargs={"indicator_cache_dir": INDICATOR_CACHE_DIR}, stopping=stopping)
+        elif optimizer is None:
+            best_params, best_score, curve, stop_summary = optimize_separable(
+                system, args.coin_wolves, ITERATIONS, processes, seed=args.seed,
+                system_kwargs={"indicator_cache_dir": INDICATOR_CACHE_DIR}, optimizer_name=args.optimizer,
+                stopping=stopping)
+        elif args.surrogate:
+            print(f"\nVekil modelli optimizasyon: {WOLVES_COUNT} Kurt x {args.oversample} aday, "
+                  f"iterasyon başına %{args.eval_fraction * 100:.0f} gerçek backtest...")
+            surrogate = CoinSurrogate(system.decode_params, len(COINS), k=args.knn)
+            coin_scores_batch = evaluator.coin_scores_batch if evaluator is not None else system.coin_scores_batch
+            best_params, best_score, curve, log = optimize_screened(optimizer, coin_scores_batch, surrogate,
+                                                                    args.eval_fraction, callback=print_progress)
+            stop_summary = optimizer.summary()
+            surrogate_log = summarize_log(log)
+            mae = surrogate_log["mean_abs_error"]
+            print(f"Vekil: {surrogate_log['real_evaluations']} gerçek / {surrogate_log['skipped_evaluations']} "
+                  f"atlanan değerlendirme, ortalama hata: " + (f"${mae:.2f}" if mae is not None else "-"))
+        else:
+            print(f"\nOptimizasyon Başlıyor: {DIMENSIONS} Boyut, {WOLVES_COUNT} Kurt ({args.optimizer})...")
+            best_params, best_score, curve = optimizer.optimize(batch_obj_func, callback=print_progress,
+                                                                checkpoint=checkpoint)
+            stop_summary = optimizer.summary()
+    finally:
+        if evaluator is not None:
+            evaluator.close()
+    system.save_indicator_banks()
     
     print("\n--- SONUÇLAR ---")
     print(f"En İyi Toplam Kâr: ${best_score:.2f}")
+    print(f"Durma nedeni: {stop_summary['stop_reason']} | {stop_summary['evaluations']} değerlendirme "
+          f"({stop_summary['evaluations_saved']} tasarruf)")
+    if system.score_cache is not None and system.score_cache.info()["misses"]:
+        info = system.score_cache.info()
+        print(f"Skor önbelleği: {info['hits']} isabet / {info['misses']} ıskalama "
+              f"(%{info['hit_rate'] * 100:.1f}), {info['size']}/{info['maxsize']} kayıt")
     
     # 3. Sonuçları Kaydet (JSON formatında)
     result_data = {
         "best_score": best_score,
-        "best_params": best_params.tolist() # Numpy array'i listeye çevir
+        "best_params": best_params.tolist(), # Numpy array'i listeye çevir
+        "convergence_curve": [float(x) for x in curve],
+        "stopping": stop_summary
     }
+    if islands is not None:
+        # Ada başına sonuçlar ve yakınsama eğrileri
+        result_data["islands"] = islands
+    if surrogate_log is not None:
+        # Vekil tahmin hatası ve tasarruf edilen backtest'ler
+        result_data["surrogate"] = surrogate_log
     
     with open("best_results.json", "w") as f:
         json.dump(result_data, f)
     print("En iyi parametreler 'best_results.json' dosyasına kaydedildi.")
 
     # 4. Başarı Grafiğini Çiz (Tez için en önemli kısım)
-    plt.figure(figsize=(10, 6))
-    plt.plot(curve, marker='o', color='b', linestyle='-')
-    plt.title('GWO Optimizasyon Süreci (Convergence Curve)')
-    plt.xlabel('İterasyon Sayısı')
-    plt.ylabel('Toplam Portföy Kârı ($)')
-    plt.grid(True)
-    plt.show()
\ No newline at end of file
+    if not args.no_plot:
+        plt = pyplot()
+        plt.figure(figsize=(10, 6))
+        plt.plot(curve, marker='o', color='b', linestyle='-')
+        if islands is not None:
+            for island in islands:
+                plt.plot(island["convergence_curve"], linestyle='--', alpha=0.6, label=f"Ada {island['island']}")
+            plt.legend()
+        plt.title('GWO Optimizasyon Süreci (Convergence Curve)')
+        plt.xlabel('İterasyon Sayısı')
+        plt.ylabel('Toplam Portföy Kârı ($)')
+        plt.grid(True)
+        show(plt, "convergence_curve.png")
\ No newline at end of file
@@ -1,14 +1,17 @@
 import json
-import time
 import os
 import sys
 from src.market import MarketData
+from src.backfill import TokenBucket
 from src.db_manager import DBManager
 
 # Dosya Yolları
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 NEWS_DATA_PATH = os.path.join(BASE_DIR, "data", "large_news.json")
 DB_PATH = os.path.join(BASE_DIR, "data", "crypto_logs.db")
+PROGRESS_EVERY = 50  # Kaç haberde bir ilerleme yazdırılır
+SAVE_EVERY = 50      # Kaç kayıtta bir veritabanına toplu yazılır (kesintide en fazla bu kadarı kaybolur)
+REQUESTS_PER_SECOND = 1.0  # Binance'e çok yüklenmemek için istek hızı (429'lar "veri yok" sayılmasın)
 
 def main():
     print("🚀 SİSTEM BAŞLATILIYOR: Manuel Veri Yükleme (Hızlı Mod)")
@@ -26,7 +29,7 @@ def main():
     try:
         print("🔌 Modüller yükleniyor (Market & DB)...")
         market_bot = MarketData()
-        db_bot = DBManager() # Tabloyu sıfırdan oluşturur
+        db_bot = DBManager(bulk=True) # Tabloyu sıfırdan oluşturur
         print("✅ Modüller hazır.\n")
     except Exception as e:
         print(f"❌ Başlatma Hatası: {e}")
@@ -41,43 +44,49 @@ def main():
         print("❌ Hata: 'data/large_news.json' bulunamadı!")
         return
 
+    trade_records = []
     successful_ops = 0
+    missing = 0
+    throttle = TokenBucket(1, REQUESTS_PER_SECOND)
     
-    # 4. Hızlı Döngü
-    for i, item in enumerate(news_list, 1):
-        # Gemini'ye sormuyoruz, JSON'daki hazır etiketi alıyoruz
-        sentiment = item.get('expected_sentiment', 'NEUTRAL')
-        
-        print(f"İşlem {i}/{len(news_list)}: {item['timestamp']}")
-        print(f"   📝 Etiket: {sentiment}")
-        
-        # Piyasa Verisi Çek
-        market_result = market_bot.get_price_movement(item['symbol'], item['timestamp'])
-        
-        if market_result:
-            # Kayıt Oluştur
-            trade_record = {
-                "timestamp": item['timestamp'],
-                "symbol": item['symbol'],
-                "news_text": item['text'],
-                "sentiment": sentiment, # Hazır etiket
-                "entry_price": market_result['entry_price'],
-                "exit_price": market_result['exit_price'],
-                "pnl": market_result['pnl']
-            }
+    # 4. Hızlı Döngü (kayıtlar SAVE_EVERY'lik partiler halinde yazılır)
+    try:
+        for i, item in enumerate(news_list, 1):
+            # Gemini'ye sormuyoruz, JSON'daki hazır etiketi alıyoruz
+            sentiment = item.get('expected_sentiment', 'NEUTRAL')
+            
+            # Piyasa Verisi Çek
+            throttle.acquire()
+            market_result = market_bot.get_price_movement(item['symbol'], item['timestamp'])
             
-            db_bot.save_trade(trade_record)
-            successful_ops += 1
-        else:
-            print("   ⚠️ Piyasa verisi bulunamadı (Tarih çok eski/hatalı olabilir).")
+            if market_result:
+                # Kayıt Oluştur
+                trade_records.append({
+                    "timestamp": item['timestamp'],
+                    "symbol": item['symbol'],
+                    "news_text": item['text'],
+                    "sentiment": sentiment, # Hazır etiket
+                    "entry_price": market_result['entry_price'],
+                    "exit_price": market_result['exit_price'],
+                    "pnl": market_result['pnl']
+                })
+            else:
+                missing += 1  # Piyasa verisi bulunamadı (Tarih çok eski/hatalı olabilir)
+
+            if len(trade_records) >= SAVE_EVERY:
+                successful_ops += db_bot.save_trades(trade_records)
+                trade_records = []
 
-        # Binance'e çok yüklenmemek için minik bir bekleme 
-        time.sleep(1) 
-        print("-" * 30)
+            if i % PROGRESS_EVERY == 0 or i == len(news_list):
+                print(f"İşlem {i}/{len(news_list)} | Kayıt: {successful_ops + len(trade_records)} | "
+                      f"Piyasa verisi yok: {missing}")
+    finally:
+        # 5. Kalan kayıtlar (kesinti / Ctrl-C olsa bile) yazılır
+        successful_ops += db_bot.save_trades(trade_records)
+        db_bot.close()
 
     print("\n🏁 İŞLEM TAMAMLANDI!")
     print(f"Toplam {successful_ops} adet veri başarıyla veritabanına işlendi.")
-    db_bot.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
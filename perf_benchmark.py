@@ -0,0 +1,307 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+import db_manager
+import gwo_optimization
+import main
+from src.optim import gwo_update
+from src.trade_paths import TIME_FORMAT, VOLUME_LOOKBACK, WINDOW
+from src.trade_replay import TradeLoader
+
+# --- PERFORMANS ÖLÇÜMÜ ---
+# Sıcak yolları (backtest, fitness, GWO güncellemesi, veri yükleme) deterministik
+# sentetik veri üzerinde ölçer. Ağ veya hazır veritabanı gerekmez; sonuçlar
+# commit'ler arasında karşılaştırılabilsin diye JSON olarak yazılır.
+
+CANDLE_SIZES = [1_000, 100_000, 1_000_000]
+TRADE_SIZES = [60, 10_000]
+POP_SIZE = 60
+SEED = 42
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Yeni süreç başlangıç maliyeti: (ad, `python -c` kodu). İşçi süreçler sık başlatıldığı
+# için içe aktarma ve ilk fitness çağrısına kadar geçen süre ayrıca ölçülür.
+STARTUP_TARGETS = [
+    ("python", "pass"),
+    ("import_numpy", "import numpy"),
+    ("import_matplotlib", "import matplotlib.pyplot"),
+    ("import_main", "import main"),
+    ("import_gwo_optimization", "import gwo_optimization"),
+    ("import_gamain", "import src.gamain"),
+    ("import_benchmark_test", "import benchmark_test"),
+    ("import_market", "import src.market"),
+    ("import_sentiment", "import src.sentiment"),
+    ("cold_start_trade_fitness", "import gwo_optimization as g; g.fitness_function_batch([g.LB])"),
+]
+
+
+def synthetic_candles(n, seed):
+    """Rastgele yürüyüş fiyatlarından (n, 6) mum dizisi üretir (timestamp, OHLCV)."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.003, n)) * close
+    candles = np.empty((n, 6))
+    candles[:, 0] = 1_700_000_000_000 + np.arange(n) * 60_000
+    candles[:, 1] = open_
+    candles[:, 2] = np.maximum(open_, close) + spread
+    candles[:, 3] = np.minimum(open_, close) - spread
+    candles[:, 4] = close
+    candles[:, 5] = rng.uniform(1, 100, n)
+    return candles
+
+
+def synthetic_trades(n, seed):
+    """load_trades biçiminde (sentiment, entry, pnl, text) işlemler üretir."""
+    rng = np.random.default_rng(seed)
+    sentiments = rng.choice(["POSITIVE", "NEGATIVE", "NEUTRAL"], size=n, p=[0.45, 0.45, 0.1])
+    pnls = rng.normal(0, 1.5, n)
+    trades = []
+    for i in range(n):
+        # Bazı kayıtlar eski şemadaki gibi '%' içeren metin olsun
+        pnl = f"{pnls[i]:.4f}%" if i % 7 == 0 else float(pnls[i])
+        trades.append((str(sentiments[i]), 100.0, pnl, "haber"))
+    return trades
+
+
+def synthetic_entries(n, candles, seed):
+    """Her işlem için sentetik 1 dakikalık mumlar içinde rastgele bir giriş (timestamp, symbol) üretir."""
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(VOLUME_LOOKBACK + 1, len(candles) - WINDOW, size=n)
+    return [(datetime.fromtimestamp(candles[i, 0] / 1000).strftime(TIME_FORMAT), "BTCUSDT") for i in starts]
+
+
+def measure(fn, repeat, warmup=0):
+    """fn'yi repeat kez çalıştırır; en iyi ve medyan süreyi (sn) döner."""
+    for _ in range(warmup):
+        fn()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {"min_s": min(times), "median_s": statistics.median(times), "repeat": repeat}
+
+
+def repeats_for(size, base):
+    return max(1, base // max(1, size // 1000))
+
+
+def bench_backtest(n, results):
+    data_store = {symbol: synthetic_candles(n, SEED + i) for i, symbol in enumerate(main.COINS)}
+    rng = np.random.default_rng(SEED)
+    params = rng.uniform(0, 1, (POP_SIZE, main.DIMENSIONS))
+    repeat = repeats_for(n, 50)
+
+    # Soğuk: indikatörler ilk kez hesaplanırken (banka boş)
+    def cold():
+        system = main.TradingSystem(data_store=data_store, memo_size=0)
+        system.backtest_coin(main.COINS[0], params[0, :10])
+    results.append({"name": "backtest_coin_cold", "candles": n, **measure(cold, repeat=min(repeat, 5))})
+
+    # Sıcak: indikatörler bankada hazır, önbellek kapalı
+    system = main.TradingSystem(data_store=data_store, memo_size=0)
+    system.evaluate_fitness_batch(params)
+    counter = iter(range(10 ** 9))
+    results.append({"name": "backtest_coin", "candles": n, **measure(
+        lambda: system.backtest_coin(main.COINS[0], params[next(counter) % POP_SIZE, :10]), repeat=repeat)})
+    results.append({"name": "evaluate_fitness", "candles": n, **measure(
+        lambda: system.evaluate_fitness(params[next(counter) % POP_SIZE]), repeat=repeat)})
+    results.append({"name": "evaluate_fitness_batch", "candles": n, "pop_size": POP_SIZE, **measure(
+        lambda: system.evaluate_fitness_batch(params), repeat=max(1, repeat // 10))})
+
+
+def bench_trade_fitness(n, results):
+    trades = synthetic_trades(n, SEED)
+    gwo_optimization.TRADES = TradeLoader(rows=trades, verbose=False)
+    rng = np.random.default_rng(SEED)
+    lb, ub = np.array(gwo_optimization.LB), np.array(gwo_optimization.UB)
+    positions = lb + rng.uniform(0, 1, (POP_SIZE, gwo_optimization.DIM)) * (ub - lb)
+    repeat = max(3, 200 * 60 // n)
+    counter = iter(range(10 ** 9))
+    results.append({"name": "fitness_function", "trades": n, **measure(
+        lambda: gwo_optimization.fitness_function(positions[next(counter) % POP_SIZE]), repeat=repeat)})
+    results.append({"name": "fitness_function_batch", "trades": n, "pop_size": POP_SIZE, **measure(
+        lambda: gwo_optimization.fitness_function_batch(positions), repeat=max(3, repeat // 10))})
+
+    # Giriş sonrası 120 dakikalık mum yollarıyla (trailing / süre / hacim / RSI genleri aktif)
+    candles = synthetic_candles(n + WINDOW + VOLUME_LOOKBACK + 2, SEED)
+    gwo_optimization.TRADES = TradeLoader(rows=trades, entries=synthetic_entries(n, candles, SEED),
+                                          candle_source=lambda symbol: candles, verbose=False)
+    gwo_optimization.TRADES.paths
+    results.append({"name": "fitness_function_batch_paths", "trades": n, "pop_size": POP_SIZE, **measure(
+        lambda: gwo_optimization.fitness_function_batch(positions), repeat=max(3, repeat // 10))})
+
+
+def bench_position_update(results):
+    rng = np.random.default_rng(SEED)
+    for dim in (gwo_optimization.DIM, main.DIMENSIONS):
+        positions = rng.uniform(0, 1, (POP_SIZE, dim))
+        leaders = rng.uniform(0, 1, (3, dim))
+        results.append({"name": "gwo_update_positions", "pop_size": POP_SIZE, "dim": dim, **measure(
+            lambda: gwo_update(positions, leaders, 1.0, rng), repeat=20)})
+
+
+def bench_startup(results, repeat=5):
+    """Her hedef için yeni bir Python süreci başlatır; süre süreç bitene kadar ölçülür."""
+    env = {k: v for k, v in os.environ.items() if k != "MPLBACKEND"}
+    for label, code in STARTUP_TARGETS:
+        times = []
+        error = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            proc = subprocess.run([sys.executable, "-c", code], cwd=REPO_DIR, env=env, capture_output=True, text=True)
+            times.append(time.perf_counter() - start)
+            if proc.returncode != 0:
+                error = (proc.stderr.strip().splitlines() or ["?"])[-1]
+                break
+        entry = {"name": f"startup_{label}", "min_s": min(times), "median_s": statistics.median(times),
+                 "repeat": len(times)}
+        if error:
+            entry["error"] = error
+        results.append(entry)
+
+
+def bench_load_all_data(n, results, workdir):
+    """Sentetik mumları geçici SQLite'a yazar, load_all_data'yı DB'den ve .npy önbelleğinden ölçer."""
+    db_path = os.path.join(workdir, f"candles_{n}.db")
+    db_manager.DB_NAME = db_path
+    if not os.path.exists(db_path):
+        _silent(db_manager.create_table)
+        for i, symbol in enumerate(main.COINS):
+            db_manager.add_candles(synthetic_candles(n, SEED + i), symbol=symbol)
+
+    cache_dir = os.path.join(workdir, f"candle_cache_{n}")
+    repeat = 3 if n <= 100_000 else 1
+    quiet = lambda fn: (lambda: _silent(fn))
+    results.append({"name": "load_all_data_sqlite", "candles": n, "symbols": len(main.COINS), **measure(
+        quiet(lambda: main.TradingSystem()), repeat=repeat)})
+    results.append({"name": "load_all_data_cache_build", "candles": n, "symbols": len(main.COINS), **measure(
+        quiet(lambda: main.TradingSystem(candle_cache_dir=cache_dir + f"_{time.perf_counter_ns()}")), repeat=1)})
+    results.append({"name": "load_all_data_cache_mmap", "candles": n, "symbols": len(main.COINS), **measure(
+        quiet(lambda: main.TradingSystem(candle_cache_dir=cache_dir)), repeat=repeat, warmup=1)})
+
+
+def bench_ingest(n, results, workdir):
+    """Mum yazma: tek bağlantı + toplu transaction (add_candles) ve mum başına commit (add_candle)."""
+    candles = synthetic_candles(n, SEED)
+    counter = iter(range(10 ** 9))
+
+    def fresh_db():
+        db_manager.DB_NAME = os.path.join(workdir, f"ingest_{n}_{next(counter)}.db")
+        _silent(db_manager.create_table)
+
+    def bulk():
+        fresh_db()
+        db_manager.add_candles(candles, symbol="BTCUSDT")
+    results.append({"name": "add_candles", "candles": n, **measure(bulk, repeat=3 if n <= 100_000 else 1)})
+
+    # Mum başına bağlantı + commit çok yavaş olduğundan küçük bir dilimle ölçülür
+    per_row = candles[:min(n, 1_000)]
+    def one_by_one():
+        fresh_db()
+        for c in per_row:
+            db_manager.add_candle("BTCUSDT", int(c[0]), *map(float, c[1:6]))
+    results.append({"name": "add_candle_loop", "candles": len(per_row), **measure(one_by_one, repeat=1)})
+
+
+def _silent(fn):
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        return fn()
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=REPO_DIR).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def result_key(r):
+    return (r["name"],) + tuple(sorted((k, v) for k, v in r.items()
+                                       if k not in ("min_s", "median_s", "repeat", "error")))
+
+
+def compare(results, baseline_path):
+    """Önceki bir çalıştırmayla karşılaştırır (oran > 1 ise yavaşlama)."""
+    with open(baseline_path, "r") as f:
+        baseline = {result_key(r): r for r in json.load(f)["results"]}
+    print(f"\n--- KARŞILAŞTIRMA ({baseline_path}) ---")
+    for r in results:
+        old = baseline.get(result_key(r))
+        if old:
+            ratio = r["median_s"] / old["median_s"] if old["median_s"] else float("inf")
+            flag = "  <-- YAVAŞLAMA" if ratio > 1.2 else ""
+            print(f"{r['name']:<34} {old['median_s'] * 1e3:>10.3f} ms -> {r['median_s'] * 1e3:>10.3f} ms  x{ratio:.2f}{flag}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sıcak yollar için performans ölçümü")
+    parser.add_argument("--candles", type=int, nargs="+", default=CANDLE_SIZES, help="Mum sayıları")
+    parser.add_argument("--trades", type=int, nargs="+", default=TRADE_SIZES, help="İşlem sayıları")
+    parser.add_argument("--quick", action="store_true", help="Sadece küçük boyutlar (1k mum, 60 işlem)")
+    parser.add_argument("--skip-load", action="store_true", help="load_all_data ve mum yazma ölçümlerini atla")
+    parser.add_argument("--skip-startup", action="store_true", help="İçe aktarma / soğuk başlangıç ölçümünü atla")
+    parser.add_argument("--output", default="bench_results.json", help="Sonuç JSON dosyası")
+    parser.add_argument("--compare", default=None, help="Karşılaştırılacak önceki sonuç dosyası")
+    args = parser.parse_args()
+
+    candle_sizes = [1_000] if args.quick else args.candles
+    trade_sizes = [60] if args.quick else args.trades
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix="perf_bench_") as workdir:
+        for n in candle_sizes:
+            print(f"⏱️  Backtest: {n} mum")
+            bench_backtest(n, results)
+            if not args.skip_load:
+                print(f"⏱️  load_all_data: {n} mum x {len(main.COINS)} coin")
+                bench_load_all_data(n, results, workdir)
+                print(f"⏱️  Mum yazma: {n} mum")
+                bench_ingest(n, results, workdir)
+        for n in trade_sizes:
+            print(f"⏱️  Trade fitness: {n} işlem")
+            bench_trade_fitness(n, results)
+        print("⏱️  GWO konum güncellemesi")
+        bench_position_update(results)
+        if not args.skip_startup:
+            print("⏱️  İçe aktarma / soğuk başlangıç (yeni süreç)")
+            bench_startup(results)
+
+    print("\n--- SONUÇLAR (medyan) ---")
+    for r in results:
+        size = ", ".join(f"{k}={v}" for k, v in r.items() if k not in ("name", "min_s", "median_s", "repeat"))
+        if "error" in r:
+            size = f"HATA: {r['error']}"
+        print(f"{r['name']:<34} {r['median_s'] * 1e3:>10.3f} ms   ({size})")
+
+    with open(args.output, "w") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2)
+    print(f"\nSonuçlar '{args.output}' dosyasına kaydedildi.")
+
+    if args.compare:
+        compare(results, args.compare)
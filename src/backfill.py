@@ -0,0 +1,208 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# --- GEÇMİŞ MUM VERİSİ DOLDURMA (BACKFILL) ---
+# İstenen tarih aralığı her coin için 1000 mumluk sayfalara bölünür; sayfalar tüm
+# coinler arasında eşzamanlı çekilir. Borsanın dakikalık istek ağırlığı (weight)
+# bütçesi tüm iş parçacıklarının paylaştığı bir token bucket ile korunur; hatalı
+# istekler üstel bekleme ile tekrar denenir; sayfalar her coin için sırayla yazılır.
+
+PAGE_LIMIT = 1000             # Binance'in tek istekte verdiği en fazla mum
+KLINES_WEIGHT = 2             # /api/v3/klines (limit 100-500: 2, 1000: 2)
+WEIGHT_LIMIT_PER_MINUTE = 6000
+INTERVAL_MS = {"m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+
+
+def interval_ms(interval):
+    """'1m', '15m', '1h', '1d' gibi bir aralığın milisaniye karşılığı."""
+    return int(interval[:-1]) * INTERVAL_MS[interval[-1]]
+
+
+def plan_pages(start_ms, end_ms, interval, limit=PAGE_LIMIT):
+    """[start_ms, end_ms) aralığını en fazla `limit` mumluk (başlangıç, bitiş) sayfalarına böler."""
+    step = interval_ms(interval)
+    start_ms = -(-start_ms // step) * step   # Mum açılışına hizala (yukarı)
+    pages = []
+    page_start = start_ms
+    while page_start < end_ms:
+        page_end = min(page_start + limit * step, end_ms)
+        pages.append((page_start, page_end - 1))
+        page_start = page_end
+    return pages
+
+
+class TokenBucket:
+    """
+    İş parçacıkları arasında paylaşılan token bucket: kapasite `capacity` token,
+    saniyede `rate` token dolar. acquire(n) yeterli token yoksa bekler.
+    """
+    def __init__(self, capacity, rate):
+        self.capacity = float(capacity)
+        self.rate = float(rate)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, weight_limit, burst=None):
+        """Dakikalık ağırlık limitinden bucket (varsayılan anlık kapasite: limitin onda biri)."""
+        return cls(burst or max(1, weight_limit // 10), weight_limit / 60.0)
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, n=1):
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return
+                wait = (n - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Sunucu 429/418 döndüğünde bucket'ı boşaltıp `seconds` boyunca yeni istek bırakmaz."""
+        with self.lock:
+            self._refill()
+            self.tokens = min(self.tokens, 0.0) - seconds * self.rate
+
+
+class KlineClient:
+    """
+    /api/v3/klines istemcisi: her iş parçacığı kendi HTTP oturumunu kullanır; istekler
+    ortak TokenBucket'tan ağırlık alır, başarısız istekler üstel beklemeyle tekrar denenir.
+    """
+    def __init__(self, base_url, bucket, max_retries=5, backoff=0.5, timeout=10):
+        self.base_url = base_url.rstrip("/")
+        self.bucket = bucket
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.local = threading.local()
+        self.retries = 0
+        self.stats_lock = threading.Lock()
+
+    def _session(self):
+        import requests
+        if not hasattr(self.local, "session"):
+            self.local.session = requests.Session()
+        return self.local.session
+
+    def fetch_page(self, symbol, interval, start_ms, end_ms, limit=PAGE_LIMIT):
+        """Tek sayfa mum verisi (Binance kline listesi); tüm denemeler başarısızsa hata fırlatır."""
+        params = {"symbol": symbol, "interval": interval, "startTime": start_ms, "endTime": end_ms,
+                  "limit": limit}
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire(KLINES_WEIGHT)
+            try:
+                response = self._session().get(f"{self.base_url}/api/v3/klines", params=params,
+                                               timeout=self.timeout)
+            except Exception as e:  # Bağlantı hatası, zaman aşımı
+                error, retry_after = e, None
+            else:
+                if response.status_code == 200:
+                    return response.json()
+                error = RuntimeError(f"HTTP {response.status_code}: {response.text[:200]}")
+                if response.status_code in (418, 429):
+                    # Limit aşıldı: sunucunun istediği kadar tüm iş parçacıkları bekler
+                    retry_after = float(response.headers.get("Retry-After", 1))
+                    self.bucket.pause(retry_after)
+                elif response.status_code >= 500:
+                    retry_after = None
+                else:
+                    raise error  # 4xx: tekrar denemek anlamsız (ör. geçersiz sembol)
+
+            if attempt == self.max_retries:
+                raise error
+            with self.stats_lock:
+                self.retries += 1
+            delay = retry_after if retry_after is not None else self.backoff * 2 ** attempt
+            time.sleep(delay * (1 + 0.25 * random.random()))
+
+
+def backfill(client, symbols, interval, start_ms, end_ms, store_page, workers=8, resume_from=None,
+             callback=None, retry_rounds=1):
+    """
+    Tüm coinlerin sayfalarını eşzamanlı çeker; sayfalar her coin için sırayla yazılır.
+
+    Her coin için kayıtlı aralığın (resume_from) iki yanındaki eksikler iki zincir olarak
+    planlanır: baş zinciri [start_ms, ilk mum) yeniden eskiye, kuyruk zinciri (son mum, end_ms]
+    eskiden yeniye yazılır. Sayfalar hangi sırayla gelirse gelsin bir zincirin k. sayfası
+    ancak önceki sayfaları yazıldıktan sonra yazılır (erken gelenler bellekte bekler). Böylece
+    veritabanındaki aralık her zaman boşluksuz kalır ve sonraki çalıştırma ilk ve son mumdan
+    eksikleri tam olarak bulur. Başarısız sayfalar turun sonunda retry_rounds kez yeniden
+    istenir; hâlâ alınamayan bir sayfanın arkasındaki sayfalar yazılmaz.
+
+    Args:
+        store_page: (symbol, klines) -> yazılan satır sayısı; sadece çağıran iş parçacığında
+            çalışır (SQLite'a tek yazıcı).
+        resume_from (dict): symbol -> (ilk, son) kayıtlı mum timestamp'i; verilirse sadece
+            bu aralığın dışında kalan kısımlar çekilir.
+        callback: Her yazılan sayfadan sonra (symbol, sayfa, satır, yazılan, toplam) ile çağrılır.
+
+    Returns:
+        dict: pages, stored, candles, failed ((symbol, sayfa, hata) listesi), skipped (başarısız
+            sayfanın arkasında kalıp yazılmayan sayfa sayısı), retries, seconds.
+    """
+    step = interval_ms(interval)
+    chains = {}  # (symbol, zincir) -> yazılış sırasıyla sayfalar
+    for symbol in symbols:
+        stored_range = resume_from.get(symbol) if resume_from else None
+        if stored_range is None:
+            chains[(symbol, 0)] = plan_pages(start_ms, end_ms, interval)
+            continue
+        first_ts, last_ts = stored_range
+        chains[(symbol, 0)] = plan_pages(start_ms, min(first_ts, end_ms), interval)[::-1]
+        chains[(symbol, 1)] = plan_pages(max(start_ms, last_ts + step), end_ms, interval)
+    # Zincirler iç içe gönderilir (tüm coinler birlikte ilerler); her zincirde önce yazılacaklar önce
+    tasks = sorted(((chain, k) for chain, pages in chains.items() for k in range(len(pages))),
+                   key=lambda task: task[1])
+    total = len(tasks)
+
+    started = time.perf_counter()
+    next_page = {chain: 0 for chain in chains}  # Her zincirde sıradaki yazılacak sayfa
+    arrived = {chain: {} for chain in chains}   # Sırası gelmemiş sayfalar
+    errors = {}
+    stored = candles = 0
+
+    def flush(chain):
+        nonlocal stored, candles
+        while next_page[chain] in arrived[chain]:
+            k = next_page[chain]
+            written = store_page(chain[0], arrived[chain].pop(k))
+            next_page[chain] += 1
+            stored += 1
+            candles += written
+            if callback is not None:
+                callback(chain[0], chains[chain][k], written, stored, total)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for round_no in range(retry_rounds + 1):
+            if not tasks:
+                break
+            if round_no:
+                print(f"🔁 {len(tasks)} başarısız sayfa yeniden isteniyor (tur {round_no})...")
+            futures = {pool.submit(client.fetch_page, chain[0], interval, *chains[chain][k]): (chain, k)
+                       for chain, k in tasks}
+            tasks = []
+            for future in as_completed(futures):
+                chain, k = futures[future]
+                try:
+                    arrived[chain][k] = future.result()
+                except Exception as e:
+                    errors[(chain, k)] = str(e)
+                    tasks.append((chain, k))
+                    print(f"Hata ({chain[0]} {chains[chain][k][0]}): {e}")
+                    continue
+                errors.pop((chain, k), None)
+                flush(chain)
+
+    failed = [(chain[0], chains[chain][k], errors[(chain, k)]) for chain, k in sorted(errors)]
+    return {"pages": total, "stored": stored, "candles": candles, "failed": failed,
+            "skipped": total - stored - len(failed), "retries": client.retries,
+            "seconds": time.perf_counter() - started}
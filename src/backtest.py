@@ -0,0 +1,164 @@
+import numpy as np
+from collections import namedtuple
+
+# Tek bir coin için çözümlenmiş (0-1 genlerden gerçek değerlere çevrilmiş) strateji ayarları
+CoinParams = namedtuple("CoinParams", [
+    "rsi_period", "rsi_buy", "rsi_sell",
+    "macd_fast", "macd_slow", "macd_sig",
+    "stop_loss_pct", "take_profit_pct",
+    "sma_trend", "wallet_pct",
+])
+
+INITIAL_BALANCE = 1000  # Başlangıç Dolar
+
+# Çıkış aranırken ilk bakılan pencere boyu (bulunamazsa her adımda ikiye katlanır)
+EXIT_SEARCH_CHUNK = 64
+
+
+def decode_coin_params(params):
+    """
+    0-1 arasındaki 10 geni main.py'deki formüllerle gerçek strateji ayarlarına çevirir.
+    """
+    return CoinParams(
+        rsi_period=int(params[0] * 16) + 4,          # 4 - 20 arası
+        rsi_buy=int(params[1] * 30) + 20,            # 20 - 50 arası (RSI < bu ise AL)
+        rsi_sell=int(params[2] * 30) + 60,           # 60 - 90 arası (RSI > bu ise SAT)
+        macd_fast=int(params[3] * 10) + 8,           # 8 - 18 arası
+        macd_slow=int(params[4] * 15) + 19,          # 19 - 34 arası
+        macd_sig=int(params[5] * 8) + 5,             # 5 - 13 arası
+        stop_loss_pct=params[6] * 0.15 + 0.01,       # %1 - %16 Stop Loss
+        take_profit_pct=params[7] * 0.30 + 0.02,     # %2 - %32 Take Profit
+        sma_trend=int(params[8] * 150) + 20,         # 20 - 170 mumluk Trend Filtresi
+        wallet_pct=params[9] * 0.9 + 0.1,            # Kasadan %10 - %100 arası kullanım
+    )
+
+
+def quantize_coin_params(p, decimals):
+    """
+    Sürekli ayarları (Stop Loss, Take Profit, Kasa Kullanımı) verilen ondalık
+    basamağa yuvarlar. Tam sayı ayarlar zaten ayrık olduğundan değişmez.
+    Önbellekte birbirine çok yakın kurtların aynı anahtara düşmesini sağlar.
+    """
+    return p._replace(
+        stop_loss_pct=round(float(p.stop_loss_pct), decimals),
+        take_profit_pct=round(float(p.take_profit_pct), decimals),
+        wallet_pct=round(float(p.wallet_pct), decimals),
+    )
+
+
+def warmup_length(p):
+    """İndikatörler oluşana kadar atlanacak mum sayısı."""
+    return max(p.sma_trend, p.macd_slow) + 5
+
+
+def _first_exit(close, rsi_exit, lo, stop_price, target_price):
+    """
+    lo indeksinden itibaren ilk çıkış mumunu bulur (Stop Loss, Take Profit veya RSI Sat).
+    Pozisyonlar genelde kısa sürdüğü için küçük bir pencereden başlayıp
+    pencereyi büyüterek arar. Çıkış yoksa -1 döner.
+    """
+    n = len(close)
+    chunk = EXIT_SEARCH_CHUNK
+    while lo < n:
+        hi = min(n, lo + chunk)
+        seg = close[lo:hi]
+        hit = (seg <= stop_price) | (seg >= target_price) | rsi_exit[lo:hi]
+        j = int(hit.argmax())
+        if hit[j]:
+            return lo + j
+        lo = hi
+        chunk *= 2
+    return -1
+
+
+def _run_trades(close, entries, rsi_exit, p):
+    """
+    Alım sinyali indeksleri (entries) ve RSI Sat maskesi hazırken işlem işlem
+    ilerleyen durum makinesi (sıradaki alım -> ilk çıkış -> sıradaki alım ...).
+    """
+    balance = INITIAL_BALANCE
+    k = 0
+    while k < len(entries):
+        entry_index = entries[k]
+        entry_price = close[entry_index]
+
+        # Alım Yap
+        trade_amount = balance * p.wallet_pct
+        position_size = trade_amount / entry_price
+        balance -= trade_amount
+
+        exit_index = _first_exit(close, rsi_exit, entry_index + 1,
+                                 entry_price * (1 - p.stop_loss_pct),
+                                 entry_price * (1 + p.take_profit_pct))
+        if exit_index < 0:
+            # Son durumda elimde coin kaldıysa nakite dön
+            balance += position_size * close[-1]
+            break
+
+        balance += position_size * close[exit_index]
+        # Çıkış mumunda yeni alım yapılmaz, sıradaki sinyale geç
+        k = int(np.searchsorted(entries, exit_index + 1))
+
+    return float(balance - INITIAL_BALANCE)
+
+
+def simulate_group(close, rsi, macd, macd_signal, sma_trend, params_list, window=None):
+    """
+    Aynı indikatör ayarlarını (RSI periyodu, MACD üçlüsü, SMA) paylaşan birden
+    fazla parametre seti için simülasyonu birlikte çalıştırır.
+
+    MACD/SMA trend maskesi grup için bir kez, alım sinyalleri her farklı RSI Al
+    seviyesi için bir kez, RSI Sat maskesi her farklı RSI Sat seviyesi için bir
+    kez hesaplanır. Her set için Net Kâr listesi döner.
+
+    Args:
+        window (tuple): (başlangıç, bitiş) indeksleri. Verilirse sadece bu aralıkta
+            işlem yapılır ve açık pozisyon aralığın son mumunda kapatılır.
+            İndikatörler tüm geçmişten hesaplandığı için (geçmişe bakan seriler)
+            pencere başında ısınma süresi beklenmez.
+    """
+    start = warmup_length(params_list[0])
+    if window is not None:
+        lo, hi = window
+        close, rsi, macd, macd_signal, sma_trend = (a[:hi] for a in (close, rsi, macd, macd_signal, sma_trend))
+        start = max(start, lo)
+    n = len(close)
+    if start >= n:
+        return [0.0] * len(params_list)
+
+    # --- ALIM KOŞULLARI ---
+    # 1. RSI AL seviyesinin altındaysa (Aşırı satım)
+    # 2. MACD sinyali yukarı kestiyse
+    # 3. Fiyat Trendin (SMA) üstündeyse (Yükseliş trendindeyiz demek)
+    # --- SATIŞ KOŞULLARI ---
+    # Stop Loss, Take Profit veya RSI Tepe (RSI > Sat seviyesi); hepsi o mumun fiyatından kapatır.
+    # NaN karşılaştırmaları False döner; eski döngüdeki davranışın aynısı.
+    with np.errstate(invalid="ignore"):
+        trend_ok = (macd[start:] > macd_signal[start:]) & (close[start:] > sma_trend[start:])
+        entries_by_buy = {}
+        exit_by_sell = {}
+        results = []
+        for p in params_list:
+            entries = entries_by_buy.get(p.rsi_buy)
+            if entries is None:
+                entries = entries_by_buy[p.rsi_buy] = np.flatnonzero(trend_ok & (rsi[start:] < p.rsi_buy)) + start
+            rsi_exit = exit_by_sell.get(p.rsi_sell)
+            if rsi_exit is None:
+                rsi_exit = exit_by_sell[p.rsi_sell] = rsi > p.rsi_sell
+            results.append(_run_trades(close, entries, rsi_exit, p))
+    return results
+
+
+def simulate(close, rsi, macd, macd_signal, sma_trend, p, window=None):
+    """
+    Tek bir coin için AL-SAT simülasyonunu NumPy dizileri üzerinde çalıştırır ve Net Kârı döner.
+
+    Alım sinyali tüm seri için vektörel maske olarak hesaplanır; döngü mum mum
+    değil, işlem işlem ilerler. Mantık main.py'deki eski iloc döngüsüyle birebir aynıdır.
+
+    Args:
+        close, rsi, macd, macd_signal, sma_trend: Aynı uzunlukta float64 diziler.
+        p (CoinParams): Çözümlenmiş strateji ayarları.
+        window (tuple): simulate_group ile aynı; (başlangıç, bitiş) indeksleri.
+    """
+    return simulate_group(close, rsi, macd, macd_signal, sma_trend, [p], window)[0]
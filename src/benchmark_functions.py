@@ -0,0 +1,62 @@
+from collections import namedtuple
+
+import numpy as np
+
+# --- STANDART TEST FONKSİYONLARI ---
+# Hepsi (pop, dim) matrisini tek seferde değerlendirir ve (pop,) döner; hepsi
+# minimizasyon problemidir. Optimizer değişikliklerini yavaş trading backtest'i
+# yerine saniyeler içinde doğrulamak için kullanılır.
+
+# optimum: dim -> bilinen global minimum değeri (bilinmiyorsa None)
+TestFunction = namedtuple("TestFunction", ["name", "func", "lb", "ub", "optimum"])
+
+# Michalewicz (m=10) için literatürdeki global minimumlar
+MICHALEWICZ_OPTIMA = {2: -1.8013, 5: -4.687658, 10: -9.66015}
+
+
+def _matrix(X):
+    return np.atleast_2d(np.asarray(X, dtype=np.float64))
+
+
+def sphere(X):
+    X = _matrix(X)
+    return (X ** 2).sum(axis=1)
+
+
+def rastrigin(X):
+    X = _matrix(X)
+    return 10 * X.shape[1] + (X ** 2 - 10 * np.cos(2 * np.pi * X)).sum(axis=1)
+
+
+def ackley(X):
+    X = _matrix(X)
+    d = X.shape[1]
+    term1 = -20 * np.exp(-0.2 * np.sqrt((X ** 2).sum(axis=1) / d))
+    term2 = -np.exp(np.cos(2 * np.pi * X).sum(axis=1) / d)
+    return term1 + term2 + 20 + np.e
+
+
+def rosenbrock(X):
+    X = _matrix(X)
+    return (100 * (X[:, 1:] - X[:, :-1] ** 2) ** 2 + (1 - X[:, :-1]) ** 2).sum(axis=1)
+
+
+def schwefel(X):
+    X = _matrix(X)
+    return 418.9829 * X.shape[1] - (X * np.sin(np.sqrt(np.abs(X)))).sum(axis=1)
+
+
+def michalewicz(X, m=10):
+    X = _matrix(X)
+    i = np.arange(1, X.shape[1] + 1)
+    return -(np.sin(X) * np.sin(i * X ** 2 / np.pi) ** (2 * m)).sum(axis=1)
+
+
+FUNCTIONS = {
+    "sphere": TestFunction("sphere", sphere, -5.12, 5.12, lambda d: 0.0),
+    "rastrigin": TestFunction("rastrigin", rastrigin, -5.12, 5.12, lambda d: 0.0),
+    "ackley": TestFunction("ackley", ackley, -32.768, 32.768, lambda d: 0.0),
+    "rosenbrock": TestFunction("rosenbrock", rosenbrock, -5.0, 10.0, lambda d: 0.0),
+    "schwefel": TestFunction("schwefel", schwefel, -500.0, 500.0, lambda d: 0.0),
+    "michalewicz": TestFunction("michalewicz", michalewicz, 0.0, np.pi, MICHALEWICZ_OPTIMA.get),
+}
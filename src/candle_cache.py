@@ -0,0 +1,111 @@
+import json
+import os
+
+import numpy as np
+
+# Mum dizilerinin sütun düzeni: (mum sayısı, 6) float64
+CANDLE_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+# Tam yeniden oluşturmada satırlar bu büyüklükte parçalar halinde okunur
+FETCH_CHUNK = 100_000
+
+
+class CandleCache:
+    """
+    'candles' tablosunun coin başına sütunlu disk önbelleği.
+
+    Her coin için bitişik float64 (n, 6) dizisi '<SYMBOL>.npy' dosyasında,
+    satır sayısı ve ilk/son timestamp ise '<SYMBOL>.json' dosyasında tutulur.
+    Yükleme bellek eşlemeli (mmap) yapılır; sayfalar işletim sisteminin sayfa
+    önbelleği üzerinden tüm süreçlerce paylaşılır.
+
+    Tablo sadece 'INSERT OR IGNORE' ile büyüdüğü için (satır güncellenmez)
+    COUNT / MIN / MAX(timestamp) değişikliği algılamaya yeter:
+      - Aynıysa önbellek doğrudan açılır.
+      - Sadece sona yeni mumlar eklendiyse önbellek artımlı olarak uzatılır.
+      - Diğer tüm durumlarda önbellek baştan oluşturulur.
+    """
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def _paths(self, symbol):
+        base = os.path.join(self.cache_dir, symbol)
+        return base + ".npy", base + ".json"
+
+    def _read_meta(self, symbol):
+        npy_path, meta_path = self._paths(symbol)
+        if not (os.path.exists(npy_path) and os.path.exists(meta_path)):
+            return None
+        try:
+            with open(meta_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, symbol, candles, meta):
+        """Önce .npy sonra .json yazılır; ikisi de geçici dosya + os.replace ile (yarım dosya kalmaz)."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        npy_path, meta_path = self._paths(symbol)
+        tmp_path = npy_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, candles)
+        os.replace(tmp_path, npy_path)
+        tmp_path = meta_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, meta_path)
+
+    @staticmethod
+    def _fetch(cursor, symbol, count, after=None):
+        """Satırları Python listesi biriktirmeden önceden ayrılmış diziye okur."""
+        sql = "SELECT timestamp, open, high, low, close, volume FROM candles WHERE symbol=?"
+        args = (symbol,)
+        if after is not None:
+            sql += " AND timestamp > ?"
+            args = (symbol, after)
+        cursor.execute(sql + " ORDER BY timestamp ASC", args)
+
+        candles = np.empty((count, len(CANDLE_COLUMNS)))
+        filled = 0
+        while True:
+            rows = cursor.fetchmany(FETCH_CHUNK)
+            if not rows:
+                break
+            candles[filled:filled + len(rows)] = rows
+            filled += len(rows)
+        return candles[:filled]
+
+    def load(self, conn, symbol):
+        """
+        Coin'in mumlarını (n, 6) dizisi olarak döner; gerekirse önbelleği günceller.
+        Veri yoksa boş dizi döner.
+        """
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*), MIN(timestamp), MAX(timestamp) FROM candles WHERE symbol=?", (symbol,))
+        count, first_ts, last_ts = cursor.fetchone()
+        if count == 0:
+            return np.empty((0, len(CANDLE_COLUMNS)))
+
+        current = {"rows": count, "first_ts": first_ts, "last_ts": last_ts}
+        meta = self._read_meta(symbol)
+        npy_path, _ = self._paths(symbol)
+
+        if meta is not None:
+            cached = np.load(npy_path, mmap_mode="r")
+            if len(cached) == meta["rows"]:
+                if meta == current:
+                    return cached
+
+                # Sadece sona yeni mumlar eklendiyse artımlı uzat
+                if meta["first_ts"] == first_ts and meta["last_ts"] < last_ts:
+                    new_rows = self._fetch(cursor, symbol, count - meta["rows"], after=meta["last_ts"])
+                    if meta["rows"] + len(new_rows) == count:
+                        candles = np.concatenate([cached, new_rows])
+                        del cached  # Dosya eşlemesi kapanmadan üzerine yazılamaz (Windows)
+                        self._write(symbol, candles, current)
+                        return np.load(npy_path, mmap_mode="r")
+            del cached
+
+        # Tam yeniden oluşturma
+        self._write(symbol, self._fetch(cursor, symbol, count), current)
+        return np.load(npy_path, mmap_mode="r")
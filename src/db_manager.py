@@ -1,18 +1,34 @@
 import sqlite3
-import pandas as pd
 import os
+from itertools import islice
+
+BATCH_SIZE = 10_000  # save_trades'te bir transaction'a giren işlem sayısı
 
 class DBManager:
-    def __init__(self, db_name="crypto_logs.db"):
+    INSERT_SQL = '''
+        INSERT INTO trades (timestamp, symbol, news_text, sentiment, entry_price, exit_price, pnl_percent, success)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
+    def __init__(self, db_name="crypto_logs.db", bulk=False):
         """
         Veritabanı bağlantısını kurar ve tabloyu oluşturur.
         Veritabanı dosyasını 'data/' klasörüne kaydeder.
+
+        Args:
+            bulk (bool): Toplu yazma için WAL + synchronous=NORMAL açılır; close() WAL'ı
+                dosyaya işleyip günlük modunu DELETE'e geri alır (yan dosya kalmaz).
         """
         # Proje ana dizinini bul
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.db_path = os.path.join(base_dir, "data", db_name)
         
         self.conn = sqlite3.connect(self.db_path)
+        self.bulk = bulk
+        if bulk:
+            # WAL + synchronous=NORMAL: commit'ler fsync beklemez, okuyucular yazarı engellemez
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
         self.cursor = self.conn.cursor()
         self._create_table()
 
@@ -35,13 +51,9 @@ class DBManager:
         ''')
         self.conn.commit()
 
-    def save_trade(self, trade_data):
-        """
-        Tek bir işlem sonucunu veritabanına kaydeder.
-        
-        Args:
-            trade_data (dict): Tüm verileri içeren sözlük.
-        """
+    @staticmethod
+    def _trade_row(trade_data):
+        """İşlem sözlüğünü trades tablosunun satırına çevirir."""
         # Başarı Durumu (Labeling):
         # Eğer Sentiment Pozitif ise ve PnL > 0 ise -> Başarılı (1)
         # Eğer Sentiment Negatif ise ve PnL < 0 ise -> Başarılı (1) (Short işlem mantığı)
@@ -54,10 +66,7 @@ class DBManager:
            (sentiment == "NEGATIVE" and pnl < 0):
             is_success = 1
             
-        self.cursor.execute('''
-            INSERT INTO trades (timestamp, symbol, news_text, sentiment, entry_price, exit_price, pnl_percent, success)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        return (
             trade_data['timestamp'],
             trade_data['symbol'],
             trade_data['news_text'],
@@ -66,17 +75,65 @@ class DBManager:
             trade_data['exit_price'],
             trade_data['pnl'],
             is_success
-        ))
+        )
+
+    def save_trade(self, trade_data, commit=True, verbose=True):
+        """
+        Tek bir işlem sonucunu veritabanına kaydeder.
+        
+        Args:
+            trade_data (dict): Tüm verileri içeren sözlük.
+            commit (bool): False ise kayıt açık transaction'da bekler; commit() veya close() ile yazılır.
+            verbose (bool): Kayıt mesajını yazdır.
+        """
+        self.cursor.execute(self.INSERT_SQL, self._trade_row(trade_data))
+        if commit:
+            self.conn.commit()
+        if verbose:
+            print(f"💾 Kayıt Başarılı: {trade_data['sentiment']} | PnL: %{trade_data['pnl']:.2f}")
+
+    def save_trades(self, trades, commit=True, verbose=False, batch_size=BATCH_SIZE):
+        """
+        Çok sayıda işlemi executemany ile büyük transaction'lar halinde kaydeder.
+
+        Args:
+            trades: İşlem sözlüklerinden oluşan iterable.
+            commit (bool): False ise son parti açık transaction'da bekler.
+            verbose (bool): Toplam kayıt sayısını yazdır.
+
+        Returns:
+            int: Kaydedilen işlem sayısı.
+        """
+        rows = (self._trade_row(trade_data) for trade_data in trades)
+        count = 0
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            self.cursor.executemany(self.INSERT_SQL, batch)
+            count += len(batch)
+            if commit:
+                self.conn.commit()
+        if verbose:
+            print(f"💾 {count} işlem kaydedildi.")
+        return count
+
+    def commit(self):
         self.conn.commit()
-        print(f"💾 Kayıt Başarılı: {sentiment} | PnL: %{pnl:.2f}")
 
     def get_results_as_dataframe(self):
         """
         Tüm veriyi Pandas DataFrame olarak döner (Analiz için).
         """
+        import pandas as pd  # Sadece analiz için gerekli
         return pd.read_sql_query("SELECT * FROM trades", self.conn)
 
     def close(self):
+        self.conn.commit()  # Bekleyen (commit=False) kayıtlar kaybolmasın
+        if self.bulk:
+            # WAL'daki sayfaları ana dosyaya yaz; -wal/-shm dosyaları silinsin
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self.conn.execute("PRAGMA journal_mode=DELETE")
         self.conn.close()
 
 # --- TEST BLOĞU ---
@@ -1,7 +1,14 @@
-import pygad
 import numpy as np
 import time
-import matplotlib.pyplot as plt
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.optim import GARule, GWORule, Optimizer, StoppingCriteria
+from src.plotting import pyplot, show
+from src.trade_paths import CANDLE_CACHE_DIR, CANDLE_DB_PATH, CandleStore, replay_paths_batch
+from src.trade_replay import DB_PATH, TradeLoader, replay_batch
 
 # ---  PARAMETRELER (M=10) ---
 # Genetik Algoritmanın optimize edeceği 10 karar değişkeni:
@@ -17,86 +24,145 @@ import matplotlib.pyplot as plt
 # Gen 9: Risk Per Trade % (Kasa Yönetimi) [1.0 - 10.0]
 
 GEN_SAYISI_M = 10 
+NUM_GENERATIONS = 1000  # Hoca: 1000 İterasyon
+SOL_PER_POP = 60        # Hoca: 60 Popülasyon
+
+# Genlerin alabileceği değer aralıkları (Space Boundaries)
+# 10 gen için sırasıyla min ve max değerler:
+GENE_SPACE = [
+    {'low': 0.5, 'high': 0.99}, # Gen 0: Buy Threshold
+    {'low': 0.1, 'high': 0.5},  # Gen 1: Sell Threshold
+    {'low': 0.5, 'high': 5.0},  # Gen 2: Stop Loss
+    {'low': 1.0, 'high': 15.0}, # Gen 3: Take Profit
+    {'low': 0.1, 'high': 3.0},  # Gen 4: Trailing Stop
+    {'low': 1, 'high': 120},    # Gen 5: Time
+    {'low': 20, 'high': 40},    # Gen 6: RSI Low
+    {'low': 60, 'high': 80},    # Gen 7: RSI High
+    {'low': 1.0, 'high': 5.0},  # Gen 8: Volume
+    {'low': 1.0, 'high': 10.0}  # Gen 9: Risk
+]
 
-# --- SİMÜLASYON VERİSİ (HIZLI TEST İÇİN) ---
-# Normalde buraya veritabanından çektiğimiz geçmiş veriyi koyacağız.
-# Şimdilik algoritma çalışsın diye rastgele bir fiyat listesi uyduruyoruz.
-simulated_market_data = np.random.uniform(low=40000, high=45000, size=100) # 100 dakikalık fiyat
+# --- GERÇEK İŞLEM VERİSİ ---
+# Fitness, data/crypto_logs.db'deki işlemlerin gwo_optimization.fitness_function ile
+# aynı kurallarla (Long/Short, TP/SL, iz süren stop, süre, hacim/RSI filtresi, risk oranlı
+# kasa) tekrar oynatılmasıdır. Veri ilk fitness çağrısında bir kez yüklenip tipli dizilere
+# ayrıştırılır; giriş sonrası mum yolları main.py'nin yerel mum deposundan okunur.
+TRADES = TradeLoader(DB_PATH, candle_source=CandleStore(CANDLE_DB_PATH, CANDLE_CACHE_DIR))
+PATH_EXITS = True
+
+def evaluate_batch(solutions):
+    """
+    TOPLU DEĞERLENDİRİCİ: (çözüm sayısı, 10) -> (çözüm sayısı,) Toplam Kâr.
+    Gen 2: Stop Loss %, Gen 3: Take Profit %, Gen 9: Risk Per Trade %; mum yolu varsa
+    Gen 4: Trailing Stop %, Gen 5: Time, Gen 6/7: RSI Low/High, Gen 8: Volume de kullanılır.
+    """
+    solutions = np.atleast_2d(np.asarray(solutions, dtype=np.float64))
+    paths = TRADES.paths if PATH_EXITS else None
+    if paths is None or paths.covered == 0:
+        return replay_batch(TRADES.table, solutions[:, 2], solutions[:, 3], solutions[:, 9])
+    return replay_paths_batch(TRADES.table, paths, solutions[:, 2], solutions[:, 3], solutions[:, 9],
+                              trailing_pct=solutions[:, 4], max_hold=solutions[:, 5], volume_filter=solutions[:, 8],
+                              rsi_lower=solutions[:, 6], rsi_upper=solutions[:, 7])
 
 def fitness_func(ga_instance, solution, solution_idx):
     """
     AMAÇ FONKSİYONU:
-    Verilen 10 parametreyi (solution) kullanarak simülasyon yapar.
-    Sonuçta elde edilen TOPLAM KÂR ne kadar yüksekse, fitness o kadar yüksek olur.
-    Hoca 'Minimize' dediği için, Kârı negatife çevirip minimize etmeyi hedefleyebiliriz.
+    Verilen parametrelerle işlem geçmişini tekrar oynatır; TOPLAM KÂR ne kadar
+    yüksekse fitness o kadar yüksektir (PyGAD varsayılan olarak MAXIMIZE eder).
+    fitness_batch_size verildiğinde PyGAD bir grup çözümü (2 boyutlu) tek çağrıda
+    gönderir; bu durumda skor listesi döner.
     """
-    
-    # 1. Genleri Değişkenlere Ata
-    buy_thresh = solution[0]
-    stop_loss = solution[2]
-    take_profit = solution[3]
-    # ... diğer genler de burada işleme alınır ...
-    
-    # 2. Basit Simülasyon (Backtest Mantığı)
-    # Bu kısım normalde çok detaylı olacak, şimdilik basit bir matematiksel model kuruyorum.
-    # Örnek: Eğer Buy Threshold yüksekse ve Stop Loss düşükse puan ver.
-    
-    # (Temsili Skor Hesabı - İleride Gerçek Backtest Gelecek)
-    # Bu formül tamamen algoritmanın çalışıp çalışmadığını test etmek içindir.
-    score = (buy_thresh * 100) + (take_profit * 2) - (stop_loss * 5)
-    
-    # PyGAD varsayılan olarak MAXIMIZE eder.
-    # Eğer minimize etmek istiyorsak: 1.0 / (score + 0.0001) veya -score kullanabiliriz.
-    # Şimdilik biz KÂRI MAKSimize etmeye odaklanalım (PyGAD default).
-    
-    return score
+    scores = evaluate_batch(solution)
+    if np.ndim(solution) == 1:
+        return float(scores[0])
+    return scores.tolist()
 
 def on_generation(ga_instance):
     """Her jenerasyon bittiğinde çalışır (İlerleme Çubuğu gibi)"""
-    print(f"Jenerasyon {ga_instance.generations_completed} | En İyi Fitness: {ga_instance.best_solution()[1]:.4f}")
+    # Son jenerasyonun fitness değerleri verilir; aksi halde best_solution tüm popülasyonu yeniden değerlendirir
+    best_fitness = ga_instance.best_solution(ga_instance.last_generation_fitness)[1]
+    print(f"Jenerasyon {ga_instance.generations_completed} | En İyi Fitness: {best_fitness:.4f}")
 
-def main_optimizer():
-    print("🧬 GENETİK ALGORİTMA OPTİMİZASYONU BAŞLIYOR...")
-    print(f"Hedef: {GEN_SAYISI_M} adet parametreyi optimize etmek.")
+def run_optim(stagnation=None):
+    """Aynı GA ayarlarını ortak ask/tell motoru (src/optim) ile çalıştırır."""
+    lb = [gene['low'] for gene in GENE_SPACE]
+    ub = [gene['high'] for gene in GENE_SPACE]
+    optimizer = Optimizer(GEN_SAYISI_M, SOL_PER_POP, lb=lb, ub=ub,
+                          rule=GARule(num_parents_mating=10, selection="rws", mutation_percent_genes=10),
+                          maximize=True, max_iter=NUM_GENERATIONS,
+                          stopping=StoppingCriteria(stagnation=stagnation))
+    
+    def report(opt):
+        print(f"Jenerasyon {opt.iteration} | En İyi Fitness: {opt.best_score:.4f}")
+    
+    solution, solution_fitness, curve = optimizer.optimize(evaluate_batch, callback=report)
+    print(f"Durma nedeni: {optimizer.summary()['stop_reason']}")
+    return solution, solution_fitness, curve
+
+def run_gwo(stagnation=None):
+    """Karşılaştırma için GWO: aynı gen uzayı, değerlendirici ve 60x1000 bütçe."""
+    lb = [gene['low'] for gene in GENE_SPACE]
+    ub = [gene['high'] for gene in GENE_SPACE]
+    optimizer = Optimizer(GEN_SAYISI_M, SOL_PER_POP, lb=lb, ub=ub, rule=GWORule(leaders=3),
+                          maximize=True, max_iter=NUM_GENERATIONS,
+                          stopping=StoppingCriteria(stagnation=stagnation))
+    
+    def report(opt):
+        print(f"İterasyon {opt.iteration} | En İyi Fitness: {opt.best_score:.4f}")
     
-    # Genlerin alabileceği değer aralıkları (Space Boundaries)
-    # 10 gen için sırasıyla min ve max değerler:
-    gene_space = [
-        {'low': 0.5, 'high': 0.99}, # Gen 0: Buy Threshold
-        {'low': 0.1, 'high': 0.5},  # Gen 1: Sell Threshold
-        {'low': 0.5, 'high': 5.0},  # Gen 2: Stop Loss
-        {'low': 1.0, 'high': 15.0}, # Gen 3: Take Profit
-        {'low': 0.1, 'high': 3.0},  # Gen 4: Trailing Stop
-        {'low': 1, 'high': 120},    # Gen 5: Time
-        {'low': 20, 'high': 40},    # Gen 6: RSI Low
-        {'low': 60, 'high': 80},    # Gen 7: RSI High
-        {'low': 1.0, 'high': 5.0},  # Gen 8: Volume
-        {'low': 1.0, 'high': 10.0}  # Gen 9: Risk
-    ]
+    solution, solution_fitness, curve = optimizer.optimize(evaluate_batch, callback=report)
+    print(f"Durma nedeni: {optimizer.summary()['stop_reason']}")
+    return solution, solution_fitness, curve
+
+def run_pygad(stagnation=None, batch_size=SOL_PER_POP, workers=None, parallel_type="thread"):
+    """
+    Referans GA: pygad kütüphanesi ile.
 
+    Args:
+        batch_size (int): fitness_func'a tek çağrıda gönderilen çözüm sayısı (1 = tek tek).
+        workers (int): Verilirse gruplar bu kadar thread/süreçte paralel değerlendirilir.
+    """
+    import pygad  # Sadece pygad motoru seçildiğinde yüklenir
     # --- AYARLAR ---
     ga_instance = pygad.GA(
-        num_generations=1000,       # Hoca: 1000 İterasyon
+        num_generations=NUM_GENERATIONS,
         num_parents_mating=10,      # Eşleşecek ebeveyn sayısı
         fitness_func=fitness_func,
-        sol_per_pop=60,             # Hoca: 60 Popülasyon
+        sol_per_pop=SOL_PER_POP,
         num_genes=GEN_SAYISI_M,     # Hoca: M=10
-        gene_space=gene_space,
+        gene_space=GENE_SPACE,
         parent_selection_type="rws",# Rulet Tekerleği Seçimi
         crossover_type="uniform",
         mutation_type="random",
         mutation_percent_genes=10,  # Genlerin %10'u mutasyona uğrasın
-        on_generation=on_generation
+        on_generation=on_generation,
+        fitness_batch_size=batch_size if batch_size > 1 else None,
+        parallel_processing=[parallel_type, workers] if workers else None,
+        # En iyi fitness `stagnation` jenerasyon değişmezse dur
+        stop_criteria=f"saturate_{stagnation}" if stagnation else None
     )
 
     # Algoritmayı Çalıştır
-    start_time = time.time()
     ga_instance.run()
+    print(f"Tamamlanan jenerasyon: {ga_instance.generations_completed}/{NUM_GENERATIONS}")
+    solution, solution_fitness, solution_idx = ga_instance.best_solution()
+    return solution, solution_fitness, ga_instance.best_solutions_fitness
+
+def main_optimizer(engine="pygad", stagnation=None, batch_size=SOL_PER_POP, workers=None, parallel_type="thread",
+                   plot=True):
+    print("🧬 GENETİK ALGORİTMA OPTİMİZASYONU BAŞLIYOR...")
+    print(f"Hedef: {GEN_SAYISI_M} adet parametreyi optimize etmek. (Motor: {engine})")
+    
+    start_time = time.time()
+    if engine == "pygad":
+        solution, solution_fitness, curve = run_pygad(stagnation, batch_size, workers, parallel_type)
+    elif engine == "gwo":
+        solution, solution_fitness, curve = run_gwo(stagnation)
+    else:
+        solution, solution_fitness, curve = run_optim(stagnation)
     end_time = time.time()
 
     # --- SONUÇLARI RAPORLA ---
-    solution, solution_fitness, solution_idx = ga_instance.best_solution()
-    
     print("\n" + "="*40)
     print("🏆 OPTİMİZASYON TAMAMLANDI")
     print("="*40)
@@ -117,8 +183,34 @@ def main_optimizer():
     print("="*40)
 
     # --- GRAFİK ---
+    if not plot:
+        return
     print("📈 Grafik çiziliyor...")
-    ga_instance.plot_fitness(title="İterasyon vs Fitness (Kâr) Grafiği")
+    plt = pyplot()
+    plt.figure(figsize=(10, 6))
+    plt.plot(curve, linewidth=2)
+    plt.title("İterasyon vs Fitness (Kâr) Grafiği")
+    plt.xlabel("Jenerasyon")
+    plt.ylabel("Fitness")
+    plt.grid(True)
+    show(plt, "ga_convergence.png")
 
 if __name__ == "__main__":
-    main_optimizer()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="10 parametreli Genetik Algoritma optimizasyonu")
+    parser.add_argument("--engine", choices=["pygad", "optim", "gwo"], default="pygad",
+                        help="pygad: referans kütüphane | optim: ortak ask/tell motoru (src/optim) | "
+                             "gwo: aynı bütçeyle GWO karşılaştırması")
+    parser.add_argument("--stagnation", type=int, default=None,
+                        help="En iyi fitness bu kadar jenerasyon iyileşmezse dur")
+    parser.add_argument("--batch-size", type=int, default=SOL_PER_POP,
+                        help="pygad: fitness'a tek çağrıda gönderilen çözüm sayısı (1 = tek tek)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="pygad: fitness gruplarını paralel değerlendiren thread/süreç sayısı")
+    parser.add_argument("--parallel-type", choices=["thread", "process"], default="thread")
+    parser.add_argument("--no-plot", action="store_true", help="Yakınsama grafiğini çizme")
+    parser.add_argument("--simple-exits", action="store_true",
+                        help="Mum yollarını kullanma; sadece tek PnL'i TP/SL ile kırp")
+    args = parser.parse_args()
+    PATH_EXITS = not args.simple_exits
+    main_optimizer(args.engine, args.stagnation, args.batch_size, args.workers, args.parallel_type,
+                   plot=not args.no_plot)
\ No newline at end of file
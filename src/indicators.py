@@ -0,0 +1,212 @@
+import hashlib
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+# main.py'deki genlerin alabileceği periyot aralıkları (decode_coin_params ile aynı)
+RSI_PERIODS = (4, 20)
+EMA_SPANS = (8, 34)      # MACD Hızlı 8-18, MACD Yavaş 19-34
+SMA_PERIODS = (20, 170)
+
+# Coin başına indikatör bankasının en fazla kullanacağı bellek (bayt).
+# 1000 mumda tüm periyotlar bunun çok altında kalır; 1M mumda tablolar sınırlanır.
+DEFAULT_MEMORY_BUDGET = 256 * 1024 ** 2
+
+
+class _PeriodTable:
+    """
+    Periyoda göre indekslenen 2-D seri tablosu.
+
+    Bellek bütçesi tüm periyotlara yetiyorsa her periyodun kendi satırı vardır
+    (satır = periyot - en küçük periyot). Çok uzun geçmişlerde (ör. 1M mum)
+    tablo sabit sayıda satırla sınırlanır ve en uzun süredir kullanılmayan
+    periyodun satırı yeniden kullanılır. Satırlar ilk istendiğinde hesaplanır
+    ve referans olarak döner.
+    """
+    def __init__(self, bounds, n, compute, max_rows=None):
+        self.lo, self.hi = bounds
+        count = self.hi - self.lo + 1
+        rows = count if max_rows is None else max(2, min(count, max_rows))
+        self.values = np.empty((rows, n))
+        self.slot_of = np.full(count, -1)    # periyot -> satır
+        self.period_of = np.full(rows, -1)   # satır -> periyot
+        self._recent = OrderedDict()         # satırların kullanım sırası
+        self.compute = compute
+
+    @property
+    def bounded(self):
+        return len(self.values) < len(self.slot_of)
+
+    def get(self, period):
+        if not self.lo <= period <= self.hi:
+            # Tablonun dışında kalan periyotlar önbelleğe alınmadan hesaplanır
+            return self.compute(period)
+        idx = period - self.lo
+        slot = self.slot_of[idx]
+        if slot < 0:
+            slot = self._free_slot(idx)
+            self.values[slot] = self.compute(period)
+            self.slot_of[idx] = slot
+            self.period_of[slot] = idx
+        if self.bounded:
+            self._recent[slot] = None
+            self._recent.move_to_end(slot)
+        return self.values[slot]
+
+    def _free_slot(self, idx):
+        if not self.bounded:
+            return idx
+        empty = np.flatnonzero(self.period_of < 0)
+        if len(empty):
+            return int(empty[0])
+        slot, _ = self._recent.popitem(last=False)
+        self.slot_of[self.period_of[slot]] = -1
+        self.period_of[slot] = -1
+        return slot
+
+    def occupied(self):
+        """Dolu satırların periyot indeksleri ve satır numaraları (sınırlı tabloda kullanım sırasıyla)."""
+        slots = np.array(list(self._recent), dtype=np.int64) if self.bounded else np.flatnonzero(self.period_of >= 0)
+        return self.period_of[slots], slots
+
+    def restore(self, periods, values):
+        """Kaydedilmiş (periyot indeksi, seri) çiftlerini tabloya yerleştirir (sığmayanlar en eskilerdir)."""
+        for idx, row in zip(periods[-len(self.values):], values[-len(self.values):]):
+            idx = int(idx)
+            if not 0 <= idx < len(self.slot_of) or self.slot_of[idx] >= 0:
+                continue
+            slot = self._free_slot(idx)
+            self.values[slot] = row
+            self.slot_of[idx] = slot
+            self.period_of[slot] = idx
+            if self.bounded:
+                self._recent[slot] = None
+
+    def fill(self):
+        """Sığdığı kadar periyodu önceden hesaplar."""
+        for period in range(self.lo, self.lo + len(self.values)):
+            self.get(period)
+
+
+class IndicatorBank:
+    """
+    Tek bir coin için tüm (indikatör, periyot) serilerini bir kez hesaplayıp saklar.
+
+    Formüller main.py'deki eski calculate_indicators ile birebir aynıdır
+    (RSI: rolling ortalama, MACD: adjust=False EWM, SMA: rolling ortalama).
+    Her kurt ve her iterasyon için DataFrame kopyalayıp yeniden hesaplamak yerine
+    hazır diziler referans olarak döner.
+
+    Bellek bütçesi (memory_budget) tablolara paylaştırılır; bütçeyi aşacak kadar
+    uzun geçmişlerde en uzun süredir kullanılmayan seriler yeniden hesaplanmak
+    üzere bırakılır.
+    """
+    def __init__(self, close, memory_budget=DEFAULT_MEMORY_BUDGET):
+        self.close = np.ascontiguousarray(close, dtype=np.float64)
+        n = len(self.close)
+        self.fingerprint = self._fingerprint(self.close)
+        budget_rows = memory_budget // (8 * max(n, 1))
+
+        # pandas sadece indikatör hesaplanacaksa yüklenir (main'i içe aktarmak onu yüklemez)
+        import pandas as pd
+        # RSI için kazanç/kayıp serileri tüm periyotlarda ortaktır
+        delta = pd.Series(self.close).diff()
+        self._gain = delta.where(delta > 0, 0)
+        self._loss = -delta.where(delta < 0, 0)
+
+        self._rsi = _PeriodTable(RSI_PERIODS, n, self._compute_rsi, int(budget_rows * 0.10))
+        self._ema = _PeriodTable(EMA_SPANS, n, self._compute_ema, int(budget_rows * 0.15))
+        self._sma = _PeriodTable(SMA_PERIODS, n, self._compute_sma, int(budget_rows * 0.45))
+        self._macd = OrderedDict()  # (hızlı, yavaş, sinyal) -> (macd, macd_signal)
+        self._macd_max = max(2, int(budget_rows * 0.30) // 2)
+
+    @staticmethod
+    def _fingerprint(close):
+        return f"{len(close)}-{hashlib.sha1(close.tobytes()).hexdigest()}"
+
+    # --- HESAPLAMA ---
+    def _compute_rsi(self, period):
+        gain = self._gain.rolling(window=period).mean()
+        loss = self._loss.rolling(window=period).mean()
+        rs = gain / loss
+        return (100 - (100 / (1 + rs))).to_numpy(dtype=np.float64)
+
+    def _compute_ema(self, span):
+        import pandas as pd
+        return pd.Series(self.close).ewm(span=span, adjust=False).mean().to_numpy(dtype=np.float64)
+
+    def _compute_sma(self, period):
+        import pandas as pd
+        return pd.Series(self.close).rolling(window=period).mean().to_numpy(dtype=np.float64)
+
+    # --- ERİŞİM ---
+    def rsi(self, period):
+        return self._rsi.get(period)
+
+    def ema(self, span):
+        return self._ema.get(span)
+
+    def sma(self, period):
+        return self._sma.get(period)
+
+    def macd(self, fast, slow, signal):
+        """MACD çizgisi ve sinyal çizgisini döner (her üçlü için bir kez hesaplanır)."""
+        key = (fast, slow, signal)
+        cached = self._macd.get(key)
+        if cached is None:
+            import pandas as pd
+            line = self.ema(fast) - self.ema(slow)
+            sig = pd.Series(line).ewm(span=signal, adjust=False).mean().to_numpy(dtype=np.float64)
+            cached = self._macd[key] = (line, sig)
+            if len(self._macd) > self._macd_max:
+                self._macd.popitem(last=False)
+        else:
+            self._macd.move_to_end(key)
+        return cached
+
+    def build(self):
+        """RSI / EMA / SMA periyotlarını önceden (eager) hesaplar (bellek bütçesine sığdığı kadar)."""
+        self._rsi.fill()
+        self._ema.fill()
+        self._sma.fill()
+        return self
+
+    # --- DİSKE KAYIT ---
+    def save(self, path):
+        """Hesaplanmış serileri .npz olarak kaydeder (yarım kalan yazım eski dosyayı bozmaz)."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        arrays = {"fingerprint": np.array(self.fingerprint)}
+        for name, table in (("rsi", self._rsi), ("ema", self._ema), ("sma", self._sma)):
+            # Sadece hesaplanmış satırlar yazılır (np.empty ile ayrılmış boş satırlar değil)
+            periods, slots = table.occupied()
+            arrays[name] = table.values[slots]
+            arrays[name + "_periods"] = periods
+        if self._macd:
+            arrays["macd_keys"] = np.array(list(self._macd.keys()), dtype=np.int64)
+            arrays["macd_line"] = np.array([v[0] for v in self._macd.values()])
+            arrays["macd_signal"] = np.array([v[1] for v in self._macd.values()])
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+
+    def load(self, path):
+        """
+        Daha önce kaydedilmiş serileri yükler. Dosya yoksa veya mum verisi
+        değiştiyse (parmak izi tutmuyorsa) hiçbir şey yüklemez ve False döner.
+        """
+        if not os.path.exists(path):
+            return False
+        with np.load(path) as data:
+            if str(data["fingerprint"]) != self.fingerprint:
+                return False
+            for name, table in (("rsi", self._rsi), ("ema", self._ema), ("sma", self._sma)):
+                if name + "_periods" not in data or data[name].shape[1:] != table.values.shape[1:]:
+                    continue  # Eski biçimde kaydedilmiş; bu tablo yeniden hesaplanır
+                table.restore(data[name + "_periods"], data[name])
+            if "macd_keys" in data:
+                for key, line, sig in zip(data["macd_keys"], data["macd_line"], data["macd_signal"]):
+                    if len(self._macd) < self._macd_max:
+                        self._macd[tuple(int(k) for k in key)] = (line, sig)
+        return True
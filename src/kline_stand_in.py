@@ -0,0 +1,142 @@
+import json
+import math
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from src.backfill import KLINES_WEIGHT, PAGE_LIMIT, interval_ms
+
+# --- YEREL BORSA TAKLİDİ (KLINES STAND-IN) ---
+# add.py'nin backfill motorunu gerçek borsaya gitmeden denemek için Binance'in
+# /api/v3/klines uç noktasını taklit eden küçük bir HTTP sunucusu. Mumlar sembol ve
+# zamandan deterministik üretilir; dakikalık ağırlık limiti aşılınca 429 + Retry-After,
+# istenirse rastgele 500 hataları ve ağ gecikmesi de verilir.
+
+
+def synthetic_klines(symbol, interval, start_ms, end_ms, limit=PAGE_LIMIT):
+    """[start_ms, end_ms] aralığındaki sentetik mumlar (Binance kline formatında)."""
+    step = interval_ms(interval)
+    seed = zlib.crc32(symbol.encode())
+    base = 10 + seed % 5000
+    phase = (seed % 1000) / 100.0
+    first = -(-start_ms // step) * step
+    klines = []
+    for open_time in range(first, min(end_ms, int(time.time() * 1000)) + 1, step):
+        if len(klines) == limit:
+            break
+        t = open_time / 3_600_000
+        price = base * math.exp(0.05 * math.sin(t / 50 + phase) + 0.01 * math.sin(t / 3 + 2 * phase))
+        close = price * (1 + 0.002 * math.sin(t * 7 + phase))
+        high = max(price, close) * 1.002
+        low = min(price, close) * 0.998
+        volume = 100 + 50 * (1 + math.sin(t / 5 + phase))
+        klines.append([open_time, f"{price:.8f}", f"{high:.8f}", f"{low:.8f}", f"{close:.8f}",
+                       f"{volume:.8f}", open_time + step - 1, f"{volume * price:.8f}", 100,
+                       f"{volume / 2:.8f}", f"{volume * price / 2:.8f}", "0"])
+    return klines
+
+
+class KlineStandIn:
+    """
+    Arka planda çalışan yerel klines sunucusu.
+
+    Args:
+        weight_limit (int): Dakikalık ağırlık limiti; aşılırsa 429 döner.
+        latency (float): Her isteğe eklenen gecikme (saniye).
+        failure_rate (float): Rastgele 500 döndürme olasılığı (tekrar deneme testi için).
+    """
+    def __init__(self, host="127.0.0.1", port=0, weight_limit=6000, latency=0.0, failure_rate=0.0, seed=None):
+        self.weight_limit = weight_limit
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.window = int(time.time() // 60)
+        self.used_weight = 0
+        self.stats = {"requests": 0, "rate_limited": 0, "failures": 0}
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _take_weight(self):
+        """İsteğin ağırlığını düşer; (izin verildi mi, kullanılan ağırlık, Retry-After, hata mı)."""
+        with self.lock:
+            self.stats["requests"] += 1
+            now = time.time()
+            window = int(now // 60)
+            if window != self.window:
+                self.window, self.used_weight = window, 0
+            if self.used_weight + KLINES_WEIGHT > self.weight_limit:
+                self.stats["rate_limited"] += 1
+                return False, self.used_weight, max(1, math.ceil((window + 1) * 60 - now)), False
+            self.used_weight += KLINES_WEIGHT
+            failed = self.random.random() < self.failure_rate
+            if failed:
+                self.stats["failures"] += 1
+            return True, self.used_weight, None, failed
+
+    def _handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status, body, headers=None):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, str(value))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path != "/api/v3/klines":
+                    return self._send(404, {"code": -1, "msg": "Not found"})
+                allowed, used, retry_after, failed = stand_in._take_weight()
+                headers = {"X-MBX-USED-WEIGHT-1M": used}
+                if not allowed:
+                    headers["Retry-After"] = retry_after
+                    return self._send(429, {"code": -1003, "msg": "Too many requests"}, headers)
+                if stand_in.latency:
+                    time.sleep(stand_in.latency)
+                if failed:
+                    return self._send(500, {"code": -1000, "msg": "Unknown error"}, headers)
+                query = {key: values[0] for key, values in parse_qs(url.query).items()}
+                try:
+                    interval = query.get("interval", "1h")
+                    limit = min(int(query.get("limit", 500)), PAGE_LIMIT)
+                    end_ms = int(query.get("endTime", time.time() * 1000))
+                    start_ms = int(query.get("startTime", end_ms - (limit - 1) * interval_ms(interval)))
+                    klines = synthetic_klines(query["symbol"], interval, start_ms, end_ms, limit)
+                except (KeyError, ValueError):
+                    return self._send(400, {"code": -1100, "msg": "Illegal parameters"}, headers)
+                self._send(200, klines, headers)
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
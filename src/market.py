@@ -1,14 +1,20 @@
-from binance.client import Client
 from datetime import datetime, timedelta
-import pandas as pd
 
 class MarketData:
     def __init__(self):
         """
-        Binance istemcisini başlatır.
+        Binance istemcisi ilk istekte kurulur (python-binance yüklemesi ve ağ bağlantısı
+        sadece gerçekten fiyat çekilecekse yapılır).
         Halka açık veri (Fiyatlar) için API Key gerekmez.
         """
-        self.client = Client()
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            from binance.client import Client
+            self._client = Client()
+        return self._client
 
     def get_price_movement(self, symbol, news_time_str):
         """
@@ -39,7 +45,7 @@ class MarketData:
             # Interval: 1M (1 Dakika)
             klines = self.client.get_klines(
                 symbol=symbol,
-                interval=Client.KLINE_INTERVAL_1MINUTE,
+                interval=self.client.KLINE_INTERVAL_1MINUTE,
                 startTime=start_str,
                 endTime=end_str,
                 limit=2 # Bize sadece giriş anı ve sonraki dakika lazım
@@ -0,0 +1,24 @@
+# Ortak optimizasyon motoru: ask/tell arayüzlü Optimizer ve takılabilir kurallar.
+from src.optim.checkpoint import Checkpoint
+from src.optim.islands import combine_curves, run_island
+from src.optim.optimizer import Optimizer
+from src.optim.rules import GARule, GWORule, gwo_update
+from src.optim.steady_state import SteadyStateGWO
+from src.optim.stopping import StoppingCriteria, population_diversity
+
+# Komut satırı / betiklerden isimle seçilebilen kurallar
+RULES = {
+    # Sadece Alpha, kurt başına tek r1/r2 (main.py'nin eski basit GWO'suyla aynı dinamik)
+    "gwo": lambda: GWORule(leaders=1, scalar_coefficients=True),
+    "gwo3": lambda: GWORule(leaders=3),  # Alpha, Beta, Delta (klasik GWO)
+    "ga": lambda: GARule(),              # Genetik Algoritma
+}
+
+
+def make_optimizer(name, dim, pop_size, max_iter, lb=0.0, ub=1.0, maximize=True, seed=None, stopping=None,
+                   oversample=1):
+    """RULES içindeki isimle bir Optimizer kurar (süreçlere functools.partial ile aktarılabilir)."""
+    if name not in RULES:
+        raise ValueError(f"Bilinmeyen optimizer: {name} (seçenekler: {', '.join(RULES)})")
+    return Optimizer(dim, pop_size, lb=lb, ub=ub, rule=RULES[name](), maximize=maximize,
+                     max_iter=max_iter, seed=seed, stopping=stopping, oversample=oversample)
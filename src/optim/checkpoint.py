@@ -0,0 +1,58 @@
+import json
+import os
+
+import numpy as np
+
+# Optimizer durumundaki diziler .npz içine ayrı ayrı, geri kalanı (sayaçlar,
+# ayarlar, RNG durumu) tek bir JSON metni olarak yazılır.
+ARRAY_FIELDS = ("positions", "alternatives", "scores", "leader_pos", "leader_scores", "convergence_curve")
+
+
+class Checkpoint:
+    """
+    Uzun optimizasyonlar için periyodik durum kaydı.
+
+    Her `every` iterasyonda bir (0 ise hiç) Optimizer.state_dict() diske yazılır. Yazma önce
+    geçici dosyaya yapılır ve os.replace ile yerine konur; süreç yazma sırasında
+    ölse bile önceki checkpoint sağlam kalır. Aynı durumdan devam eden çalışma,
+    RNG durumu da geri yüklendiği için kesintisiz çalışmayla birebir aynıdır.
+    """
+    def __init__(self, path, every=10):
+        self.path = path
+        self.every = int(every)
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def save(self, optimizer):
+        state = optimizer.state_dict()
+        arrays = {name: np.asarray(state.pop(name), dtype=np.float64) for name in ARRAY_FIELDS}
+        meta = json.dumps(state)
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, meta=np.array(meta), **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def load(self, optimizer):
+        """Kayıtlı durumu optimizer'a yükler; dosya yoksa False döner."""
+        if not self.exists():
+            return False
+        with np.load(self.path, allow_pickle=False) as data:
+            state = json.loads(str(data["meta"]))
+            for name in ARRAY_FIELDS:
+                state[name] = data[name]
+        optimizer.load_state_dict(state)
+        return True
+
+    def step(self, optimizer):
+        """Her iterasyon sonunda çağrılır; periyot dolduysa veya bütçe bittiyse kaydeder."""
+        if self.every <= 0:
+            return
+        if optimizer.iteration % self.every == 0 or optimizer.done():
+            self.save(optimizer)
@@ -0,0 +1,58 @@
+import numpy as np
+
+# --- ADA (ISLAND) MODELİ ---
+# Her ada kendi popülasyonu ve tohumuyla ayrı süreçte çalışan bir Optimizer'dır.
+# Adalar halka şeklinde bağlıdır: her `migration_every` iterasyonda ada en iyi
+# kurtlarını bir sonrakine gönderir ve öncekinden gelenleri en kötü kurtlarının
+# yerine koyar. Gönderme, beklemeden önce yapıldığı için halka kilitlenmez;
+# bir ada bittiğinde (bütçe veya erken durma) komşusuna None gönderir.
+
+
+def run_island(optimizer, batch_func, inbox, outbox, migration_every, n_migrants=1, callback=None):
+    """
+    Tek adanın ask/tell döngüsü ve göçleri.
+
+    Args:
+        inbox, outbox: Önceki/sonraki adaya bağlı kuyruklar (multiprocessing.Queue).
+        migration_every (int): Kaç iterasyonda bir göç yapılacağı.
+        n_migrants (int): Her göçte gönderilen en iyi kurt (lider) sayısı.
+
+    Returns:
+        tuple: (en iyi konum, en iyi skor, yakınsama eğrisi)
+    """
+    neighbour_alive = True
+    if optimizer.stopping is not None:
+        optimizer.stopping.start()
+    try:
+        while not optimizer.done():
+            optimizer.tell(batch_func(optimizer.ask()))
+            if optimizer.stopping is not None:
+                optimizer.stop_reason = optimizer.stopping.check(optimizer)
+            if callback is not None:
+                callback(optimizer)
+            if optimizer.done() or optimizer.iteration % migration_every != 0:
+                continue
+
+            outbox.put(optimizer.emigrants(n_migrants))
+            if neighbour_alive:
+                migrants = inbox.get()
+                if migrants is None:
+                    neighbour_alive = False
+                else:
+                    optimizer.immigrate(migrants)
+    finally:
+        outbox.put(None)
+        # Komşunun bitiş işaretine kadar kuyruğu boşalt (gönderen süreç kapanırken takılmasın)
+        while neighbour_alive and inbox.get() is not None:
+            pass
+    return optimizer.best_pos, optimizer.best_score, np.array(optimizer.convergence_curve)
+
+
+def combine_curves(curves, maximize=True):
+    """
+    Ada eğrilerinden küresel yakınsama eğrisi: her iterasyonda adaların en iyisi.
+    Erken duran adaların eğrisi son değeriyle uzatılır.
+    """
+    length = max(len(c) for c in curves)
+    padded = np.array([np.pad(np.asarray(c, dtype=np.float64), (0, length - len(c)), mode="edge") for c in curves])
+    return padded.max(axis=0) if maximize else padded.min(axis=0)
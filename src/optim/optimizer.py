@@ -0,0 +1,217 @@
+import numpy as np
+
+from src.optim.rules import GWORule
+from src.optim.stopping import STOP_MAX_ITER, STOP_TIME_BUDGET
+
+
+class Optimizer:
+    """
+    Popülasyon tabanlı optimizasyon motoru (ask/tell arayüzü).
+
+    ask() değerlendirilecek (pop_size, dim) aday matrisini döner, tell(fitness) bu
+    adayların skorlarıyla liderleri günceller ve kurala (GWO, GA) göre bir sonraki
+    popülasyonu üretir. Değerlendirmenin nasıl yapılacağı (toplu, paralel,
+    önbellekli) tamamen çağırana bırakılır.
+
+    Liderler sırayla güncellenir: bir kurt Alpha'dan iyiyse Alpha olur, değilse
+    Beta'dan iyiyse Beta olur, ... (önceki GWO döngüleriyle aynı kural).
+    """
+    def __init__(self, dim, pop_size, lb=0.0, ub=1.0, rule=None, maximize=True, max_iter=100, seed=None,
+                 stopping=None, oversample=1):
+        """
+        Args:
+            lb, ub (float | list): Alt/üst sınırlar; tek sayı veya boyut başına liste.
+            rule: Güncelleme kuralı (varsayılan: 3 liderli GWORule).
+            maximize (bool): True ise büyük skor iyidir, False ise küçük skor.
+            max_iter (int): İterasyon bütçesi (GWO'nun a katsayısı buna göre azalır).
+            seed (int): Optimizer'ın kendi rastgele sayı üretecinin tohumu.
+            stopping (src.optim.StoppingCriteria): Erken durma kriterleri (None = tüm bütçe).
+            oversample (int): >1 ise her kurt için bu kadar aday konum üretilir
+                (ask_candidates); vekil model gibi bir ön eleme adaylardan birini seçer.
+        """
+        self.dim = dim
+        self.pop_size = pop_size
+        self.lb = np.broadcast_to(np.asarray(lb, dtype=np.float64), (dim,)).copy()
+        self.ub = np.broadcast_to(np.asarray(ub, dtype=np.float64), (dim,)).copy()
+        self.rule = rule if rule is not None else GWORule()
+        self.maximize = maximize
+        self.sign = 1.0 if maximize else -1.0
+        self.max_iter = max_iter
+        self.rng = np.random.default_rng(seed)
+        self.stopping = stopping
+        self.stop_reason = None
+        self.oversample = max(1, int(oversample))
+
+        # Kurtları (Çözümleri) sınırlar içinde rastgele başlat
+        self.positions = self.rng.uniform(0, 1, (pop_size, dim)) * (self.ub - self.lb) + self.lb
+        self.alternatives = [self.rng.uniform(0, 1, (pop_size, dim)) * (self.ub - self.lb) + self.lb
+                             for _ in range(self.oversample - 1)]
+        # Skorlar içeride her zaman "büyük = iyi" yönündedir (minimizasyonda işaret çevrilir)
+        self.scores = np.full(pop_size, -np.inf)
+        self.leader_pos = np.zeros((self.rule.leaders, dim))
+        self.leader_scores = np.full(self.rule.leaders, -np.inf)
+
+        self.iteration = 0
+        self.evaluations = 0
+        self.convergence_curve = []
+
+    @property
+    def progress(self):
+        """Bütçenin tamamlanan oranı; tell() içinde değerlendirilen iterasyonun indeksi / max_iter."""
+        return (self.iteration - 1) / self.max_iter
+
+    @property
+    def best_pos(self):
+        return self.leader_pos[0].copy()
+
+    @property
+    def best_score(self):
+        return float(self.sign * self.leader_scores[0])
+
+    def ask(self):
+        """Sınırlar içine kırpılmış, değerlendirilecek aday matrisini döner."""
+        np.clip(self.positions, self.lb, self.ub, out=self.positions)
+        return self.positions.copy()
+
+    def ask_candidates(self):
+        """
+        (oversample, pop_size, dim) aday yığını: [0] ask() ile aynı konumlar, diğerleri
+        aynı durumdan kuralla bağımsız çekilmiş alternatif konumlar.
+        """
+        candidates = np.stack([self.positions] + list(self.alternatives))
+        np.clip(candidates, self.lb, self.ub, out=candidates)
+        self.positions = candidates[0].copy()
+        return candidates
+
+    def tell(self, fitness, positions=None, evaluated=None):
+        """
+        Son ask() adaylarının skorlarını alır, liderleri ve popülasyonu günceller.
+
+        Args:
+            positions (np.ndarray): Verilirse değerlendirilen konumlar bunlardır
+                (ör. ask_candidates() içinden seçilenler); popülasyon bunlarla değiştirilir.
+            evaluated (np.ndarray): Bool maske; False olan kurtlar gerçekten
+                değerlendirilmemiştir, skorları -inf sayılır (lider olamazlar) ve
+                değerlendirme bütçesinden düşülmez.
+        """
+        fitness = np.asarray(fitness, dtype=np.float64).reshape(-1)
+        if len(fitness) != self.pop_size:
+            raise ValueError(f"{self.pop_size} skor bekleniyordu, {len(fitness)} geldi")
+        if positions is not None:
+            self.positions = np.array(positions, dtype=np.float64).reshape(self.pop_size, self.dim)
+
+        self.scores = self.sign * fitness
+        if evaluated is not None:
+            evaluated = np.asarray(evaluated, dtype=bool)
+            self.scores = np.where(evaluated, self.scores, -np.inf)
+        for i, score in enumerate(self.scores):
+            for k in range(len(self.leader_scores)):
+                if score > self.leader_scores[k]:
+                    self.leader_scores[k] = score
+                    self.leader_pos[k] = self.positions[i]
+                    break
+
+        self.iteration += 1
+        self.evaluations += len(fitness) if evaluated is None else int(np.count_nonzero(evaluated))
+        self.convergence_curve.append(self.best_score)
+        # Alternatif adaylar aynı durumdan (liderler, skorlar) bağımsız çekilir
+        self.alternatives = [self.rule.step(self) for _ in range(self.oversample - 1)]
+        self.positions = self.rule.step(self)
+
+    def done(self):
+        return self.stop_reason is not None or self.iteration >= self.max_iter
+
+    def emigrants(self, n=1):
+        """Göç için en iyi n lider konumu (henüz bulunmamış liderler hariç)."""
+        n = min(n, len(self.leader_pos))
+        return self.leader_pos[:n][np.isfinite(self.leader_scores[:n])].copy()
+
+    def immigrate(self, migrants):
+        """Gelen kurtları son değerlendirmede en kötü skoru alan kurtların yerine koyar."""
+        migrants = np.atleast_2d(np.asarray(migrants, dtype=np.float64))
+        if len(migrants) == 0:
+            return
+        worst = np.argsort(self.scores, kind="stable")[:len(migrants)]
+        self.positions[worst] = migrants[:len(worst)]
+
+    def summary(self):
+        """Çalışmanın neden durduğu ve bütçeye göre kaç değerlendirme tasarruf edildiği."""
+        budget = self.max_iter * self.pop_size
+        return {
+            "stop_reason": self.stop_reason or (STOP_MAX_ITER if self.iteration >= self.max_iter else None),
+            "iterations": self.iteration,
+            "evaluations": self.evaluations,
+            "evaluation_budget": budget,
+            "evaluations_saved": max(0, budget - self.evaluations),
+        }
+
+    def state_dict(self):
+        """
+        Çalışmayı aynen sürdürmek için gereken tüm durum: popülasyon, liderler,
+        yakınsama eğrisi, sayaçlar ve rastgele sayı üretecinin tam durumu.
+        """
+        return {
+            "dim": self.dim,
+            "pop_size": self.pop_size,
+            "max_iter": self.max_iter,
+            "maximize": self.maximize,
+            "rule": type(self.rule).__name__,
+            "oversample": self.oversample,
+            "positions": self.positions.copy(),
+            "alternatives": np.array(self.alternatives).reshape(-1, self.pop_size, self.dim),
+            "scores": self.scores.copy(),
+            "leader_pos": self.leader_pos.copy(),
+            "leader_scores": self.leader_scores.copy(),
+            "convergence_curve": list(self.convergence_curve),
+            "iteration": self.iteration,
+            "evaluations": self.evaluations,
+            "stop_reason": self.stop_reason,
+            "rng_state": self.rng.bit_generator.state,
+        }
+
+    def load_state_dict(self, state):
+        """state_dict() çıktısını geri yükler; ayarlar uyuşmuyorsa ValueError verir."""
+        for key in ("dim", "pop_size", "maximize", "rule", "oversample"):
+            expected = type(self.rule).__name__ if key == "rule" else getattr(self, key)
+            if state[key] != expected:
+                raise ValueError(f"Checkpoint uyumsuz: {key}={state[key]!r}, beklenen {expected!r}")
+        if state["leader_pos"].shape != self.leader_pos.shape:
+            raise ValueError("Checkpoint uyumsuz: lider sayısı farklı")
+        self.positions = np.array(state["positions"], dtype=np.float64)
+        self.alternatives = [np.array(x, dtype=np.float64) for x in state["alternatives"]]
+        self.scores = np.array(state["scores"], dtype=np.float64)
+        self.leader_pos = np.array(state["leader_pos"], dtype=np.float64)
+        self.leader_scores = np.array(state["leader_scores"], dtype=np.float64)
+        self.convergence_curve = [float(x) for x in state["convergence_curve"]]
+        self.iteration = int(state["iteration"])
+        self.evaluations = int(state["evaluations"])
+        # Süre bütçesi süreç başınadır; devam eden çalışma yeni bütçeyle sürer
+        reason = state.get("stop_reason")
+        self.stop_reason = None if reason == STOP_TIME_BUDGET else reason
+        self.rng.bit_generator.state = state["rng_state"]
+
+    def optimize(self, batch_func, callback=None, checkpoint=None):
+        """
+        ask/tell döngüsünü bütçe bitene kadar çalıştırır.
+
+        Args:
+            batch_func: (pop_size, dim) -> (pop_size,) skor vektörü döndüren fonksiyon.
+            callback: Her iterasyondan sonra optimizer ile çağrılır (ilerleme çıktısı vb.).
+            checkpoint (src.optim.Checkpoint): Verilirse durum periyodik olarak diske yazılır.
+
+        Returns:
+            tuple: (en iyi konum, en iyi skor, yakınsama eğrisi)
+        """
+        if self.stopping is not None:
+            self.stopping.start()
+        while not self.done():
+            self.tell(batch_func(self.ask()))
+            if self.stopping is not None:
+                self.stop_reason = self.stopping.check(self)
+            if callback is not None:
+                callback(self)
+            if checkpoint is not None:
+                checkpoint.step(self)
+        if self.stop_reason is None:
+            self.stop_reason = STOP_MAX_ITER
+        return self.best_pos, self.best_score, np.array(self.convergence_curve)
@@ -0,0 +1,121 @@
+import numpy as np
+
+# --- GÜNCELLEME KURALLARI ---
+# Bir kural, değerlendirilmiş popülasyondan bir sonraki popülasyonu üretir.
+# Optimizer her tell() sonunda rule.step(optimizer) çağırır; kural optimizer'ın
+# positions, scores (büyük = iyi), leader_pos, progress, lb/ub ve rng alanlarını okur.
+
+
+def gwo_update(positions, leaders, a, rng, scalar_coefficients=False):
+    """
+    GWO konum güncellemesi: her kurt liderlerin (Alpha, Beta, Delta ...) her birine
+    göre X_k = L_k - A * |C * L_k - X| konumunu hesaplar ve bunların ortalamasına gider.
+    Varsayılan olarak her (lider, kurt, boyut) hücresi kendi r1, r2 rastgele sayılarıyla
+    çekilir (klasik GWO). scalar_coefficients=True ise r1, r2 her (lider, kurt) için tek
+    sayıdır ve tüm boyutlarda aynıdır (main.py'nin eski GWO döngüsündeki gibi).
+
+    Args:
+        positions (np.ndarray): (kurt sayısı, dim) mevcut konumlar.
+        leaders (np.ndarray): (lider sayısı, dim) lider konumları.
+        a (float): 2'den 0'a azalan keşif katsayısı.
+        rng (np.random.Generator): Rastgele sayı üreteci.
+        scalar_coefficients (bool): r1, r2'yi kurt başına tek sayı olarak çek.
+
+    Returns:
+        np.ndarray: (kurt sayısı, dim) yeni konumlar.
+    """
+    k = len(leaders)
+    pop_size, dim = positions.shape
+    leaders = leaders[:, None, :]                        # (k, 1, dim)
+
+    shape = (k, pop_size, 1) if scalar_coefficients else (k, pop_size, dim)
+    r1 = rng.random(shape)
+    r2 = rng.random(shape)
+    A = 2 * a * r1 - a
+    C = 2 * r2
+    D = np.abs(C * leaders - positions)
+    X = leaders - A * D                                  # X1, X2, X3 ...
+
+    new_positions = X[0].copy()
+    for j in range(1, k):
+        new_positions += X[j]
+    if k > 1:
+        new_positions /= k
+    return new_positions
+
+
+class GWORule:
+    """
+    Grey Wolf Optimizer kuralı.
+
+    leaders=1: sadece Alpha'ya göre güncelleme (main.py'nin basitleştirilmiş GWO'su).
+    leaders=3: Alpha, Beta ve Delta ortalaması (klasik GWO, gwo_optimization.py).
+    scalar_coefficients=True: r1, r2 kurt başına tek sayı (main.py'nin eski döngüsü);
+    False: her boyut için ayrı çekilir.
+    a katsayısı ilerlemeye (iterasyon veya değerlendirme oranı) göre 2'den 0'a iner.
+    """
+    def __init__(self, leaders=3, scalar_coefficients=False):
+        if leaders < 1:
+            raise ValueError("GWO en az bir lider gerektirir")
+        self.leaders = leaders
+        self.scalar_coefficients = scalar_coefficients
+
+    def step(self, opt):
+        a = 2 - 2 * opt.progress
+        return gwo_update(opt.positions, opt.leader_pos, a, opt.rng, self.scalar_coefficients)
+
+
+class GARule:
+    """
+    Genetik Algoritma kuralı (src/gamain.py'deki pygad ayarlarının karşılığı).
+
+    Ebeveynler seçilir (rws: rulet tekerleği, sss: en iyiler), çocuklar düzgün
+    (uniform) çaprazlama ile üretilir ve genlerin mutation_percent_genes kadarı
+    sınırlar içinde rastgele değerle değiştirilir. keep_parents=True ise ebeveynler
+    bir sonraki nesle aynen aktarılır (pygad'ın keep_parents=-1 varsayılanı gibi).
+    """
+    leaders = 1
+
+    def __init__(self, num_parents_mating=None, selection="rws", mutation_percent_genes=10, keep_parents=True):
+        if selection not in ("rws", "sss"):
+            raise ValueError(f"Bilinmeyen seçim türü: {selection}")
+        self.num_parents_mating = num_parents_mating
+        self.selection = selection
+        self.mutation_percent_genes = mutation_percent_genes
+        self.keep_parents = keep_parents
+
+    def _select(self, scores, n_parents, rng):
+        if self.selection == "sss":
+            return np.argsort(-scores, kind="stable")[:n_parents]
+        # Rulet tekerleği: skorlar pozitife kaydırılır, geçersiz (-inf/nan) kurtlar seçilmez
+        valid = np.isfinite(scores)
+        if not valid.any():
+            return rng.choice(len(scores), size=n_parents)
+        weights = np.where(valid, scores - scores[valid].min(), 0.0) + valid * 1e-12
+        return rng.choice(len(scores), size=n_parents, p=weights / weights.sum())
+
+    def step(self, opt):
+        rng = opt.rng
+        pop_size, dim = opt.positions.shape
+        n_parents = self.num_parents_mating or max(2, pop_size // 2)
+        if self.keep_parents:
+            n_parents = min(n_parents, pop_size - 1)
+        n_parents = max(1, n_parents)
+
+        parents = opt.positions[self._select(opt.scores, n_parents, rng)]
+        n_children = pop_size - n_parents if self.keep_parents else pop_size
+
+        # Düzgün çaprazlama: her gen iki ebeveynden birinden gelir
+        pairs = rng.integers(0, n_parents, (n_children, 2))
+        mask = rng.random((n_children, dim)) < 0.5
+        children = np.where(mask, parents[pairs[:, 0]], parents[pairs[:, 1]])
+
+        # Rastgele mutasyon: her çocukta n_mut gen sınırlar içinde yeniden çekilir
+        n_mut = max(1, int(round(dim * self.mutation_percent_genes / 100)))
+        genes = np.argsort(rng.random((n_children, dim)), axis=1)[:, :n_mut]
+        rows = np.arange(n_children)[:, None]
+        children[rows, genes] = opt.lb[genes] + rng.random((n_children, n_mut)) * (opt.ub - opt.lb)[genes]
+
+        if self.keep_parents:
+            return np.vstack([parents, children])
+        return children
@@ -0,0 +1,96 @@
+from concurrent.futures import FIRST_COMPLETED, wait
+
+import numpy as np
+
+from src.optim.optimizer import Optimizer
+from src.optim.rules import GWORule, gwo_update
+from src.optim.stopping import STOP_MAX_ITER
+
+
+class SteadyStateGWO(Optimizer):
+    """
+    Asenkron (steady-state) GWO: nesil bariyeri yoktur.
+
+    Her kurt kendi başına değerlendirilir; sonucu gelir gelmez liderler güncellenir
+    ve o kurdun yeni konumu o anki liderlerle hesaplanıp hemen tekrar gönderilir.
+    a katsayısı iterasyona değil, tamamlanan değerlendirme sayısına göre azalır.
+    Bütçe, senkron GWO ile aynı olacak şekilde max_iter * pop_size değerlendirmedir;
+    yakınsama eğrisine her pop_size değerlendirmede bir (nesil eşdeğeri) nokta eklenir.
+    """
+    def __init__(self, dim, pop_size, lb=0.0, ub=1.0, leaders=3, maximize=True, max_iter=100, seed=None,
+                 stopping=None, scalar_coefficients=False):
+        super().__init__(dim, pop_size, lb=lb, ub=ub,
+                         rule=GWORule(leaders=leaders, scalar_coefficients=scalar_coefficients), maximize=maximize,
+                         max_iter=max_iter, seed=seed, stopping=stopping)
+        self.budget = max_iter * pop_size
+
+    @property
+    def progress(self):
+        return self.evaluations / self.budget
+
+    def done(self):
+        return self.stop_reason is not None or self.evaluations >= self.budget
+
+    def ask_one(self, i):
+        """i. kurdun değerlendirilecek (sınırlar içine kırpılmış) konumu."""
+        np.clip(self.positions[i], self.lb, self.ub, out=self.positions[i])
+        return self.positions[i].copy()
+
+    def tell_one(self, i, fitness):
+        """i. kurdun skorunu işler, liderleri günceller ve kurdun sonraki konumunu hesaplar."""
+        score = self.sign * float(fitness)
+        self.scores[i] = score
+        for k in range(len(self.leader_scores)):
+            if score > self.leader_scores[k]:
+                self.leader_scores[k] = score
+                self.leader_pos[k] = self.positions[i]
+                break
+
+        self.evaluations += 1
+        if self.evaluations % self.pop_size == 0:
+            self.iteration += 1
+            self.convergence_curve.append(self.best_score)
+        if self.stopping is not None:
+            self.stop_reason = self.stopping.check(self)
+
+        a = 2 - 2 * self.progress
+        self.positions[i] = gwo_update(self.positions[i:i + 1], self.leader_pos, a, self.rng,
+                                       self.rule.scalar_coefficients)[0]
+
+    def optimize_async(self, executor, evaluate, callback=None):
+        """
+        Değerlendirmeleri executor'a dağıtır; her biten sonuç hemen işlenir.
+
+        Args:
+            executor (concurrent.futures.Executor): Değerlendirmelerin çalıştığı havuz.
+            evaluate: Tek konum (dim,) -> skor; executor'a gönderilebilir (picklable) olmalı.
+            callback: Her nesil eşdeğeri (pop_size değerlendirme) sonunda optimizer ile çağrılır.
+
+        Returns:
+            tuple: (en iyi konum, en iyi skor, yakınsama eğrisi)
+        """
+        if self.stopping is not None:
+            self.stopping.start()
+        pending = {}
+        dispatched = 0
+        for i in range(min(self.pop_size, self.budget)):
+            pending[executor.submit(evaluate, self.ask_one(i))] = i
+            dispatched += 1
+
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                i = pending.pop(future)
+                if self.done():
+                    continue  # Bütçe/kriter doldu; geç gelen sonuçlar yok sayılır
+                iteration = self.iteration
+                self.tell_one(i, future.result())
+                if callback is not None and self.iteration != iteration:
+                    callback(self)
+                if not self.done() and dispatched < self.budget:
+                    pending[executor.submit(evaluate, self.ask_one(i))] = i
+                    dispatched += 1
+
+        if self.stop_reason is None:
+            self.stop_reason = STOP_MAX_ITER
+        return self.best_pos, self.best_score, np.array(self.convergence_curve)
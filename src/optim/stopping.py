@@ -0,0 +1,59 @@
+import time
+
+import numpy as np
+
+# Durma nedenleri (çalışma çıktısına yazılır)
+STOP_MAX_ITER = "max_iter"
+STOP_STAGNATION = "stagnation"
+STOP_DIVERSITY = "diversity"
+STOP_TIME_BUDGET = "time_budget"
+STOP_EVAL_BUDGET = "eval_budget"
+
+
+def population_diversity(positions, lb, ub):
+    """Popülasyonun yayılımı: boyut başına standart sapma / (ub - lb), boyutların ortalaması."""
+    span = np.where(ub > lb, ub - lb, 1.0)
+    return float(np.mean(np.std(positions, axis=0) / span))
+
+
+class StoppingCriteria:
+    """
+    Birleştirilebilir erken durma kriterleri; verilmeyen (None) kriter devre dışıdır.
+    İlk sağlanan kriter çalışmayı durdurur ve nedeni Optimizer.stop_reason'a yazılır.
+
+    Args:
+        stagnation (int): En iyi skor son `stagnation` iterasyonda `min_delta`'dan
+            fazla iyileşmediyse durur.
+        min_delta (float): Stagnasyon için anlamlı sayılan en küçük iyileşme.
+        min_diversity (float): Popülasyon yayılımı (bkz. population_diversity) bu
+            değerin altına düşerse (sürü tek noktaya çöktüyse) durur.
+        time_budget (float): Saniye cinsinden duvar saati bütçesi.
+        max_evaluations (int): Toplam fitness değerlendirme bütçesi.
+    """
+    def __init__(self, stagnation=None, min_delta=0.0, min_diversity=None, time_budget=None, max_evaluations=None):
+        self.stagnation = stagnation
+        self.min_delta = min_delta
+        self.min_diversity = min_diversity
+        self.time_budget = time_budget
+        self.max_evaluations = max_evaluations
+        self.start_time = None
+
+    def start(self):
+        self.start_time = time.perf_counter()
+
+    def check(self, opt):
+        """Her tell() sonrası çağrılır; durulacaksa nedeni, yoksa None döner."""
+        if self.max_evaluations is not None and opt.evaluations >= self.max_evaluations:
+            return STOP_EVAL_BUDGET
+        if self.time_budget is not None and self.start_time is not None \
+                and time.perf_counter() - self.start_time >= self.time_budget:
+            return STOP_TIME_BUDGET
+        if self.stagnation is not None and len(opt.convergence_curve) > self.stagnation:
+            # Eğri raporlanan yöndedir; iyileşme içeride her zaman "büyük = iyi"
+            improvement = opt.sign * (opt.convergence_curve[-1] - opt.convergence_curve[-1 - self.stagnation])
+            if improvement <= self.min_delta:
+                return STOP_STAGNATION
+        if self.min_diversity is not None \
+                and population_diversity(opt.positions, opt.lb, opt.ub) < self.min_diversity:
+            return STOP_DIVERSITY
+        return None
@@ -0,0 +1,267 @@
+import math
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
+
+from src.optim.islands import run_island
+
+# İşçi sürecin kendi TradingSystem örneği (initializer içinde bir kez kurulur)
+_WORKER_SYSTEM = None
+
+
+class SharedCandleStore:
+    """
+    Mum dizilerini işçi süreçlerle paylaşmak için bir kez diske (mümkünse /dev/shm)
+    .npy olarak yazar. İşçiler dosyaları bellek eşlemeli (mmap) açar; böylece her
+    görevde DataFrame/dizi pickle'lanmaz ve sayfalar tüm süreçlerce ortak kullanılır.
+    Dizi zaten bir .npy dosyasının bellek eşlemesiyse (mum önbelleği) kopyalanmaz.
+    """
+    def __init__(self, data_store):
+        shm_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        self.directory = tempfile.mkdtemp(prefix="gwo_candles_", dir=shm_dir)
+        self.paths = {}
+        for symbol, candles in data_store.items():
+            if self._is_whole_npy(candles):
+                self.paths[symbol] = candles.filename
+                continue
+            path = os.path.join(self.directory, f"{symbol}.npy")
+            np.save(path, np.ascontiguousarray(candles, dtype=np.float64))
+            self.paths[symbol] = path
+
+    @staticmethod
+    def _is_whole_npy(candles):
+        if not isinstance(candles, np.memmap) or not candles.filename:
+            return False
+        try:
+            return np.load(candles.filename, mmap_mode="r").shape == candles.shape
+        except (OSError, ValueError):
+            return False
+
+    @staticmethod
+    def attach(paths):
+        """Paylaşılan dizileri salt-okunur bellek eşlemesiyle açar (kopya yok)."""
+        return {symbol: np.load(path, mmap_mode="r") for symbol, path in paths.items()}
+
+    def close(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def _init_worker(system_factory, paths, system_kwargs):
+    global _WORKER_SYSTEM
+    _WORKER_SYSTEM = system_factory(data_store=SharedCandleStore.attach(paths), **system_kwargs)
+
+
+def worker_system():
+    """İşçi süreçte, paylaşılan mumlara bağlanmış TradingSystem örneği."""
+    return _WORKER_SYSTEM
+
+
+@contextmanager
+def system_pool(system, workers, system_kwargs=None):
+    """
+    Her işçisinde paylaşılan mumlara bağlı bir TradingSystem bulunan süreç havuzu.
+    Çıkışta havuz kapatılır ve paylaşılan dosyalar silinir.
+    """
+    store = SharedCandleStore(system.data_store)
+    worker_kwargs = dict(system_kwargs or {})
+    worker_kwargs.setdefault("memo_decimals", system.memo_decimals)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(type(system), store.paths, worker_kwargs)) as pool:
+            yield pool
+    finally:
+        store.close()
+
+
+def evaluate_position(position):
+    """İşçi süreçte tek bir kurdun (tüm coinler) fitness değeri; asenkron GWO bunu gönderir."""
+    return float(_WORKER_SYSTEM.evaluate_fitness_batch(np.asarray(position)[None, :])[0])
+
+
+def _score_coin_chunk(symbol, coin_positions):
+    return _WORKER_SYSTEM.score_coin_batch(symbol, coin_positions)
+
+
+def _optimize_block(optimizer_factory, symbol, dim, pop_size, max_iter, seed):
+    """Tek bir coin'in 10 boyutlu alt problemini işçi süreçte optimize eder."""
+    optimizer = optimizer_factory(dim=dim, pop_size=pop_size, max_iter=max_iter, seed=seed)
+    batch = lambda positions: _WORKER_SYSTEM.score_coin_batch(symbol, positions)
+    best_pos, best_score, curve = optimizer.optimize(batch)
+    return best_pos, best_score, curve, optimizer.summary()
+
+
+def run_block_searches(system, optimizer_factory, blocks, pop_size, max_iter, seeds, workers, system_kwargs=None):
+    """
+    Ayrıştırılabilir (separable) amaç fonksiyonunun her bloğu için bağımsız bir
+    optimizasyonu ayrı süreçte çalıştırır.
+
+    Args:
+        optimizer_factory: (dim, pop_size, max_iter, seed) -> src.optim.Optimizer.
+        blocks (list): (symbol, gen dilimi) çiftleri.
+        seeds (list): Her blok için tohum; sonuçlar süreç sayısından bağımsızdır.
+
+    Returns:
+        list: Blok sırasıyla (en iyi konum, en iyi skor, yakınsama eğrisi, optimizer.summary()).
+    """
+    with system_pool(system, workers, system_kwargs) as pool:
+        futures = [
+            pool.submit(_optimize_block, optimizer_factory, symbol, genes.stop - genes.start, pop_size, max_iter, seed)
+            for (symbol, genes), seed in zip(blocks, seeds)
+        ]
+        return [future.result() for future in futures]
+
+
+def _island_process(index, system_factory, paths, system_kwargs, optimizer_factory, dim, pop_size, max_iter, seed,
+                    migration_every, n_migrants, inbox, outbox, results):
+    """Tek ada: kendi TradingSystem'i ve tohumuyla optimize eder, sonucu results kuyruğuna koyar."""
+    try:
+        _init_worker(system_factory, paths, system_kwargs)
+        optimizer = optimizer_factory(dim=dim, pop_size=pop_size, max_iter=max_iter, seed=seed)
+        report = lambda opt: print(f"Ada {index} | Iterasyon {opt.iteration}: En İyi Skor: ${opt.best_score:.2f}")
+        best_pos, best_score, curve = run_island(optimizer, _WORKER_SYSTEM.evaluate_fitness_batch, inbox, outbox,
+                                                 migration_every, n_migrants, callback=report)
+        results.put((index, {
+            "island": index,
+            "seed": seed,
+            "best_params": best_pos.tolist(),
+            "best_score": float(best_score),
+            "convergence_curve": [float(x) for x in curve],
+            "stopping": optimizer.summary(),
+        }))
+    except Exception:
+        results.put((index, traceback.format_exc()))
+
+
+def run_islands(system, optimizer_factory, dim, pop_size, max_iter, seeds, migration_every, n_migrants=1,
+                system_kwargs=None):
+    """
+    Ada modeli: her tohum için ayrı süreçte bağımsız bir popülasyon (ada) çalıştırır.
+    Adalar halka şeklinde bağlıdır ve her `migration_every` iterasyonda en iyi
+    kurtlarını multiprocessing kuyruklarıyla komşuya gönderir. Mumlar diğer
+    paralel modlardaki gibi bellek eşlemeli dosyalarla paylaşılır.
+
+    Returns:
+        list: Ada sırasıyla sonuç sözlükleri (best_params, best_score, convergence_curve, stopping).
+    """
+    n = len(seeds)
+    store = SharedCandleStore(system.data_store)
+    worker_kwargs = dict(system_kwargs or {})
+    worker_kwargs.setdefault("memo_decimals", system.memo_decimals)
+    channels = [multiprocessing.Queue() for _ in range(n)]
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=_island_process, args=(
+            k, type(system), store.paths, worker_kwargs, optimizer_factory, dim, pop_size, max_iter, seed,
+            migration_every, n_migrants, channels[k], channels[(k + 1) % n], results))
+        for k, seed in enumerate(seeds)
+    ]
+    try:
+        for process in processes:
+            process.start()
+        collected = {}
+        while len(collected) < n:
+            try:
+                index, result = results.get(timeout=1.0)
+            except queue.Empty:
+                crashed = [p for p in processes if p.exitcode not in (None, 0)]
+                if crashed:
+                    raise RuntimeError(f"Ada süreci beklenmedik şekilde sonlandı (çıkış kodu {crashed[0].exitcode})")
+                continue
+            if isinstance(result, str):
+                raise RuntimeError(f"Ada {index} hata verdi:\n{result}")
+            collected[index] = result
+        for process in processes:
+            process.join()
+        return [collected[k] for k in range(n)]
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        store.close()
+
+
+class ParallelEvaluator:
+    """
+    TradingSystem'in toplu fitness hesabını süreç havuzuna dağıtır.
+
+    Her görev bir (coin, kurt grubu) çiftidir; işçiler coin skorlarını döner ve
+    toplama ana süreçte seri moddaki sırayla yapılır. Bu yüzden aynı tohum (seed)
+    için sonuçlar seri mod ile birebir aynıdır. Skor önbelleği ana süreçtedir:
+    önbellekte bulunan kurtlar işçilere hiç gönderilmez.
+    """
+    def __init__(self, system, workers, coins, genes_per_coin=10, system_kwargs=None):
+        self.system = system
+        self.coins = coins
+        self.genes_per_coin = genes_per_coin
+        self.workers = workers
+        self.store = SharedCandleStore(system.data_store)
+
+        # İşçiler kendi önbelleğini tutmaz, ama çözümleme (yuvarlama) ayarı aynı olmalı
+        worker_kwargs = dict(system_kwargs or {})
+        worker_kwargs.update(memo_size=0, memo_decimals=system.memo_decimals)
+        self.pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(type(system), self.store.paths, worker_kwargs),
+        )
+
+    def coin_scores_batch(self, positions):
+        positions = np.asarray(positions, dtype=np.float64)
+        pop_size = len(positions)
+        scores = np.zeros((pop_size, len(self.coins)))
+        cache = self.system.score_cache
+
+        # Toplam görev sayısı işçi sayısının ~2 katı olacak şekilde kurtları böl
+        n_chunks = max(1, math.ceil(2 * self.workers / len(self.coins)))
+
+        futures = []
+        keys = {}
+        for c, symbol in enumerate(self.coins):
+            coin_positions = positions[:, c * self.genes_per_coin:(c + 1) * self.genes_per_coin]
+            pending = []
+            for i, row in enumerate(coin_positions):
+                if cache is None:
+                    pending.append(i)
+                    continue
+                key = keys[i, c] = self.system.memo_key(symbol, self.system.decode_params(row))
+                cached = cache.get(key)
+                if cached is None:
+                    pending.append(i)
+                else:
+                    scores[i, c] = cached
+
+            for rows in np.array_split(np.array(pending, dtype=np.intp), min(n_chunks, len(pending)) or 1):
+                if len(rows):
+                    futures.append((rows, c, self.pool.submit(_score_coin_chunk, symbol, coin_positions[rows])))
+
+        for rows, c, future in futures:
+            scores[rows, c] = future.result()
+            if cache is not None:
+                for i in rows:
+                    cache.put(keys[i, c], scores[i, c])
+        return scores
+
+    def evaluate_fitness_batch(self, positions):
+        """(pop_size, dim) -> (pop_size,) toplam skor; TradingSystem.evaluate_fitness_batch ile aynı toplama sırası."""
+        scores = self.coin_scores_batch(positions)
+        total_scores = np.zeros(len(scores))
+        for c in range(len(self.coins)):
+            total_scores += scores[:, c]
+        return total_scores
+
+    def close(self):
+        self.pool.shutdown()
+        self.store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
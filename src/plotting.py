@@ -0,0 +1,34 @@
+import os
+import sys
+
+# --- GRAFİK YARDIMCILARI ---
+# matplotlib sadece grafik çizilecekse yüklenir (içe aktarması yaklaşık bir saniye
+# sürer). Ekran yoksa (sunucu, işçi süreç) Agg arka ucu seçilir ve grafik
+# gösterilmek yerine dosyaya kaydedilir.
+
+
+def headless():
+    """MPLBACKEND verilmemişse ve Linux'ta ekran (DISPLAY/WAYLAND_DISPLAY) yoksa True."""
+    if os.environ.get("MPLBACKEND"):
+        return False
+    return sys.platform.startswith("linux") and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def pyplot():
+    """matplotlib.pyplot'u ilk kullanımda yükler (ekran yoksa Agg arka ucuyla)."""
+    import matplotlib
+    if headless():
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def show(plt, path):
+    """Etkileşimli arka uçta grafiği gösterir; aksi halde path'e kaydeder."""
+    import matplotlib
+    if matplotlib.get_backend().lower() == "agg":
+        plt.savefig(path, dpi=120, bbox_inches="tight")
+        print(f"📈 Grafik '{path}' dosyasına kaydedildi.")
+    else:
+        plt.show()
+    plt.close()
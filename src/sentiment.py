@@ -1,17 +1,19 @@
-import google.generativeai as genai
 import time
 import sys
 import os
 
 # Üst klasördeki config.py'yi görebilmek için yol ayarı
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-import config
 
 class GeminiClient:
     def __init__(self):
         """
         Gemini API bağlantısını başlatır.
+        google.generativeai ve config sadece istemci kurulurken yüklenir.
         """
+        import google.generativeai as genai
+        import config
+
         if not config.GEMINI_API_KEY:
             raise ValueError("API Key bulunamadı! Lütfen config.py dosyasını kontrol edin.")
             
@@ -0,0 +1,220 @@
+import json
+import math
+import os
+import sys
+
+import numpy as np
+
+# Doğrudan çalıştırıldığında (python src/streaming.py) 'src' paketini görebilmek için yol ayarı
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.backtest import INITIAL_BALANCE, decode_coin_params, warmup_length
+
+# Her sınıf yeni mumu sabit zamanda (O(1)) işler ve pandas'ın toplu formülleriyle
+# (rolling().mean() ve ewm(adjust=False).mean()) bit düzeyinde aynı sonucu üretir.
+# Bunun için pandas'ın kendi iç algoritması (Kahan toplamlı kayan ortalama ve
+# normalize edilmiş EWM güncellemesi) birebir taklit edilir.
+
+
+class StreamingSMA:
+    """pd.Series.rolling(window).mean() ile aynı sonucu veren halka tamponlu kayan ortalama."""
+    def __init__(self, window):
+        self.window = window
+        self._buffer = [0.0] * window
+        self._count = 0
+        self._sum = 0.0
+        self._comp_add = 0.0
+        self._comp_remove = 0.0
+        self._neg_ct = 0
+        self._same_ct = 0
+        self._prev = math.nan
+        self.value = math.nan
+
+    def update(self, x):
+        x = float(x)
+        slot = self._count % self.window
+        if self._count >= self.window:
+            # Pencereden çıkan değer
+            old = self._buffer[slot]
+            y = -old - self._comp_remove
+            t = self._sum + y
+            self._comp_remove = t - self._sum - y
+            self._sum = t
+            if math.copysign(1.0, old) < 0:
+                self._neg_ct -= 1
+        else:
+            if self._count == 0:
+                self._prev = x
+
+        # Pencereye giren değer
+        y = x - self._comp_add
+        t = self._sum + y
+        self._comp_add = t - self._sum - y
+        self._sum = t
+        if math.copysign(1.0, x) < 0:
+            self._neg_ct += 1
+        self._same_ct = self._same_ct + 1 if x == self._prev else 1
+        self._prev = x
+
+        self._buffer[slot] = x
+        self._count += 1
+
+        nobs = min(self._count, self.window)
+        if nobs < self.window:
+            self.value = math.nan
+        else:
+            result = self._sum / nobs
+            if self._same_ct >= nobs:
+                result = self._prev
+            elif self._neg_ct == 0 and result < 0:
+                result = 0.0
+            elif self._neg_ct == nobs and result > 0:
+                result = 0.0
+            self.value = result
+        return self.value
+
+
+class StreamingEMA:
+    """pd.Series.ewm(span=span, adjust=False).mean() ile aynı sonucu veren üssel ortalama."""
+    def __init__(self, span):
+        com = (span - 1) / 2.0
+        self.alpha = 1.0 / (1.0 + com)
+        self.old_wt = 1.0 - self.alpha
+        self.value = math.nan
+
+    def update(self, x):
+        x = float(x)
+        if self.value != self.value:
+            self.value = x
+        elif self.value != x:
+            self.value = (self.old_wt * self.value + self.alpha * x) / (self.old_wt + self.alpha)
+        return self.value
+
+
+class StreamingRSI:
+    """main.py'deki kayan ortalamalı RSI formülünün akan (streaming) sürümü."""
+    def __init__(self, period):
+        self._gain = StreamingSMA(period)
+        self._loss = StreamingSMA(period)
+        self._prev_close = math.nan
+        self.value = math.nan
+
+    def update(self, close):
+        close = float(close)
+        delta = close - self._prev_close
+        self._prev_close = close
+        # delta.where(delta > 0, 0) ve -delta.where(delta < 0, 0) (ilk mumda delta NaN -> 0 / -0.0)
+        gain = self._gain.update(delta if delta > 0 else 0.0)
+        loss = self._loss.update(-(delta if delta < 0 else 0.0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rs = np.float64(gain) / np.float64(loss)
+            self.value = float(100 - (100 / (1 + rs)))
+        return self.value
+
+
+class StreamingMACD:
+    """MACD çizgisi (hızlı EMA - yavaş EMA) ve sinyal çizgisi (MACD'nin EMA'sı)."""
+    def __init__(self, fast, slow, signal):
+        self._fast = StreamingEMA(fast)
+        self._slow = StreamingEMA(slow)
+        self._signal = StreamingEMA(signal)
+        self.macd = math.nan
+        self.signal = math.nan
+
+    def update(self, close):
+        self.macd = self._fast.update(close) - self._slow.update(close)
+        self.signal = self._signal.update(self.macd)
+        return self.macd, self.signal
+
+
+class StreamingStrategy:
+    """
+    Optimize edilmiş 10 genlik stratejiyi yeni gelen mumlar üzerinde çalıştırır.
+    Tüm geçmişi yeniden hesaplamaz; her mumda indikatörler O(1) güncellenir ve
+    src/backtest.py ile aynı AL-SAT kuralları uygulanır.
+    """
+    def __init__(self, params):
+        self.p = decode_coin_params(params)
+        self.rsi = StreamingRSI(self.p.rsi_period)
+        self.macd = StreamingMACD(self.p.macd_fast, self.p.macd_slow, self.p.macd_sig)
+        self.sma = StreamingSMA(self.p.sma_trend)
+        self.warmup = warmup_length(self.p)
+        self.index = -1
+
+        self.balance = INITIAL_BALANCE
+        self.position_size = 0
+        self.entry_price = 0
+        self.in_position = False
+        self.last_price = math.nan
+
+    def on_candle(self, close):
+        """Yeni mumu işler; 'BUY', 'SELL' veya None döner."""
+        self.index += 1
+        self.last_price = close
+        rsi = self.rsi.update(close)
+        macd, signal = self.macd.update(close)
+        trend = self.sma.update(close)
+
+        # İndikatörler oluşana kadar işlem yok
+        if self.index < self.warmup:
+            return None
+
+        p = self.p
+        if not self.in_position:
+            if (rsi < p.rsi_buy) and (macd > signal) and (close > trend):
+                trade_amount = self.balance * p.wallet_pct
+                self.position_size = trade_amount / close
+                self.balance -= trade_amount
+                self.entry_price = close
+                self.in_position = True
+                return "BUY"
+        elif (close <= self.entry_price * (1 - p.stop_loss_pct)
+              or close >= self.entry_price * (1 + p.take_profit_pct)
+              or rsi > p.rsi_sell):
+            self.balance += self.position_size * close
+            self.in_position = False
+            return "SELL"
+        return None
+
+    def net_profit(self):
+        """Açık pozisyon son fiyattan kapatılmış sayılarak Net Kâr."""
+        balance = self.balance
+        if self.in_position:
+            balance += self.position_size * self.last_price
+        return balance - INITIAL_BALANCE
+
+
+def load_best_strategies(coins, path="best_results.json"):
+    """
+    main.py'nin kaydettiği 50 genlik en iyi çözümü coin başına akan stratejilere böler.
+
+    Returns:
+        dict: symbol -> StreamingStrategy
+    """
+    with open(path, "r") as f:
+        best_params = json.load(f)["best_params"]
+    return {symbol: StreamingStrategy(best_params[i * 10:(i + 1) * 10]) for i, symbol in enumerate(coins)}
+
+
+# --- TEST BLOĞU ---
+# Akan indikatörlerin toplu (IndicatorBank) hesaplarla aynı olduğunu kontrol eder.
+if __name__ == "__main__":
+    from src.backtest import simulate
+    from src.indicators import IndicatorBank
+
+    rng = np.random.default_rng(0)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 2000)))
+    bank = IndicatorBank(prices)
+
+    rsi, sma, macd = StreamingRSI(14), StreamingSMA(50), StreamingMACD(12, 26, 9)
+    stream = np.array([(rsi.update(x), sma.update(x), *macd.update(x)) for x in prices])
+    batch = np.column_stack([bank.rsi(14), bank.sma(50), *bank.macd(12, 26, 9)])
+    print("İndikatörler birebir aynı:", np.array_equal(stream, batch, equal_nan=True))
+
+    params = [0.6, 1.0, 0.3, 0.2, 0.5, 0.5, 0.3, 0.2, 0.1, 0.5]
+    strategy = StreamingStrategy(params)
+    for x in prices:
+        strategy.on_candle(x)
+    p = strategy.p
+    expected = simulate(bank.close, bank.rsi(p.rsi_period), *bank.macd(p.macd_fast, p.macd_slow, p.macd_sig),
+                        bank.sma(p.sma_trend), p)
+    print(f"Akan strateji kârı: {strategy.net_profit():.6f} | Toplu backtest: {expected:.6f}")
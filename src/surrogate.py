@@ -0,0 +1,161 @@
+import numpy as np
+
+from src.optim.stopping import STOP_MAX_ITER
+
+# --- VEKİL MODEL (SURROGATE) İLE ÖN ELEME ---
+# Her gerçek backtest tüm coinleri simüle eder. Vekil model, şimdiye kadar
+# değerlendirilmiş (çözümlenmiş coin ayarları -> coin Net Kârı) çiftlerinden
+# öğrenir; her iterasyonda fazladan üretilen adaylar önce vekille puanlanır ve
+# sadece en umut verici olanlar gerçek backtest'e gönderilir.
+
+
+class KNNRegressor:
+    """
+    Uzaklık ağırlıklı k-en yakın komşu regresyonu (sadece numpy).
+    Özellikler, gözlenen değer aralığına göre [0, 1]'e ölçeklenir; en fazla
+    max_samples örnek tutulur (eskiler atılır).
+    """
+    def __init__(self, k=5, max_samples=20_000):
+        self.k = k
+        self.max_samples = max_samples
+        self.X = None
+        self.y = None
+
+    def __len__(self):
+        return 0 if self.y is None else len(self.y)
+
+    def add(self, X, y):
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        y = np.asarray(y, dtype=np.float64).reshape(-1)
+        if self.X is None:
+            self.X, self.y = X.copy(), y.copy()
+        else:
+            self.X = np.vstack([self.X, X])[-self.max_samples:]
+            self.y = np.concatenate([self.y, y])[-self.max_samples:]
+
+    def predict(self, X):
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        lo = self.X.min(axis=0)
+        span = self.X.max(axis=0) - lo
+        span[span == 0] = 1.0
+        train = (self.X - lo) / span
+        query = (X - lo) / span
+
+        # (sorgu, eğitim) uzaklık matrisi
+        d2 = (query ** 2).sum(1)[:, None] + (train ** 2).sum(1)[None, :] - 2 * query @ train.T
+        dist = np.sqrt(np.maximum(d2, 0.0))
+        k = min(self.k, len(self.y))
+        nearest = np.argpartition(dist, k - 1, axis=1)[:, :k]
+        nearest_dist = np.take_along_axis(dist, nearest, axis=1)
+        weights = 1.0 / (nearest_dist + 1e-9)
+        return (weights * self.y[nearest]).sum(1) / weights.sum(1)
+
+
+class CoinSurrogate:
+    """
+    Coin başına bir k-NN modeli: çözümlenmiş 10 ayar (CoinParams) -> coin Net Kârı.
+    Toplam tahmin, coin tahminlerinin toplamıdır (fitness'ın kendisi gibi).
+    """
+    def __init__(self, decode, n_coins, genes_per_coin=10, k=5, min_samples=10):
+        """
+        Args:
+            decode: 10 geni CoinParams'a çeviren fonksiyon (TradingSystem.decode_params).
+            min_samples (int): Coin başına bu kadar örnek birikmeden tahmin yapılmaz.
+        """
+        self.decode = decode
+        self.n_coins = n_coins
+        self.genes_per_coin = genes_per_coin
+        self.min_samples = min_samples
+        self.models = [KNNRegressor(k) for _ in range(n_coins)]
+
+    def _features(self, positions, c):
+        genes = positions[:, c * self.genes_per_coin:(c + 1) * self.genes_per_coin]
+        return np.array([tuple(self.decode(row)) for row in genes], dtype=np.float64)
+
+    def ready(self):
+        return all(len(model) >= self.min_samples for model in self.models)
+
+    def observe(self, positions, coin_scores):
+        """Gerçek değerlendirme sonuçlarını (kurt, coin) skor matrisiyle ekler."""
+        positions = np.atleast_2d(positions)
+        for c, model in enumerate(self.models):
+            model.add(self._features(positions, c), coin_scores[:, c])
+
+    def predict(self, positions):
+        """(aday sayısı, 50) -> (aday sayısı,) tahmini toplam Net Kâr."""
+        positions = np.atleast_2d(positions)
+        total = np.zeros(len(positions))
+        for c, model in enumerate(self.models):
+            total += model.predict(self._features(positions, c))
+        return total
+
+
+def optimize_screened(optimizer, coin_scores_batch, surrogate, eval_fraction=0.5, callback=None):
+    """
+    Vekil model ön elemeli ask/tell döngüsü (büyük skor = iyi varsayılır).
+
+    Her iterasyonda optimizer her kurt için `oversample` aday üretir; vekil her
+    kurdun en iyi adayını seçer ve seçilenlerin en iyi `eval_fraction` kadarı gerçek
+    backtest'e gider. Değerlendirilmeyen kurtlar -inf sayılır (lider olamazlar).
+    Vekil henüz hazır değilken tüm kurtlar gerçek değerlendirilir.
+
+    Args:
+        coin_scores_batch: (kurt, 50) -> (kurt, coin) Net Kâr matrisi.
+
+    Returns:
+        tuple: (en iyi konum, en iyi skor, yakınsama eğrisi, vekil günlüğü)
+    """
+    log = []
+    if optimizer.stopping is not None:
+        optimizer.stopping.start()
+    while not optimizer.done():
+        candidates = optimizer.ask_candidates()              # (oversample, pop, dim)
+        pop_size = candidates.shape[1]
+        chosen = candidates[0]
+        evaluated = np.ones(pop_size, dtype=bool)
+        predicted = None
+
+        if surrogate.ready():
+            flat = candidates.reshape(-1, candidates.shape[2])
+            pred = surrogate.predict(flat).reshape(candidates.shape[:2])
+            best = pred.argmax(axis=0)                       # Her kurdun en umut verici adayı
+            chosen = candidates[best, np.arange(pop_size)]
+            predicted = pred[best, np.arange(pop_size)]
+            n_eval = max(1, int(np.ceil(eval_fraction * pop_size)))
+            evaluated[:] = False
+            evaluated[np.argsort(-predicted, kind="stable")[:n_eval]] = True
+
+        fitness = np.full(pop_size, -np.inf)
+        coin_scores = np.asarray(coin_scores_batch(chosen[evaluated]))
+        real = np.zeros(len(coin_scores))
+        for c in range(coin_scores.shape[1]):
+            real += coin_scores[:, c]
+        fitness[evaluated] = real
+        surrogate.observe(chosen[evaluated], coin_scores)
+
+        entry = {"iteration": optimizer.iteration + 1, "evaluated": int(evaluated.sum()),
+                 "skipped": int(pop_size - evaluated.sum())}
+        if predicted is not None:
+            entry["mae"] = float(np.mean(np.abs(predicted[evaluated] - real)))
+        log.append(entry)
+
+        optimizer.tell(fitness, positions=chosen, evaluated=evaluated)
+        if optimizer.stopping is not None:
+            optimizer.stop_reason = optimizer.stopping.check(optimizer)
+        if callback is not None:
+            callback(optimizer)
+
+    if optimizer.stop_reason is None:
+        optimizer.stop_reason = STOP_MAX_ITER
+    return optimizer.best_pos, optimizer.best_score, np.array(optimizer.convergence_curve), log
+
+
+def summarize_log(log):
+    """Vekil günlüğünün özeti: toplam gerçek/atlanan değerlendirme ve ortalama hata."""
+    errors = [entry["mae"] for entry in log if "mae" in entry]
+    return {
+        "real_evaluations": sum(entry["evaluated"] for entry in log),
+        "skipped_evaluations": sum(entry["skipped"] for entry in log),
+        "mean_abs_error": float(np.mean(errors)) if errors else None,
+        "iterations": log,
+    }
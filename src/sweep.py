@@ -0,0 +1,202 @@
+import itertools
+import json
+import sqlite3
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+
+import numpy as np
+
+from src.optim import StoppingCriteria, make_optimizer
+
+# --- OPTİMİZER AYARI TARAMASI (SWEEP) ---
+# Kurt sayısı, iterasyon, kural gibi ayarların ızgara (grid) veya rastgele
+# taraması. Her (ayar, tohum) hücresi ayrı bir çalıştırmadır; sonuçlar SQLite'a
+# yazılır ve yarıda kesilen bir tarama tekrar başlatıldığında biten hücreler atlanır.
+
+
+def grid(space):
+    """{ayar: [değerler]} -> tüm kombinasyonların listesi."""
+    names = sorted(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+
+
+def random_configs(space, n, seed=None):
+    """
+    Rastgele arama: liste değerlerinden seçim, (alt, üst) demetinden düzgün örnekleme
+    (iki sınır da tamsayıysa tamsayı). Aynı ayar iki kez üretilmez.
+    """
+    rng = np.random.default_rng(seed)
+    configs = []
+    seen = set()
+    for _ in range(n * 20):
+        if len(configs) == n:
+            break
+        config = {}
+        for name in sorted(space):
+            values = space[name]
+            if isinstance(values, tuple):
+                low, high = values
+                if isinstance(low, int) and isinstance(high, int):
+                    config[name] = int(rng.integers(low, high + 1))
+                else:
+                    config[name] = float(rng.uniform(low, high))
+            else:
+                config[name] = values[int(rng.integers(len(values)))]
+        key = config_key(config)
+        if key not in seen:
+            seen.add(key)
+            configs.append(config)
+    return configs
+
+
+def config_key(config):
+    return json.dumps(config, sort_keys=True)
+
+
+def run_config(batch_func, config, seed, dim, lb=0.0, ub=1.0):
+    """
+    Tek hücre: config'teki ayarlarla (optimizer, pop_size, max_iter, isteğe bağlı
+    stagnation) bir optimizasyon çalıştırır.
+
+    Returns:
+        dict: best_score, best_params, curve, evaluations, stop_reason, runtime.
+    """
+    stopping = StoppingCriteria(stagnation=config.get("stagnation"))
+    optimizer = make_optimizer(config.get("optimizer", "gwo"), dim, config["pop_size"], config["max_iter"],
+                               lb=lb, ub=ub, seed=seed, stopping=stopping)
+    start = time.perf_counter()
+    best_pos, best_score, curve = optimizer.optimize(batch_func)
+    runtime = time.perf_counter() - start
+    summary = optimizer.summary()
+    return {
+        "best_score": float(best_score),
+        "best_params": best_pos.tolist(),
+        "curve": [float(x) for x in curve],
+        "evaluations": summary["evaluations"],
+        "stop_reason": summary["stop_reason"],
+        "runtime": runtime,
+    }
+
+
+class SweepStore:
+    """Tarama sonuçlarının SQLite tablosu; (tarama, ayar, tohum) hücresi başına bir satır."""
+    def __init__(self, db_path):
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS sweep_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                sweep TEXT NOT NULL,
+                config TEXT NOT NULL,
+                seed INTEGER NOT NULL,
+                best_score REAL,
+                best_params TEXT,
+                curve TEXT,
+                evaluations INTEGER,
+                stop_reason TEXT,
+                runtime REAL,
+                finished_at TEXT,
+                UNIQUE(sweep, config, seed)
+            )
+        ''')
+        self.conn.commit()
+
+    def completed(self, sweep):
+        rows = self.conn.execute("SELECT config, seed FROM sweep_runs WHERE sweep=?", (sweep,))
+        return {(config, seed) for config, seed in rows}
+
+    def record(self, sweep, config, seed, result):
+        self.conn.execute('''
+            INSERT OR REPLACE INTO sweep_runs
+            (sweep, config, seed, best_score, best_params, curve, evaluations, stop_reason, runtime, finished_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (sweep, config_key(config), seed, result["best_score"], json.dumps(result["best_params"]),
+              json.dumps(result["curve"]), result["evaluations"], result["stop_reason"], result["runtime"],
+              time.strftime("%Y-%m-%d %H:%M:%S")))
+        self.conn.commit()
+
+    def runs(self, sweep):
+        rows = self.conn.execute('''
+            SELECT config, seed, best_score, curve, evaluations, runtime FROM sweep_runs
+            WHERE sweep=? ORDER BY id
+        ''', (sweep,))
+        return [{"config": json.loads(config), "seed": seed, "best_score": best_score, "curve": json.loads(curve),
+                 "evaluations": evaluations, "runtime": runtime}
+                for config, seed, best_score, curve, evaluations, runtime in rows]
+
+    def close(self):
+        self.conn.close()
+
+
+def run_sweep(executor, task, configs, seeds, store, sweep, max_pending, callback=None):
+    """
+    Eksik (ayar, tohum) hücrelerini executor'a dağıtır ve biten her sonucu hemen kaydeder.
+
+    Args:
+        task: (config, seed) -> run_config sonucu; executor'a gönderilebilir olmalı.
+        max_pending (int): Aynı anda havuzda bekleyen/çalışan en fazla hücre.
+        callback: Her biten hücrede (config, seed, sonuç, kalan) ile çağrılır.
+
+    Returns:
+        tuple: (çalıştırılan hücre sayısı, atlanan (zaten biten) hücre sayısı)
+    """
+    done = store.completed(sweep)
+    cells = [(config, seed) for config in configs for seed in seeds if (config_key(config), seed) not in done]
+    skipped = len(configs) * len(seeds) - len(cells)
+    queue = iter(cells)
+    pending = {}
+    remaining = len(cells)
+    try:
+        for config, seed in itertools.islice(queue, max_pending):
+            pending[executor.submit(task, config, seed)] = (config, seed)
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                config, seed = pending.pop(future)
+                result = future.result()
+                store.record(sweep, config, seed, result)
+                remaining -= 1
+                if callback is not None:
+                    callback(config, seed, result, remaining)
+                for config, seed in itertools.islice(queue, 1):
+                    pending[executor.submit(task, config, seed)] = (config, seed)
+    finally:
+        for future in pending:
+            future.cancel()
+    return len(cells), skipped
+
+
+def evaluations_to_target(curve, pop_size, target):
+    """Eğrinin hedefe ilk ulaştığı iterasyona kadar yapılan değerlendirme (ulaşmadıysa None)."""
+    hits = np.flatnonzero(np.asarray(curve) >= target)
+    return int((hits[0] + 1) * pop_size) if len(hits) else None
+
+
+def summarize(runs, target=None):
+    """
+    Ayar başına özet (tohumlar üzerinden). target verilirse hedefe ulaşan tohum sayısı
+    ve medyan maliyet (değerlendirme) hesaplanır; sıralama en ucuz başarılı ayardan başlar.
+    """
+    groups = {}
+    for run in runs:
+        groups.setdefault(config_key(run["config"]), []).append(run)
+    rows = []
+    for key, group in groups.items():
+        config = group[0]["config"]
+        row = {
+            "config": config,
+            "runs": len(group),
+            "mean_best": float(np.mean([r["best_score"] for r in group])),
+            "max_best": float(np.max([r["best_score"] for r in group])),
+            "mean_evaluations": float(np.mean([r["evaluations"] for r in group])),
+            "mean_runtime": float(np.mean([r["runtime"] for r in group])),
+        }
+        if target is not None:
+            costs = [evaluations_to_target(r["curve"], config["pop_size"], target) for r in group]
+            costs = [c for c in costs if c is not None]
+            row["hits"] = len(costs)
+            row["median_cost"] = float(np.median(costs)) if costs else None
+        rows.append(row)
+    if target is None:
+        return sorted(rows, key=lambda r: -r["mean_best"])
+    return sorted(rows, key=lambda r: (-r["hits"] / r["runs"], r["median_cost"] if r["median_cost"] is not None
+                                       else float("inf"), -r["mean_best"]))
@@ -0,0 +1,260 @@
+import os
+import sqlite3
+from datetime import datetime
+
+import numpy as np
+
+from src.candle_cache import CandleCache
+from src.trade_replay import INITIAL_CAPITAL, NO_DATA_FITNESS, TradeTable
+
+# --- YOLA BAĞLI ÇIKIŞ SİMÜLASYONU ---
+# Her işlem için girişten sonraki (en fazla) 120 adet 1 dakikalık mum, yerel mum
+# deposundan bir kez okunup (işlem, 120) boyutlu float32 dizisine yazılır: her
+# dakikanın kapanışının giriş fiyatına göre yüzde değişimi. Fitness bu yollar
+# üzerinde Trailing Stop, Max Holding Time, Hacim ve RSI genlerini tüm popülasyon
+# için dizi işlemleriyle simüle eder.
+
+WINDOW = 120                # Girişten sonraki en fazla mum (dakika) sayısı
+CANDLE_STEP_MS = 60_000     # Yollar 1 dakikalık mum ister (Max Holding Time dakika cinsinden)
+MAX_ENTRY_GAP_MS = 60_000   # İşlem saatine bu kadar yakın mum yoksa yol yok sayılır
+RSI_PERIOD = 14             # Girişteki RSI (girişten önceki kapanışlarla)
+VOLUME_LOOKBACK = 20        # Hacim oranı: son mum hacmi / önceki 20 mumun ortalaması
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# main.py / add.py'nin yazdığı mum deposu (çalışma dizininden bağımsız, proje köküne göre)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CANDLE_DB_PATH = os.path.join(BASE_DIR, "crypto_data.db")
+CANDLE_CACHE_DIR = os.path.join(BASE_DIR, "data", "cache", "candles")
+
+
+def load_trade_entries(db_path):
+    """İşlemlerin (timestamp, symbol) bilgisini load_trades ile aynı sırada çeker."""
+    if not os.path.exists(db_path):
+        return []
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT timestamp, symbol FROM trades").fetchall()
+    except sqlite3.OperationalError:
+        return []
+    finally:
+        conn.close()
+
+
+class CandleStore:
+    """
+    Coin mumlarını (n, 6) dizisi olarak veren yerel mum deposu (candles tablosu).
+    cache_dir verilirse CandleCache üzerinden bellek eşlemeli okunur.
+    """
+    def __init__(self, db_path, cache_dir=None):
+        self.db_path = db_path
+        self.cache = CandleCache(cache_dir) if cache_dir else None
+
+    def __call__(self, symbol):
+        if not os.path.exists(self.db_path):
+            return None
+        conn = sqlite3.connect(self.db_path)
+        try:
+            if self.cache is not None:
+                return self.cache.load(conn, symbol)
+            rows = conn.execute("SELECT timestamp, open, high, low, close, volume FROM candles "
+                                "WHERE symbol=? ORDER BY timestamp ASC", (symbol,)).fetchall()
+            return np.array(rows, dtype=np.float64).reshape(-1, 6)
+        except sqlite3.OperationalError:
+            return None
+        finally:
+            conn.close()
+
+
+class TradePaths:
+    """
+    İşlem başına giriş sonrası fiyat yolu ve giriş anı filtre değerleri.
+
+    Attributes:
+        path (np.ndarray): (işlem, WINDOW) float32; kapanışın giriş (açılış) fiyatına göre
+            yüzde değişimi, yol bitince NaN.
+        length (np.ndarray): Her işlemin kullanılabilir mum sayısı (0 = yol yok).
+        rsi (np.ndarray): Girişteki RSI (geçmiş yetersizse NaN).
+        volume_ratio (np.ndarray): Girişteki hacim oranı (geçmiş yetersizse NaN).
+    """
+    def __init__(self, n, window=WINDOW):
+        self.path = np.full((n, window), np.nan, dtype=np.float32)
+        self.length = np.zeros(n, dtype=np.int16)
+        self.rsi = np.full(n, np.nan, dtype=np.float32)
+        self.volume_ratio = np.full(n, np.nan, dtype=np.float32)
+
+    def __len__(self):
+        return len(self.length)
+
+    @property
+    def covered(self):
+        return int((self.length > 0).sum())
+
+
+def _entry_ms(timestamp):
+    try:
+        return datetime.strptime(str(timestamp), TIME_FORMAT).timestamp() * 1000
+    except ValueError:
+        return np.nan
+
+
+def build_trade_paths(entries, candle_source, window=WINDOW):
+    """
+    Args:
+        entries (list): load_trade_entries çıktısı ((timestamp, symbol) çiftleri).
+        candle_source: symbol -> (n, 6) mum dizisi (veya None); örn. CandleStore. Mumları
+            1 dakikalık olmayan (medyan adım != CANDLE_STEP_MS) coinler atlanır.
+
+    Returns:
+        TradePaths
+    """
+    paths = TradePaths(len(entries), window)
+    by_symbol = {}
+    for i, (timestamp, symbol) in enumerate(entries):
+        by_symbol.setdefault(symbol, []).append(i)
+
+    steps = np.arange(window)
+    for symbol, rows in by_symbol.items():
+        candles = candle_source(symbol)
+        if candles is None or len(candles) < 2:
+            continue
+        ts = candles[:, 0]
+        step = np.median(np.diff(ts))
+        if step != CANDLE_STEP_MS:
+            # Tabloda aralık bilgisi yok; 1m dışı mumlarda (ör. add.py'nin 1h verisi) genler yanlış ölçekte çalışır
+            print(f"⚠️  {symbol}: mum aralığı {step / 60_000:g} dk (1 dk değil); bu coinin işlemleri için "
+                  f"mum yolu kullanılmıyor.")
+            continue
+        rows = np.array(rows)
+        entry = np.array([_entry_ms(entries[r][0]) for r in rows])
+        start = np.searchsorted(ts, np.nan_to_num(entry, nan=np.inf))
+        found = start < len(ts)
+        found[found] &= (ts[start[found]] - entry[found]) < MAX_ENTRY_GAP_MS
+        rows, start = rows[found], start[found]
+        if len(rows) == 0:
+            continue
+
+        # Giriş fiyatı: haberin geldiği mumun açılışı (market.py ile aynı strateji)
+        idx = start[:, None] + steps[None, :]
+        inside = idx < len(ts)
+        close = candles[np.minimum(idx, len(ts) - 1), 4]
+        move = (close / candles[start, 1][:, None] - 1) * 100
+        paths.path[rows] = np.where(inside, move, np.nan)
+        paths.length[rows] = inside.sum(axis=1)
+
+        # RSI: girişten önceki RSI_PERIOD kapanış değişiminin ortalama kazanç / kaybı
+        ok = start > RSI_PERIOD
+        if ok.any():
+            prev = candles[(start[ok] - RSI_PERIOD - 1)[:, None] + np.arange(RSI_PERIOD + 1), 4]
+            delta = np.diff(prev, axis=1)
+            gain = np.where(delta > 0, delta, 0).mean(axis=1)
+            loss = np.where(delta < 0, -delta, 0).mean(axis=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                paths.rsi[rows[ok]] = np.where(loss > 0, 100 - 100 / (1 + gain / loss), 100.0)
+
+        # Hacim oranı: son tamamlanmış mumun hacmi / ondan önceki VOLUME_LOOKBACK mumun ortalaması
+        ok = start > VOLUME_LOOKBACK
+        if ok.any():
+            last = candles[start[ok] - 1, 5]
+            mean = candles[(start[ok] - VOLUME_LOOKBACK - 1)[:, None] + np.arange(VOLUME_LOOKBACK), 5].mean(axis=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                paths.volume_ratio[rows[ok]] = np.where(mean > 0, last / mean, np.inf)
+    return paths
+
+
+def _first_reach(running_max, levels):
+    """
+    (C, T) satırları azalmayan seriler ve (P, 1) seviyeler için her (P, C) çiftinde
+    serinin seviyeye ilk ulaştığı (>=) adım; ulaşmıyorsa T.
+
+    Seviyeler sıralanır ve her değerin kaç seviyeyi geçtiği (rank) bulunur; seri
+    azalmadığı için j. seviyeye ilk ulaşma adımı, rank <= j olan adım sayısıdır.
+    Bu sayım (C, P) boyutunda bir histogramın kümülatif toplamıdır; (P, C, T)
+    boyutlu bir karşılaştırma dizisi oluşturulmaz.
+    """
+    n, window = running_max.shape
+    levels = np.asarray(levels, dtype=np.float64).ravel()
+    order = np.argsort(levels)
+    pop = len(levels)
+    rank = np.searchsorted(levels[order], np.nan_to_num(running_max, nan=-np.inf), side="right")
+    counts = np.bincount((np.arange(n)[:, None] * (pop + 1) + rank).ravel(), minlength=n * (pop + 1))
+    reach = np.cumsum(counts.reshape(n, pop + 1), axis=1)[:, :pop]
+    steps = np.empty((pop, n), dtype=np.int64)
+    steps[order] = reach.T
+    return steps
+
+
+def replay_paths_batch(trades, paths, stop_loss_pct, take_profit_pct, risk_per_trade, trailing_pct, max_hold,
+                       volume_filter, rsi_lower, rsi_upper, chunk_size=2048):
+    """
+    Tüm popülasyon için yola bağlı çıkışlarla işlemleri tekrar oynatır.
+
+    Her (kurt, işlem) çifti için ilk gerçekleşen çıkış kullanılır:
+      - Take Profit: yol >= TP  -> +TP
+      - Stop: yol <= stop seviyesi -> stop seviyesi. Stop seviyesi -SL'dir; kâr
+        zirvesi en az Trailing % olduktan sonra max(-SL, zirve - Trailing %) olur
+        (iz süren stop başabaş veya üstünde devreye girer).
+      - Süre: Max Holding Time (dakika) dolunca veya yol bitince o dakikanın kapanışı.
+    Filtreler: Long işlem RSI <= RSI Upper, Short işlem RSI >= RSI Lower ve hacim
+    oranı >= Volume Filter ise açılır (değer bilinmiyorsa filtre geçilir). Açılmayan
+    işlem kasayı değiştirmez. Yolu olmayan işlemler tek PnL'in TP/SL ile kırpılmasıyla
+    (replay_batch) değerlendirilir.
+
+    Args:
+        trades (TradeTable): Ayrıştırılmış işlemler.
+        paths (TradePaths): build_trade_paths çıktısı (trades ile aynı sırada).
+        Diğerleri: (popülasyon,) boyutlu gen dizileri.
+
+    Returns:
+        np.ndarray: (popülasyon,) Toplam Kâr.
+    """
+    if not isinstance(trades, TradeTable):
+        trades = TradeTable(trades)
+    col = lambda x: np.asarray(x, dtype=np.float64)[:, None]
+    sl, tp, risk_fraction = col(stop_loss_pct), col(take_profit_pct), col(risk_per_trade) / 100
+    trailing, vol_filter, rsi_lo, rsi_hi = col(trailing_pct), col(volume_filter), col(rsi_lower), col(rsi_upper)
+    window = paths.path.shape[1]
+    last_step = np.clip(np.floor(col(max_hold)).astype(np.int64), 1, window) - 1   # (P, 1)
+    if len(trades) == 0:
+        return np.full(len(sl), float(NO_DATA_FITNESS))
+
+    valid = np.flatnonzero(trades.valid)
+    direction = trades.direction[valid].astype(np.float64)
+    has_path = paths.length[valid] > 0
+    capital = np.full(len(sl), float(INITIAL_CAPITAL))
+
+    # Yolu olmayan işlemler: tek PnL, TP/SL kırpması (filtre yok)
+    trade_pnl = trades.trade_pnl[~has_path][None, :]
+    if trade_pnl.size:
+        clipped = np.minimum(np.maximum(trade_pnl, -sl), tp)
+        capital *= np.prod(1 + risk_fraction * (clipped / 100), axis=1)
+
+    rows = valid[has_path]
+    direction = direction[has_path]
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        n = len(chunk)
+        d = direction[start:start + chunk_size, None] * paths.path[chunk].astype(np.float64)   # (C, T)
+        peak = np.maximum(np.fmax.accumulate(d, axis=1), 0)
+
+        # Her çıkış koşulunun ilk gerçekleştiği dakika, monoton (kümülatif maksimum) serilerde arama ile:
+        # TP: d >= TP | SL: -d >= SL | İz süren stop: zirve >= Trailing ve zirve - d >= Trailing
+        tp_step = _first_reach(np.fmax.accumulate(d, axis=1), tp)
+        sl_step = _first_reach(np.fmax.accumulate(-d, axis=1), sl)
+        trail_step = _first_reach(np.fmax.accumulate(np.minimum(peak, peak - d), axis=1), trailing)
+        last = np.minimum(last_step, paths.length[chunk][None, :].astype(np.int64) - 1)             # (P, C)
+        exit_step = np.minimum(np.minimum(tp_step, sl_step), np.minimum(trail_step, last))
+
+        cols = np.arange(n)[None, :]
+        exit_move = d[cols, exit_step]
+        exit_peak = peak[cols, exit_step]
+        exit_stop = np.where(exit_peak >= trailing, np.maximum(-sl, exit_peak - trailing), -sl)
+        pnl = np.where(exit_move >= tp, tp, np.where(exit_move <= exit_stop, exit_stop, exit_move))
+
+        rsi = paths.rsi[chunk][None, :]
+        volume = paths.volume_ratio[chunk][None, :]
+        long = direction[start:start + chunk_size][None, :] > 0
+        rsi_ok = np.isnan(rsi) | np.where(long, rsi <= rsi_hi, rsi >= rsi_lo)
+        taken = rsi_ok & (np.isnan(volume) | (volume >= vol_filter))
+        capital *= np.prod(np.where(taken, 1 + risk_fraction * (pnl / 100), 1.0), axis=1)
+
+    return capital - INITIAL_CAPITAL
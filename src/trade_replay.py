@@ -0,0 +1,166 @@
+import os
+import sqlite3
+
+import numpy as np
+
+# --- İŞLEM GEÇMİŞİ ÜZERİNDE TEKRAR OYNATMA (TRADE REPLAY) ---
+# data/crypto_logs.db'deki gerçek işlemler, her parametre setinin kendi
+# Stop Loss / Take Profit / Risk değerleriyle yeniden oynatılır ve Toplam Kâr
+# hesaplanır. gwo_optimization.py ve src/gamain.py aynı değerlendiriciyi kullanır.
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DB_PATH = os.path.join(BASE_DIR, "data", "crypto_logs.db")
+INITIAL_CAPITAL = 10000
+NO_DATA_FITNESS = -1000  # İşlem verisi yoksa dönen skor
+
+
+def load_trades(db_path=DB_PATH):
+    """Veritabanındaki işlemleri (sentiment, entry_price, pnl, news_text) olarak çeker."""
+    if not os.path.exists(db_path):
+        print("❌ Veritabanı bulunamadı! Önce main.py çalıştır.")
+        return []
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("SELECT sentiment, entry_price, pnl_percent, news_text FROM trades")
+        data = cursor.fetchall()
+    except sqlite3.OperationalError:
+
+        try:
+            cursor.execute("SELECT sentiment, entry_price, pnl, news_text FROM trades")
+            data = cursor.fetchall()
+        except:
+            print("❌ Kritik Hata: Veritabanı sütun isimleri uyuşmuyor.")
+            data = []
+
+    conn.close()
+    return data
+
+
+class TradeTable:
+    """
+    İşlem satırlarının bir kez ayrıştırılmış hali.
+
+    Attributes:
+        direction (np.ndarray): POSITIVE -> +1 (Long), NEGATIVE -> -1 (Short), diğerleri 0.
+        market_pnl (np.ndarray): Piyasa PnL'i (yüzde); '%' içeren metinler sayıya çevrilmiştir.
+        valid (np.ndarray): PnL sayıya çevrilebilen ve yönü belli olan işlemler.
+        trade_pnl (np.ndarray): Geçerli işlemlerin yöne göre kazancı (direction * market_pnl).
+    """
+    def __init__(self, rows):
+        self.n_rows = len(rows)
+        self.direction = np.zeros(self.n_rows, dtype=np.int8)
+        self.market_pnl = np.full(self.n_rows, np.nan)
+        for i, (sentiment, entry, market_pnl, text) in enumerate(rows):
+            # PnL verisini sayıya çevir
+            try:
+                if isinstance(market_pnl, str):
+                    self.market_pnl[i] = float(market_pnl.replace('%', ''))
+                else:
+                    self.market_pnl[i] = float(market_pnl)
+            except:
+                continue
+            if sentiment == "POSITIVE":
+                self.direction[i] = 1       # Long Senaryosu
+            elif sentiment == "NEGATIVE":
+                self.direction[i] = -1      # Short Senaryosu
+        self.valid = (self.direction != 0) & np.isfinite(self.market_pnl)
+        self.trade_pnl = self.direction[self.valid] * self.market_pnl[self.valid]
+
+    def __len__(self):
+        return self.n_rows
+
+
+class TradeLoader:
+    """
+    İşlem verisini ilk kullanımda yükleyen ve önbelleğe alan yükleyici.
+    Modül içe aktarılırken veritabanı okunmaz; işçi süreçler veriyi sadece
+    fitness gerçekten hesaplanacaksa bir kez okur.
+    """
+    def __init__(self, db_path=DB_PATH, rows=None, verbose=True, candle_source=None, entries=None):
+        """
+        Args:
+            rows (list): Verilirse veritabanı yerine bu satırlar kullanılır (test/benchmark).
+            candle_source: symbol -> mum dizisi (src.trade_paths.CandleStore); verilirse
+                işlemlerin giriş sonrası fiyat yolları (paths) da hazırlanır.
+            entries (list): rows ile birlikte verilen (timestamp, symbol) çiftleri.
+        """
+        self.db_path = db_path
+        self.verbose = verbose
+        self.candle_source = candle_source
+        self._rows = rows
+        self._entries = entries
+        self._table = None
+        self._paths = None
+
+    @property
+    def rows(self):
+        if self._rows is None:
+            self._rows = load_trades(self.db_path)
+            if self.verbose:
+                print(f"✅ {len(self._rows)} adet geçmiş işlem verisi yüklendi.")
+        return self._rows
+
+    @property
+    def table(self):
+        if self._table is None:
+            self._table = TradeTable(self.rows)
+        return self._table
+
+    @property
+    def paths(self):
+        """İşlemlerin fiyat yolları (src.trade_paths.TradePaths); mum kaynağı yoksa None."""
+        if self._paths is None and self.candle_source is not None:
+            from src.trade_paths import build_trade_paths, load_trade_entries
+            if self._entries is None:
+                self._entries = load_trade_entries(self.db_path)
+            if len(self._entries) != len(self.rows):
+                return None
+            self._paths = build_trade_paths(self._entries, self.candle_source)
+            if self._paths.covered == 0 and len(self._paths):
+                # Mum deposu bulunamadı / boş: fitness sessizce sadece TP/SL kırpmasına düşmesin
+                source = getattr(self.candle_source, "db_path", "mum kaynağı")
+                print(f"⚠️  Hiçbir işlem için mum yolu bulunamadı ({source}); Trailing / süre / hacim / RSI "
+                      f"genleri kullanılmadan sadece TP/SL kırpması yapılacak.")
+            elif self.verbose:
+                print(f"🕯️  {self._paths.covered}/{len(self._paths)} işlem için giriş sonrası mum yolu hazırlandı.")
+        return self._paths
+
+    def __len__(self):
+        return len(self.rows)
+
+
+def replay_batch(trades, stop_loss_pct, take_profit_pct, risk_per_trade, chunk_size=4096):
+    """
+    Tüm popülasyon için işlemleri tek seferde tekrar oynatır.
+
+    Her işlemde kasa (1 + risk/100 * kırpılmış_pnl/100) ile çarpıldığından son kasa,
+    bu çarpanların işlemler boyunca kümülatif çarpımıdır. Bellek için işlemler
+    chunk_size'lık parçalar halinde işlenir.
+
+    Args:
+        trades: TradeTable veya load_trades çıktısı (liste ise bir kez ayrıştırılır).
+        stop_loss_pct, take_profit_pct, risk_per_trade: (popülasyon,) boyutlu diziler (yüzde).
+
+    Returns:
+        np.ndarray: (popülasyon,) Toplam Kâr (son kasa - başlangıç kasası).
+    """
+    if not isinstance(trades, TradeTable):
+        trades = TradeTable(trades)
+    stop_loss_pct = np.asarray(stop_loss_pct, dtype=np.float64)[:, None]
+    take_profit_pct = np.asarray(take_profit_pct, dtype=np.float64)[:, None]
+    risk_fraction = np.asarray(risk_per_trade, dtype=np.float64)[:, None] / 100
+    if len(trades) == 0:
+        return np.full(len(stop_loss_pct), float(NO_DATA_FITNESS))
+
+    current_capital = np.full(len(stop_loss_pct), float(INITIAL_CAPITAL))
+    for start in range(0, len(trades.trade_pnl), chunk_size):
+        trade_pnl = trades.trade_pnl[None, start:start + chunk_size]
+        # Take Profit / Stop Loss kırpması (her parametre setinin kendi seviyeleriyle)
+        actual_trade_pnl = np.minimum(np.maximum(trade_pnl, -stop_loss_pct), take_profit_pct)
+        # Kasa Hesaplama: capital += capital * risk * pnl
+        current_capital *= np.prod(1 + risk_fraction * (actual_trade_pnl / 100), axis=1)
+
+    return current_capital - INITIAL_CAPITAL
@@ -0,0 +1,107 @@
+from datetime import datetime
+
+import numpy as np
+
+from src.parallel import system_pool, worker_system
+
+
+def make_folds(data_store, n_folds, train_ratio, timestamp_col=0):
+    """
+    Kayan (rolling) eğitim/test pencereleri oluşturur.
+
+    Tüm coinlerin ortak zaman aralığı, eğitim penceresi test penceresinin
+    train_ratio katı olacak şekilde bölünür; her katlamada pencereler bir test
+    uzunluğu kadar ileri kayar. Sınırlar zaman damgasıdır, her coin için mum
+    indekslerine ayrı ayrı çevrilir (coinlerin mum sayıları farklı olabilir).
+
+    Returns:
+        list: Her katlama için {"train": {symbol: (lo, hi)}, "test": {...}, "train_start": ts, ...}
+    """
+    timestamps = {symbol: np.asarray(candles[:, timestamp_col]) for symbol, candles in data_store.items()
+                  if len(candles)}
+    if not timestamps:
+        return []
+    t0 = min(ts[0] for ts in timestamps.values())
+    t1 = max(ts[-1] for ts in timestamps.values())
+    test_len = (t1 - t0) / (train_ratio + n_folds)
+    train_len = train_ratio * test_len
+
+    def to_windows(start, end, last):
+        windows = {}
+        for symbol in data_store:
+            ts = timestamps.get(symbol)
+            if ts is None:
+                windows[symbol] = (0, 0)
+                continue
+            lo = int(np.searchsorted(ts, start, side="left"))
+            hi = len(ts) if last else int(np.searchsorted(ts, end, side="left"))
+            windows[symbol] = (lo, hi)
+        return windows
+
+    folds = []
+    for k in range(n_folds):
+        train_start = t0 + k * test_len
+        train_end = train_start + train_len
+        test_end = train_end + test_len
+        folds.append({
+            "train": to_windows(train_start, train_end, False),
+            "test": to_windows(train_end, test_end, k == n_folds - 1),
+            "train_start": train_start,
+            "test_start": train_end,
+            "test_end": test_end,
+        })
+    return folds
+
+
+def _run_fold(optimizer_factory, fold, dim, pop_size, max_iter, seed):
+    """Tek katlama: eğitim penceresinde optimizasyon, en iyi çözümü test penceresinde puanla."""
+    system = worker_system()
+    train = system.with_windows(fold["train"])
+    test = system.with_windows(fold["test"])
+
+    optimizer = optimizer_factory(dim=dim, pop_size=pop_size, max_iter=max_iter, seed=seed)
+    best_pos, train_score, curve = optimizer.optimize(train.evaluate_fitness_batch)
+    test_coin_scores = test.coin_scores_batch(best_pos[None, :])[0]
+    return {
+        "best_params": best_pos.tolist(),
+        "train_score": float(train_score),
+        "test_score": float(test.evaluate_fitness_batch(best_pos[None, :])[0]),
+        "test_coin_scores": test_coin_scores.tolist(),
+        "convergence_curve": [float(x) for x in curve],
+        "stopping": optimizer.summary(),
+    }
+
+
+def run_walk_forward(system, optimizer_factory, folds, dim, pop_size, max_iter, seeds, workers, system_kwargs=None):
+    """
+    Katlamaları paralel çalıştırır (katlamalar birbirinden bağımsızdır).
+    Her işçi mumları ve indikatörleri tüm geçmiş üzerinden paylaşır; pencereler
+    sadece işlem yapılan mum aralığını sınırlar. Katlama yoksa havuz kurulmaz.
+
+    Returns:
+        dict: {"folds": [...], "aggregate": {...}}
+    """
+    if not folds:
+        return {"folds": [], "aggregate": {"total_test_score": 0.0, "mean_test_score": 0.0, "mean_train_score": 0.0,
+                                           "positive_test_folds": 0, "folds": 0}}
+    workers = max(1, min(workers, len(folds)))
+    with system_pool(system, workers, system_kwargs) as pool:
+        futures = [pool.submit(_run_fold, optimizer_factory, fold, dim, pop_size, max_iter, seed)
+                   for fold, seed in zip(folds, seeds)]
+        results = [future.result() for future in futures]
+
+    fmt = lambda ts: datetime.fromtimestamp(ts / 1000).strftime('%Y-%m-%d %H:%M')
+    for k, (fold, result) in enumerate(zip(folds, results)):
+        result.update(fold=k + 1, train_from=fmt(fold["train_start"]),
+                      test_from=fmt(fold["test_start"]), test_to=fmt(fold["test_end"]))
+
+    test_scores = np.array([r["test_score"] for r in results])
+    train_scores = np.array([r["train_score"] for r in results])
+    aggregate = {
+        "total_test_score": float(test_scores.sum()),
+        "mean_test_score": float(test_scores.mean()),
+        "mean_train_score": float(train_scores.mean()),
+        "positive_test_folds": int((test_scores > 0).sum()),
+        "folds": len(results),
+    }
+    return {"folds": results, "aggregate": aggregate}
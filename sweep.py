@@ -0,0 +1,97 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from src.optim import RULES
+from src.sweep import SweepStore, grid, random_configs, run_config, run_sweep, summarize
+
+# --- AYAR TARAMASI ---
+# WOLVES_COUNT / ITERATIONS / SEARCH_AGENTS_NO / MAX_ITER gibi elle seçilmiş sabitler
+# yerine: hangi (optimizer, kurt sayısı, iterasyon) ayarı hedef kâra en ucuza ulaşıyor?
+# Örnek: python sweep.py --objective trades --pop 10 30 60 --iterations 100 500 1000 --seeds 5 --target 50
+
+DB_PATH = os.path.join("data", "sweeps.db")
+
+
+def trades_cell(config, seed):
+    """gwo_optimization.py amacı: işlem geçmişinin 10 parametreyle tekrar oynatılması."""
+    import gwo_optimization
+    return run_config(gwo_optimization.fitness_function_batch, config, seed, gwo_optimization.DIM,
+                      gwo_optimization.LB, gwo_optimization.UB)
+
+
+def trading_cell(config, seed):
+    """main.py amacı: 5 coin x 10 parametrelik backtest (işçinin paylaşılan TradingSystem'i)."""
+    from main import DIMENSIONS
+    from src.parallel import worker_system
+    return run_config(worker_system().evaluate_fitness_batch, config, seed, DIMENSIONS)
+
+
+def print_summary(rows, target):
+    header = f"{'Optimizer':<9} {'Kurt':>5} {'İter':>6} {'Stag.':>6} {'Tohum':>6} {'Ort. Skor':>12} {'En İyi':>12}"
+    if target is not None:
+        header += f" {'Hedef':>7} {'Maliyet':>9}"
+    print(header + f" {'Süre (sn)':>10}")
+    print("-" * len(header + " " * 11))
+    for row in rows:
+        config = row["config"]
+        stagnation = config.get("stagnation")
+        line = (f"{config.get('optimizer', 'gwo'):<9} {config['pop_size']:>5} {config['max_iter']:>6} "
+                f"{stagnation if stagnation is not None else '-':>6} {row['runs']:>6} "
+                f"{row['mean_best']:>12.2f} {row['max_best']:>12.2f}")
+        if target is not None:
+            cost = row["median_cost"]
+            line += f" {row['hits']:>3}/{row['runs']:<3} {f'{cost:.0f}' if cost is not None else '-':>9}"
+        print(line + f" {row['mean_runtime']:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Optimizer ayarları için paralel ızgara / rastgele tarama")
+    parser.add_argument("--objective", choices=["trades", "trading"], default="trades",
+                        help="trades: gwo_optimization.py işlem geçmişi | trading: main.py 50 boyutlu backtest")
+    parser.add_argument("--sweep", default=None, help="Tarama adı (varsayılan: amaç adı); devam etmek için aynı ad")
+    parser.add_argument("--db", default=DB_PATH, help="Sonuç veritabanı")
+    parser.add_argument("--optimizers", nargs="+", default=["gwo3"], choices=list(RULES))
+    parser.add_argument("--pop", type=int, nargs="+", default=[10, 30, 60], help="Kurt sayıları")
+    parser.add_argument("--iterations", type=int, nargs="+", default=[100, 500, 1000], help="İterasyon sayıları")
+    parser.add_argument("--stagnation", type=int, nargs="+", default=None,
+                        help="Erken durma değerleri (verilmezse erken durma yok)")
+    parser.add_argument("--random", type=int, default=None,
+                        help="Izgara yerine bu kadar rastgele ayar (kurt/iterasyon verilen en küçük-en büyük aralıktan)")
+    parser.add_argument("--seeds", type=int, default=3, help="Ayar başına tohum sayısı")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Aynı anda çalışan süreç sayısı")
+    parser.add_argument("--target", type=float, default=None, help="Hedef kâr: en ucuza ulaşan ayarlar üstte")
+    parser.add_argument("--report", action="store_true", help="Çalıştırmadan sadece kayıtlı sonuçları özetle")
+    args = parser.parse_args()
+
+    sweep = args.sweep or args.objective
+    space = {"optimizer": args.optimizers, "pop_size": args.pop, "max_iter": args.iterations,
+             "stagnation": args.stagnation or [None]}
+    if args.random is not None:
+        space["pop_size"] = (min(args.pop), max(args.pop))
+        space["max_iter"] = (min(args.iterations), max(args.iterations))
+        configs = random_configs(space, args.random, seed=0)
+    else:
+        configs = grid(space)
+    seeds = list(range(args.seeds))
+    store = SweepStore(args.db)
+
+    if not args.report:
+        def report(config, seed, result, remaining):
+            print(f"[{remaining} kaldı] {config} tohum={seed}: ${result['best_score']:.2f} "
+                  f"({result['runtime']:.1f} sn, {result['stop_reason']})")
+
+        print(f"🔎 Tarama '{sweep}': {len(configs)} ayar x {len(seeds)} tohum, {args.workers} süreç")
+        if args.objective == "trading":
+            from main import INDICATOR_CACHE_DIR, CANDLE_CACHE_DIR, TradingSystem
+            from src.parallel import system_pool
+            system = TradingSystem(indicator_cache_dir=INDICATOR_CACHE_DIR, candle_cache_dir=CANDLE_CACHE_DIR)
+            with system_pool(system, args.workers, {"indicator_cache_dir": INDICATOR_CACHE_DIR}) as pool:
+                ran, skipped = run_sweep(pool, trading_cell, configs, seeds, store, sweep, args.workers, report)
+        else:
+            with ProcessPoolExecutor(max_workers=args.workers) as pool:
+                ran, skipped = run_sweep(pool, trades_cell, configs, seeds, store, sweep, args.workers, report)
+        print(f"✅ {ran} hücre çalıştırıldı, {skipped} hücre önceden tamamlanmıştı.\n")
+
+    print_summary(summarize(store.runs(sweep), args.target), args.target)
+    store.close()